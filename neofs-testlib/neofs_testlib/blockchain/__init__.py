@@ -1,2 +1,3 @@
+from neofs_testlib.blockchain.block_watcher import BlockWatcher, get_block_watcher, stop_block_watchers
 from neofs_testlib.blockchain.multisig import Multisig
-from neofs_testlib.blockchain.rpc_client import RPCClient
+from neofs_testlib.blockchain.rpc_client import AsyncRPCClient, NeoRPCException, RPCBatch, RPCClient
@@ -0,0 +1,300 @@
+import logging
+import threading
+from concurrent.futures import Future, InvalidStateError
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Optional
+
+from neofs_testlib.blockchain.rpc_client import NeoRPCException, RPCClient
+
+logger = logging.getLogger("neofs.testlib.blockchain")
+
+# Interval between getblockcount requests, it is well below block time of test chains
+BLOCK_POLL_INTERVAL = 0.1
+# Max number of blocks requested in a single batch when watcher catches up with the chain
+BLOCK_BATCH_SIZE = 64
+# Polling is backed off exponentially after failures, the watcher stops after this many failures in a row
+BLOCK_POLL_MAX_INTERVAL = 2
+BLOCK_POLL_MAX_FAILURES = 10
+
+
+@dataclass
+class _NotificationWaiter:
+    contract: str
+    event_name: Optional[str]
+    predicate: Optional[Callable[[dict], bool]]
+    future: Future = field(default_factory=Future)
+
+    def matches(self, notification: dict) -> bool:
+        if _normalize_hash(notification.get("contract", "")) != self.contract:
+            return False
+        if self.event_name is not None and notification.get("eventname") != self.event_name:
+            return False
+        return self.predicate is None or self.predicate(notification)
+
+
+class BlockWatcher:
+    """Follows new blocks of a neo-go node and resolves futures of awaited chain events.
+
+    All waiters share a single background thread that polls `getblockcount`. New blocks and
+    application logs of their transactions are requested in JSON-RPC batches, and only when
+    there are waiters for transactions or notifications. If the node stays unreachable for
+    BLOCK_POLL_MAX_FAILURES polls in a row, the watcher stops and pending futures fail.
+
+    Example:
+        watcher = get_block_watcher(f"http://{neofs_env.main_chain.rpc_address}")
+        application_log = watcher.await_transaction(tx_hash).result(timeout=30)
+    """
+
+    def __init__(self, endpoint: str, poll_interval: float = BLOCK_POLL_INTERVAL, timeout: int = 10):
+        self.endpoint = endpoint
+        self.poll_interval = poll_interval
+        self.rpc_client = RPCClient(endpoint, timeout)
+        self.height: Optional[int] = None
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._next_block: Optional[int] = None
+        self._height_waiters: list[tuple[int, Future]] = []
+        self._tx_waiters: dict[str, list[tuple[Optional[int], Future]]] = {}
+        self._notification_waiters: list[_NotificationWaiter] = []
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._next_block = self.rpc_client.get_block_count()
+            self.height = self._next_block - 1
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name=f"block-watcher-{self.endpoint}", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stops watching the chain and cancels all pending futures."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stop_event.set()
+            futures = self._pop_futures()
+        if thread is not None:
+            thread.join()
+        for future in futures:
+            future.cancel()
+
+    def __enter__(self) -> "BlockWatcher":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def await_height(self, height: int) -> Future:
+        """Returns future that resolves to the chain height once block with the given index is accepted."""
+        self.start()
+        future = Future()
+        with self._lock:
+            if self.height >= height:
+                future.set_result(self.height)
+            else:
+                self._height_waiters.append((height, future))
+        return future
+
+    def await_transaction(self, tx_hash: str, valid_until_block: Optional[int] = None) -> Future:
+        """Returns future that resolves to the application log of the transaction once it is accepted.
+
+        Args:
+            tx_hash: Hash of the transaction.
+            valid_until_block: If set, future fails when the chain goes past this block without the transaction.
+
+        Returns:
+            Future with the application log, the log is returned regardless of VM state of the transaction.
+        """
+        self.start()
+        tx_hash = _normalize_hash(tx_hash)
+        future = Future()
+        with self._lock:
+            self._tx_waiters.setdefault(tx_hash, []).append((valid_until_block, future))
+
+        # transaction might be accepted before the waiter was registered
+        application_log = self.rpc_client.get_application_log(tx_hash)
+        if "executions" in application_log:
+            self._resolve_transaction(tx_hash, application_log)
+        return future
+
+    def await_notification(
+        self,
+        contract_hash: str,
+        event_name: Optional[str] = None,
+        predicate: Optional[Callable[[dict], bool]] = None,
+    ) -> Future:
+        """Returns future that resolves to the first matching notification emitted after this call.
+
+        Args:
+            contract_hash: Script hash of the contract that emits the notification.
+            event_name: Name of the event, any event of the contract matches if omitted.
+            predicate: Additional check of the notification (with `contract`, `eventname` and `state` fields).
+
+        Returns:
+            Future with the notification, it is extended with `txid` of the transaction that emitted it.
+        """
+        self.start()
+        waiter = _NotificationWaiter(_normalize_hash(contract_hash), event_name, predicate)
+        with self._lock:
+            self._notification_waiters.append(waiter)
+        return waiter.future
+
+    def _run(self) -> None:
+        failures, interval = 0, self.poll_interval
+        while not self._stop_event.wait(interval):
+            try:
+                self._poll()
+            except Exception as exc:
+                failures += 1
+                if failures >= BLOCK_POLL_MAX_FAILURES:
+                    logger.warning(f"Stopped watching {self.endpoint} after {failures} failed polls: {exc}")
+                    self._abort(NeoRPCException(f"Could not poll new blocks from {self.endpoint}: {exc}"))
+                    return
+                logger.warning(f"Failed to poll new blocks from {self.endpoint} ({failures} in a row): {exc}")
+                interval = min(self.poll_interval * 2**failures, BLOCK_POLL_MAX_INTERVAL)
+            else:
+                failures, interval = 0, self.poll_interval
+
+    def _abort(self, exc: Exception) -> None:
+        with self._lock:
+            # watcher might be stopped concurrently
+            if self._thread is not threading.current_thread():
+                return
+            self._thread = None
+            futures = self._pop_futures()
+        for future in futures:
+            _set_exception(future, exc)
+
+    def _pop_futures(self) -> list[Future]:
+        futures = [future for _, future in self._height_waiters]
+        futures += [future for waiters in self._tx_waiters.values() for _, future in waiters]
+        futures += [waiter.future for waiter in self._notification_waiters]
+        self._height_waiters, self._tx_waiters, self._notification_waiters = [], {}, []
+        return futures
+
+    def _poll(self) -> None:
+        block_count = self.rpc_client.get_block_count()
+        while self._next_block < block_count and not self._stop_event.is_set():
+            last_block = min(block_count, self._next_block + BLOCK_BATCH_SIZE)
+            with self._lock:
+                watch_transactions = bool(self._tx_waiters or self._notification_waiters)
+            if watch_transactions:
+                self._process_blocks(range(self._next_block, last_block))
+            self._next_block = last_block
+            self._resolve_height(last_block - 1)
+
+    def _process_blocks(self, indexes: range) -> None:
+        batch = self.rpc_client.batch()
+        for index in indexes:
+            batch.get_block(index)
+        blocks = batch.execute()
+
+        with self._lock:
+            watch_notifications = bool(self._notification_waiters)
+            awaited_tx = set(self._tx_waiters)
+        for block in blocks:
+            if "tx" not in block:
+                raise NeoRPCException(f"Could not get block from {self.endpoint}: {block}")
+            tx_hashes = [_normalize_hash(tx["hash"]) for tx in block["tx"]]
+            if not watch_notifications:
+                tx_hashes = [tx_hash for tx_hash in tx_hashes if tx_hash in awaited_tx]
+
+            batch = self.rpc_client.batch()
+            for tx_hash in tx_hashes:
+                batch.get_application_log(tx_hash)
+            for tx_hash, application_log in zip(tx_hashes, batch.execute()):
+                self._resolve_transaction(tx_hash, application_log)
+                self._resolve_notifications(tx_hash, application_log)
+            self._expire_transactions(block["index"])
+
+    def _resolve_height(self, height: int) -> None:
+        with self._lock:
+            self.height = height
+            reached = [future for awaited, future in self._height_waiters if awaited <= height]
+            self._height_waiters = [(awaited, future) for awaited, future in self._height_waiters if awaited > height]
+        for future in reached:
+            _set_result(future, height)
+
+    def _resolve_transaction(self, tx_hash: str, application_log: dict) -> None:
+        with self._lock:
+            waiters = self._tx_waiters.pop(tx_hash, [])
+        for _, future in waiters:
+            _set_result(future, application_log)
+
+    def _resolve_notifications(self, tx_hash: str, application_log: dict) -> None:
+        notifications = [
+            notification
+            for execution in application_log.get("executions", [])
+            for notification in execution.get("notifications", [])
+        ]
+        if not notifications:
+            return
+        with self._lock:
+            waiters = list(self._notification_waiters)
+        for waiter in waiters:
+            try:
+                notification = next((n for n in notifications if waiter.matches(n)), None)
+            except Exception as exc:
+                _set_exception(waiter.future, exc)
+                continue
+            if notification is not None:
+                _set_result(waiter.future, dict(notification, txid=tx_hash))
+        with self._lock:
+            self._notification_waiters = [waiter for waiter in self._notification_waiters if not waiter.future.done()]
+
+    def _expire_transactions(self, block_index: int) -> None:
+        expired = []
+        with self._lock:
+            for tx_hash, waiters in list(self._tx_waiters.items()):
+                alive = [(vub, future) for vub, future in waiters if vub is None or vub >= block_index]
+                expired += [(tx_hash, future) for vub, future in waiters if vub is not None and vub < block_index]
+                if alive:
+                    self._tx_waiters[tx_hash] = alive
+                else:
+                    del self._tx_waiters[tx_hash]
+        for tx_hash, future in expired:
+            _set_exception(future, NeoRPCException(f"Transaction {tx_hash} expired at block {block_index}"))
+
+
+_watchers: dict[str, BlockWatcher] = {}
+_watchers_lock = threading.Lock()
+
+
+def get_block_watcher(endpoint: str) -> BlockWatcher:
+    """Returns block watcher of the endpoint shared by all callers."""
+    with _watchers_lock:
+        if endpoint not in _watchers:
+            _watchers[endpoint] = BlockWatcher(endpoint)
+        return _watchers[endpoint]
+
+
+def stop_block_watchers(endpoints: Optional[Iterable[str]] = None) -> None:
+    """Stops shared block watchers of the endpoints and forgets them, all watchers are stopped by default."""
+    with _watchers_lock:
+        endpoints = tuple(_watchers) if endpoints is None else endpoints
+        watchers = [_watchers.pop(endpoint) for endpoint in endpoints if endpoint in _watchers]
+    for watcher in watchers:
+        watcher.stop()
+
+
+def _normalize_hash(value: str) -> str:
+    value = value.lower()
+    return value if value.startswith("0x") else f"0x{value}"
+
+
+def _set_result(future: Future, value: Any) -> None:
+    # future might be already resolved by another block or cancelled by the waiter
+    try:
+        future.set_result(value)
+    except InvalidStateError:
+        pass
+
+
+def _set_exception(future: Future, exc: Exception) -> None:
+    try:
+        future.set_exception(exc)
+    except InvalidStateError:
+        pass
@@ -1,11 +1,39 @@
+import asyncio
 import json
 import logging
+import threading
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    # aiohttp comes with neo-mamba, AsyncRPCClient is unavailable without it
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 logger = logging.getLogger("neofs.testlib.blockchain")
 
+# Max number of keep-alive connections kept per RPC endpoint
+CONNECTION_POOL_SIZE = 32
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def _get_session(endpoint: str) -> requests.Session:
+    """Returns HTTP session with a pool of keep-alive connections shared by all clients of the endpoint."""
+    with _sessions_lock:
+        session = _sessions.get(endpoint)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=CONNECTION_POOL_SIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[endpoint] = session
+        return session
+
 
 class NeoRPCException(Exception):
     pass
@@ -34,6 +62,15 @@ class RPCClient:
     ) -> Dict[str, Any]:
         return self._call_endpoint("invokefunction", params=[sc_hash, function, params or [], signers or []])
 
+    def get_block_count(self) -> int:
+        return self._call_endpoint("getblockcount")
+
+    def get_block(self, block_id, verbose: bool = True):
+        """
+        `block_id` might be block index or hash
+        """
+        return self._call_endpoint("getblock", params=[block_id, int(verbose)])
+
     def get_transaction_height(self, txid: str):
         return self._call_endpoint("gettransactionheight", params=[txid])
 
@@ -55,22 +92,145 @@ class RPCClient:
         """
         return self._call_endpoint("getcontractstate", params=[contract_id])
 
+    def batch(self) -> "RPCBatch":
+        """Returns batch that records calls of the client methods and sends them in a single request.
+
+        Example:
+            batch = client.batch()
+            for key in keys:
+                batch.get_storage(contract_hash, key)
+            values = batch.execute()
+        """
+        return RPCBatch(self)
+
+    def call_batch(self, calls: list[tuple[str, Optional[list]]]) -> list[Any]:
+        """Sends several calls as one JSON-RPC batch request.
+
+        Args:
+            calls: Pairs of method name and its parameters.
+
+        Returns:
+            Results of calls in the same order, a result is the whole response of the call
+            if it has no `result` field (e.g. it is an error).
+        """
+        if not calls:
+            return []
+        payload = json.dumps(
+            [_build_request(method, params, request_id) for request_id, (method, params) in enumerate(calls)]
+        )
+        responses = self._post(payload, ", ".join(method for method, _ in calls))
+        if not isinstance(responses, list):
+            # the whole batch is rejected
+            raise NeoRPCException(f"Batch request to {self.endpoint} failed: {responses}\nRequest sent: {payload}")
+
+        by_id = {response.get("id"): response for response in responses}
+        results = []
+        for request_id, (method, _) in enumerate(calls):
+            response = by_id.get(request_id)
+            if response is None:
+                raise NeoRPCException(f"No response to method {method} in batch request to {self.endpoint}")
+            results.append(response["result"] if "result" in response else response)
+        return results
+
     def _call_endpoint(self, method, params=None) -> Dict[str, Any]:
-        payload = _build_payload(method, params)
+        response = self._post(_build_payload(method, params), method)
+        if "result" in response:
+            return response["result"]
+        return response
+
+    def _post(self, payload: str, methods: str) -> Any:
         logger.info(payload)
         try:
-            response = requests.post(self.endpoint, data=payload, timeout=self.timeout)
+            response = _get_session(self.endpoint).post(
+                self.endpoint, data=payload, headers={"Content-Type": "application/json"}, timeout=self.timeout
+            )
             response.raise_for_status()
-            if response.status_code == 200:
-                if "result" in response.json():
-                    return response.json()["result"]
             return response.json()
+        except Exception as exc:
+            raise NeoRPCException(
+                f"Could not call method {methods} with endpoint: {self.endpoint}: {exc}\nRequest sent: {payload}"
+            ) from exc
+
+
+class RPCBatch(RPCClient):
+    """Records calls of RPCClient methods to send them as a single JSON-RPC batch request.
+
+    Methods of the batch return index of the call, results are returned by `execute`.
+    """
+
+    def __init__(self, client: RPCClient):
+        super().__init__(client.endpoint, client.timeout)
+        self._client = client
+        self._calls: list[tuple[str, Optional[list]]] = []
+
+    def execute(self) -> list[Any]:
+        calls, self._calls = self._calls, []
+        return self._client.call_batch(calls)
+
+    def _call_endpoint(self, method, params=None) -> int:
+        self._calls.append((method, params))
+        return len(self._calls) - 1
+
+
+class AsyncRPCClient:
+    """Asyncio JSON-RPC client for high-fanout queries, connections are reused within the client.
+
+    Example:
+        async with AsyncRPCClient(endpoint) as client:
+            results = await asyncio.gather(*(client.call("getstorage", [sc_hash, key]) for key in keys))
+    """
+
+    def __init__(self, endpoint: str, timeout: int = 10, max_connections: int = CONNECTION_POOL_SIZE):
+        if aiohttp is None:
+            raise RuntimeError("AsyncRPCClient requires aiohttp package")
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    async def __aenter__(self) -> "AsyncRPCClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def call(self, method: str, params: Optional[list] = None) -> Any:
+        response = await self._post(_build_payload(method, params), method)
+        if "result" in response:
+            return response["result"]
+        return response
+
+    async def call_many(self, calls: list[tuple[str, Optional[list]]]) -> list[Any]:
+        """Sends calls concurrently (each in its own request) and returns their results in the same order."""
+        return await asyncio.gather(*(self.call(method, params) for method, params in calls))
+
+    async def _post(self, payload: str, method: str) -> Any:
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        logger.info(payload)
+        try:
+            async with self._session.post(
+                self.endpoint, data=payload, headers={"Content-Type": "application/json"}
+            ) as response:
+                response.raise_for_status()
+                return await response.json(content_type=None)
         except Exception as exc:
             raise NeoRPCException(
                 f"Could not call method {method} with endpoint: {self.endpoint}: {exc}\nRequest sent: {payload}"
             ) from exc
 
 
+def _build_request(method, params: Optional[list] = None, request_id: int = 1) -> dict:
+    return {"jsonrpc": "2.0", "method": method, "params": params or [], "id": request_id}
+
+
 def _build_payload(method, params: Optional[list] = None):
-    payload = json.dumps({"jsonrpc": "2.0", "method": method, "params": params or [], "id": 1})
-    return payload.replace("'", '"')
+    return json.dumps(_build_request(method, params))
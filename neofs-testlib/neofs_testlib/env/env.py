@@ -1,5 +1,6 @@
 import datetime
 import fcntl
+import hashlib
 import json
 import logging
 import os
@@ -18,6 +19,7 @@ import threading
 import time
 import uuid
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from importlib.resources import files
@@ -31,27 +33,43 @@ import psutil
 import requests
 import yaml
 from helpers.common import (
+    ALLOCATED_PORTS_BLOCK_SIZE,
     ALLOCATED_PORTS_FILE,
     ALLOCATED_PORTS_LOCK_FILE,
+    ALLOCATED_PORTS_RANGE,
     BINARY_DOWNLOADS_LOCK_FILE,
     COMPLEX_OBJECT_CHUNKS_COUNT,
     COMPLEX_OBJECT_TAIL_SIZE,
     DEFAULT_OBJECT_OPERATION_TIMEOUT,
     DEFAULT_REST_OPERATION_TIMEOUT,
+    IR_READY_TIMEOUT,
     SIMPLE_OBJECT_SIZE,
+    SN_READINESS_POLL_INTERVAL,
+    SN_READY_LOG_MARKERS,
+    SN_READY_TIMEOUT,
+    SN_SHUTDOWN_LOG_MARKERS,
     STORAGE_GC_TIME,
     get_assets_dir_path,
 )
 from helpers.neofs_verbs import get_netmap_netinfo
-from tenacity import retry, stop_after_attempt, wait_fixed
+from neo3.wallet import account as neo3_account
+from tenacity import retry, stop_after_attempt, stop_after_delay, wait_fixed
 
+from neofs_testlib.blockchain import stop_block_watchers
 from neofs_testlib.cli import NeofsAdm, NeofsCli, NeofsLens, NeoGo
-from neofs_testlib.shell import LocalShell
+from neofs_testlib.env.ports import PortAllocator, new_ports_owner
+from neofs_testlib.shell import DirectShell
 from neofs_testlib.utils import wallet as wallet_utils
+from neofs_testlib.utils.keyring import keyring
 from neofs_testlib.utils.log_uploader import NeofsConfig, NeofsUploader, build_logs_neofs_path
 
 logger = logging.getLogger("neofs.testlib.env")
-_thread_lock = threading.Lock()
+_port_allocator = PortAllocator(
+    ALLOCATED_PORTS_FILE,
+    ALLOCATED_PORTS_LOCK_FILE,
+    block_size=ALLOCATED_PORTS_BLOCK_SIZE,
+    port_range=ALLOCATED_PORTS_RANGE,
+)
 
 
 @dataclass
@@ -62,6 +80,19 @@ class NodeWallet:
     cli_config: str = None
     neo_go_config: str = None
 
+    @property
+    def accounts(self) -> list[neo3_account.Account]:
+        """Decrypted accounts of the wallet, cached by the process-wide keyring."""
+        return keyring.get_accounts(self.path, self.password)
+
+    @property
+    def private_key(self) -> bytes:
+        return self.accounts[0].private_key
+
+    @property
+    def public_key(self) -> str:
+        return str(self.accounts[0].public_key)
+
 
 class WalletType(Enum):
     STORAGE = 1
@@ -73,9 +104,12 @@ class ObjectType(Enum):
     COMPLEX = "complex_object_size"
 
 
-def terminate_process(process: Popen):
+def terminate_process(process: Popen | psutil.Process):
     with allure.step(f"Check if process is already terminated: {process.pid}"):
-        if process.poll() is not None:
+        if isinstance(process, psutil.Process):
+            if not process.is_running() or process.status() == psutil.STATUS_ZOMBIE:
+                return True
+        elif process.poll() is not None:
             return True
 
     with allure.step(f"Terminate process: {process.pid}"):
@@ -83,7 +117,7 @@ def terminate_process(process: Popen):
     try:
         process.wait(timeout=60)
         return True
-    except TimeoutExpired as e:
+    except (TimeoutExpired, psutil.TimeoutExpired) as e:
         with allure.step(f"Didn't manage to terminate process gracefully: {e}, going to kill it."):
             process.kill()
             process.wait(timeout=60)
@@ -93,14 +127,50 @@ def terminate_process(process: Popen):
         return False
 
 
+def is_endpoint_listening(endpoint: str, timeout: float = 0.2) -> bool:
+    host, port = endpoint.rsplit(":", 1)
+    try:
+        with socket.create_connection((host, int(port)), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+class LogWatcher:
+    """Tails log files of a process and reports markers written since the previous check."""
+
+    def __init__(self, *log_paths: str):
+        self.log_paths = [str(path) for path in log_paths]
+        self._offsets = {path: 0 for path in self.log_paths}
+        self._tails = {path: "" for path in self.log_paths}
+
+    def seen(self, markers: tuple[str, ...]) -> bool:
+        found = False
+        for path in self.log_paths:
+            try:
+                with open(path, "r", errors="replace") as log_file:
+                    log_file.seek(self._offsets[path])
+                    chunk = log_file.read()
+                    self._offsets[path] = log_file.tell()
+            except OSError:
+                continue
+            # keep the last incomplete line, so a marker split between two reads is still found
+            text = self._tails[path] + chunk
+            complete, _, self._tails[path] = text.rpartition("\n")
+            if any(marker in complete for marker in markers):
+                found = True
+        return found
+
+
 class NeoFSEnv:
     def __init__(self, neofs_env_config: dict = None):
         self._id = datetime.datetime.now(datetime.UTC).strftime("%Y-%m-%d-%H-%M-%S")
         self._env_dir = f"{get_assets_dir_path()}/env_files/neofs-env-{self._id}-{threading.current_thread().ident}"
+        self.ports_owner = new_ports_owner()
 
         self.domain = "localhost"
         self.default_password = "password"
-        self.shell = LocalShell()
+        self.shell = DirectShell()
         # utilities
         self.neofs_env_config = neofs_env_config
         self.neofs_adm_path = os.getenv("NEOFS_ADM_BIN", "./neofs-adm")
@@ -176,7 +246,13 @@ class NeoFSEnv:
 
     @allure.step("Deploy inner ring nodes")
     def deploy_inner_ring_nodes(
-        self, count=1, with_main_chain=False, chain_meta_data=True, sn_validator_url=None, allow_ec=True
+        self,
+        count=1,
+        with_main_chain=False,
+        chain_meta_data=True,
+        sn_validator_url=None,
+        allow_ec=True,
+        ready_timeout=IR_READY_TIMEOUT,
     ):
         for _ in range(count):
             new_inner_ring_node = InnerRing(
@@ -202,16 +278,13 @@ class NeoFSEnv:
             self.main_chain.start()
             self.deploy_neofs_contract()
 
-        for ir_node in self.inner_ring_nodes:
-            ir_node.start(wait_until_ready=False, with_main_chain=with_main_chain)
-
-        with allure.step("Wait until all IR nodes are READY"):
+        with allure.step("Start IR nodes and wait until all of them are READY"):
             try:
-                for ir_node_idx, ir_node in enumerate(self.inner_ring_nodes):
-                    with allure.step(f"Wait until IR: {ir_node} is READY"):
-                        ir_node._wait_until_ready()
+                self._start_inner_ring_nodes(with_main_chain=with_main_chain, ready_timeout=ready_timeout)
             except Exception as e:
                 for ir_node_idx, ir_node in enumerate(self.inner_ring_nodes):
+                    if not os.path.isfile(ir_node.stderr) or not os.path.isfile(ir_node.stdout):
+                        continue
                     temp_logs_dir = self._generate_temp_dir(prefix=f"ir{ir_node_idx}_logs")
                     shutil.copy(ir_node.stderr, os.path.join(temp_logs_dir, f"ir{ir_node_idx}_stderr.log"))
                     shutil.copy(ir_node.stdout, os.path.join(temp_logs_dir, f"ir{ir_node_idx}_stdout.log"))
@@ -221,6 +294,41 @@ class NeoFSEnv:
                     self._attach_logs_archive(zip_path, name=f"ir{ir_node_idx} node logs")
                 raise e
 
+    def _start_inner_ring_nodes(self, with_main_chain: bool, ready_timeout: float):
+        """Launches all configured IR nodes concurrently and waits until every one of them is READY.
+
+        Config generation, process launch and readiness polling of each node run in a separate worker,
+        all workers share a single deadline of `ready_timeout` seconds. Time it took every node
+        to become READY is stored in `InnerRing.startup_time` and attached to the report.
+        """
+        deadline = time.monotonic() + ready_timeout
+
+        def start_ir_node(ir_node: "InnerRing"):
+            started_at = time.monotonic()
+            ir_node.start(wait_until_ready=False, with_main_chain=with_main_chain)
+            ir_node.wait_until_ready(deadline=deadline)
+            ir_node.startup_time = time.monotonic() - started_at
+
+        with ThreadPoolExecutor(max_workers=len(self.inner_ring_nodes)) as executor:
+            futures = {executor.submit(start_ir_node, ir_node): ir_node for ir_node in self.inner_ring_nodes}
+        errors = [
+            f"IR{ir_node.ir_number} ({ir_node.endpoint}): {future.exception()!r}"
+            for future, ir_node in futures.items()
+            if future.exception()
+        ]
+
+        startup_times = "\n".join(
+            f"IR{ir_node.ir_number} ({ir_node.endpoint}): {ir_node.startup_time:.2f}s"
+            if ir_node.startup_time is not None
+            else f"IR{ir_node.ir_number} ({ir_node.endpoint}): not ready"
+            for ir_node in self.inner_ring_nodes
+        )
+        logger.info(f"IR nodes startup times:\n{startup_times}")
+        allure.attach(startup_times, "IR nodes startup times", allure.attachment_type.TEXT, ".txt")
+
+        if errors:
+            raise RuntimeError("Failed to start IR nodes:\n" + "\n".join(errors))
+
     @allure.step("Deploy storage node")
     def deploy_storage_nodes(
         self,
@@ -657,6 +765,119 @@ class NeoFSEnv:
         with open(persisted_path, "rb") as fp:
             return pickle.load(fp)
 
+    @classmethod
+    @allure.step("Deploy NeoFS Environment from snapshot")
+    def deploy_from_snapshot(cls, request=None, **deploy_params) -> "NeoFSEnv":
+        """Deploys NeoFS environment as a clone of a snapshot of a freshly bootstrapped one.
+
+        The first call with the given deploy parameters deploys an environment as usual, stops it and keeps
+        its files as a snapshot. Every call clones the snapshot, assigns fresh ports and starts the nodes,
+        so wallets generation, contracts deployment and initial epoch ticks are not repeated.
+        Environments with main chain are always deployed from scratch.
+
+        Args:
+            request: Pytest request of the fixture that needs the environment.
+            deploy_params: Keyword arguments for `NeoFSEnv.deploy`.
+
+        Returns:
+            Deployed NeoFS environment.
+        """
+        if deploy_params.get("with_main_chain"):
+            return cls.deploy(request=request, **deploy_params)
+
+        snapshot_key = hashlib.sha256(repr(sorted(deploy_params.items())).encode()).hexdigest()[:16]
+        snapshot_dir = os.path.join(get_assets_dir_path(), "env_snapshots", snapshot_key)
+        snapshot_path = os.path.join(snapshot_dir, "neofs_env.pickle")
+        Path(snapshot_dir).parent.mkdir(parents=True, exist_ok=True)
+        with open(f"{snapshot_dir}.lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                if not os.path.isfile(snapshot_path):
+                    cls.deploy(request=request, **deploy_params).make_snapshot(snapshot_dir)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+        return cls._clone_snapshot(snapshot_path, request)
+
+    @allure.step("Make snapshot of neofs env")
+    def make_snapshot(self, snapshot_dir: str) -> str:
+        """Stops all processes of the environment and moves its files into the snapshot dir.
+
+        The environment can't be used after that, new ones should be cloned from the snapshot instead.
+        """
+        for node in [self.rest_gw, self.s3_gw, *self.storage_nodes, *self.inner_ring_nodes]:
+            if node is None:
+                continue
+            if node.process:
+                terminate_process(node.process)
+            node.process = None
+            node.pid = None
+
+        snapshot_env_dir = os.path.join(snapshot_dir, "env")
+        Path(snapshot_dir).mkdir(parents=True, exist_ok=True)
+        shutil.move(self._env_dir, snapshot_env_dir)
+        relocate_env_paths(self, self._env_dir, snapshot_env_dir)
+        self.release_ports()
+
+        snapshot_path = os.path.join(snapshot_dir, "neofs_env.pickle")
+        with open(snapshot_path, "wb") as fp:
+            pickle.dump(self, fp)
+        logger.info(f"Snapshot of neofs env is saved at: {snapshot_path}")
+        return snapshot_path
+
+    @classmethod
+    @allure.step("Clone neofs env from snapshot")
+    def _clone_snapshot(cls, snapshot_path: str, request=None) -> "NeoFSEnv":
+        neofs_env = cls.load(snapshot_path)
+        snapshot_env_dir = neofs_env._env_dir
+        neofs_env._id = datetime.datetime.now(datetime.UTC).strftime("%Y-%m-%d-%H-%M-%S")
+        neofs_env._env_dir = f"{get_assets_dir_path()}/env_files/neofs-env-{neofs_env._id}-{uuid.uuid4().hex[:8]}"
+        clone_dir(snapshot_env_dir, neofs_env._env_dir)
+        relocate_env_paths(neofs_env, snapshot_env_dir, neofs_env._env_dir)
+        neofs_env.ports_owner = new_ports_owner()
+
+        try:
+            neofs_env._start_cloned_nodes()
+        except Exception as e:
+            neofs_env.finalize(request, force_collect_logs=True)
+            raise e
+        neofs_env.log_env_details_to_file()
+        return neofs_env
+
+    def _start_cloned_nodes(self):
+        NeoFSEnv.generate_config_file(
+            config_template="cli_cfg.yaml", config_path=self.default_wallet_config, wallet=self.default_wallet
+        )
+        NeoFSEnv.generate_config_file(
+            config_template="neo_go_cfg.yaml", config_path=self.default_wallet_neogo_config, wallet=self.default_wallet
+        )
+
+        for ir_node in self.inner_ring_nodes:
+            ir_node.allocate_ports()
+            ir_node.startup_time = None
+            ir_node.generate_network_config()
+            ir_node.generate_cli_config()
+        self._start_inner_ring_nodes(with_main_chain=False, ready_timeout=IR_READY_TIMEOUT)
+
+        for sn in self.storage_nodes:
+            sn.allocate_ports()
+            sn.generate_config()
+            NeoFSEnv.generate_config_file(config_template="cli_cfg.yaml", config_path=sn.cli_config, wallet=sn.wallet)
+            sn.start(fresh=False, wait_until_ready=False)
+        if self.storage_nodes:
+            self._wait_until_all_storage_nodes_are_ready()
+            # storage nodes have been registered in the network map with the addresses they had in the snapshot
+            self.neofs_adm().fschain.force_new_epoch(
+                rpc_endpoint=f"http://{self.fschain_rpc}",
+                alphabet_wallets=self.alphabet_wallets_dir,
+            )
+            for sn in self.storage_nodes:
+                sn._wait_until_ready()
+
+        for gw in (self.s3_gw, self.rest_gw):
+            if gw is not None:
+                gw.allocate_ports()
+                gw.start(fresh=False)
+
     @classmethod
     def _generate_default_neofs_env_config(cls) -> dict:
         jinja_env = jinja2.Environment()
@@ -775,13 +996,26 @@ class NeoFSEnv:
 
     @allure.step("Cleanup neofs env")
     def finalize(self, request, force_collect_logs=False):
-        if request.config.getoption("--persist-env"):
+        persist_env = request is not None and request.config.getoption("--persist-env")
+        load_env = request is not None and request.config.getoption("--load-env")
+        tests_failed = request is not None and request.session.testsfailed
+
+        # shared block watchers poll chains of the env, they must not outlive it
+        stop_block_watchers(
+            [f"http://{ir.endpoint}" for ir in self.inner_ring_nodes]
+            + ([f"http://{self.main_chain.rpc_address}"] if self.main_chain else [])
+        )
+
+        if isinstance(self.shell, DirectShell) and self.shell.latency_stats.summary():
+            allure.attach(self.shell.latency_stats.format(), "neofs env commands latency", allure.attachment_type.TEXT)
+
+        if persist_env:
             self.persist()
         else:
-            if not request.config.getoption("--load-env"):
+            if not load_env:
                 self.kill()
 
-        if not request.config.getoption("--persist-env") and not request.config.getoption("--load-env"):
+        if not persist_env and not load_env:
             try:
                 for ir in self.inner_ring_nodes:
                     os.remove(ir.ir_storage_path)
@@ -795,13 +1029,14 @@ class NeoFSEnv:
             except OSError as e:
                 logger.warning(f"Failed to remove some files during env cleanup: {e}")
 
-            if request.session.testsfailed or force_collect_logs:
+            if tests_failed or force_collect_logs:
                 zip_path = shutil.make_archive(
                     os.path.join(get_assets_dir_path(), f"neofs_env_{self._id}"), "zip", self._env_dir
                 )
                 self._attach_logs_archive(zip_path, name="neofs env files")
 
             shutil.rmtree(self._env_dir, ignore_errors=True)
+            self.release_ports()
 
         NeoFSEnv.cleanup_unused_ports()
 
@@ -822,69 +1057,22 @@ class NeoFSEnv:
         result = subprocess.run([binary, command], capture_output=True, text=True)
         return f"{result.stdout}\n{result.stderr}\n"
 
-    @staticmethod
-    def get_available_port() -> str:
-        with _thread_lock:
-            with open(ALLOCATED_PORTS_LOCK_FILE, "w") as lock_file:
-                fcntl.flock(lock_file, fcntl.LOCK_EX)
-                try:
-                    if os.path.exists(ALLOCATED_PORTS_FILE):
-                        with open(ALLOCATED_PORTS_FILE, "r") as f:
-                            reserved_ports = set(map(int, f.read().splitlines()))
-                    else:
-                        reserved_ports = set()
-
-                    while True:
-                        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                        s.bind(("", 0))
-                        port = s.getsockname()[1]
-                        s.close()
+    def allocate_port(self) -> int:
+        """Reserves a port for a node of this environment, it is released by `release_ports`."""
+        return _port_allocator.get_port(self.ports_owner)
 
-                        if port not in reserved_ports:
-                            reserved_ports.add(port)
-                            break
-
-                    with open(ALLOCATED_PORTS_FILE, "w") as f:
-                        for p in reserved_ports:
-                            f.write(f"{p}\n")
-                finally:
-                    fcntl.flock(lock_file, fcntl.LOCK_UN)
-        return port
+    def release_ports(self):
+        _port_allocator.release(self.ports_owner)
 
     @staticmethod
-    def cleanup_unused_ports():
-        with open(ALLOCATED_PORTS_LOCK_FILE, "w") as lock_file:
-            fcntl.flock(lock_file, fcntl.LOCK_EX)
-
-            try:
-                if os.path.exists(ALLOCATED_PORTS_FILE):
-                    with open(ALLOCATED_PORTS_FILE, "r") as f:
-                        reserved_ports = set(map(int, f.read().splitlines()))
-                else:
-                    reserved_ports = set()
-
-                still_used_ports = set()
-
-                for port in reserved_ports:
-                    if NeoFSEnv.is_port_in_use(port):
-                        still_used_ports.add(port)
-
-                with open(ALLOCATED_PORTS_FILE, "w") as f:
-                    for port in still_used_ports:
-                        f.write(f"{port}\n")
-            finally:
-                fcntl.flock(lock_file, fcntl.LOCK_UN)
+    def get_available_port() -> int:
+        """Reserves a port that is not bound to any environment, it is released when the process exits."""
+        return _port_allocator.get_port()
 
     @staticmethod
-    def is_port_in_use(port: str):
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        try:
-            s.bind(("", port))
-        except OSError:
-            return True
-        finally:
-            s.close()
-        return False
+    def cleanup_unused_ports():
+        """Releases ports reserved by processes that do not exist anymore."""
+        _port_allocator.release_stale()
 
     @staticmethod
     def download_binary(repo: str, version: str, file: str, target: str):
@@ -966,6 +1154,49 @@ class NeoFSEnv:
             allure.attach.file(archive_path, name=name, extension="zip")
 
 
+def clone_dir(src: str, dst: str):
+    """Copies directory tree using copy-on-write clones of files if the filesystem supports them.
+
+    Hardlinks are not used, since databases of the nodes are modified in place.
+    """
+    if sys.platform == "linux":
+        clone_cmd = ["cp", "-a", "--reflink=auto", src, dst]
+    elif sys.platform == "darwin":
+        clone_cmd = ["cp", "-c", "-R", src, dst]
+    else:
+        clone_cmd = None
+
+    if clone_cmd:
+        result = subprocess.run(clone_cmd, capture_output=True, text=True)
+        if result.returncode == 0:
+            return
+        logger.warning(f"Failed to clone {src} into {dst}: {result.stderr}, falling back to a regular copy")
+    shutil.copytree(src, dst, symlinks=True, dirs_exist_ok=True)
+
+
+def relocate_env_paths(obj, old_dir: str, new_dir: str, _visited: Optional[set] = None):
+    """Replaces `old_dir` prefix with `new_dir` in all paths stored in the env and its nodes."""
+    if _visited is None:
+        _visited = set()
+    if id(obj) in _visited:
+        return
+    _visited.add(id(obj))
+
+    def relocate(value):
+        if isinstance(value, Path):
+            return Path(relocate(str(value)))
+        if isinstance(value, str) and (value == old_dir or value.startswith(f"{old_dir}/")):
+            return new_dir + value[len(old_dir) :]
+        if isinstance(value, list):
+            return [relocate(item) for item in value]
+        if isinstance(value, (NeoFSEnv, NodeWallet, Shard, ResurrectableProcess)):
+            relocate_env_paths(value, old_dir, new_dir, _visited)
+        return value
+
+    for attr, value in list(vars(obj).items()):
+        setattr(obj, attr, relocate(value))
+
+
 class ResurrectableProcess:
     def __getstate__(self):
         attributes = self.__dict__.copy()
@@ -1002,10 +1233,10 @@ class MainChain(ResurrectableProcess):
         self.main_chain_boltdb = self.neofs_env._generate_temp_file(
             self.main_chain_dir, extension="db", prefix="main_chain_bolt_db"
         )
-        self.rpc_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
-        self.p2p_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
-        self.pprof_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
-        self.prometheus_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
+        self.rpc_address = f"{self.neofs_env.domain}:{self.neofs_env.allocate_port()}"
+        self.p2p_address = f"{self.neofs_env.domain}:{self.neofs_env.allocate_port()}"
+        self.pprof_address = f"{self.neofs_env.domain}:{self.neofs_env.allocate_port()}"
+        self.prometheus_address = f"{self.neofs_env.domain}:{self.neofs_env.allocate_port()}"
         self.wallet_dir = self.neofs_env._generate_temp_dir(prefix="mainchain_wallet")
         self.wallet = None
         self.stdout = "Not initialized"
@@ -1118,18 +1349,12 @@ class InnerRing(ResurrectableProcess):
         self.ir_storage_path = self.neofs_env._generate_temp_file(
             self.inner_ring_dir, extension="db", prefix="ir_storage"
         )
-        self.endpoint = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
-        self.p2p_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
-        self.control_endpoint = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
-        self.pprof_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
-        self.prometheus_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
+        self.allocate_ports()
         self.ir_state_file = self.neofs_env._generate_temp_file(self.inner_ring_dir, prefix="ir_state_file")
         self.chain_meta_data = chain_meta_data
-        self.chain_metadata_seed_port = NeoFSEnv.get_available_port()
-        self.chain_metadata_p2p_port = self.chain_metadata_seed_port
-        self.chain_metadata_rpc_port = NeoFSEnv.get_available_port()
         self.sn_validator_url = sn_validator_url
         self.allow_ec = allow_ec
+        self.startup_time = None
         self.stdout = "Not initialized"
         self.stderr = "Not initialized"
         self.process = None
@@ -1150,6 +1375,16 @@ class InnerRing(ResurrectableProcess):
             - STDERR: {self.stderr}
         """
 
+    def allocate_ports(self):
+        self.endpoint = f"{self.neofs_env.domain}:{self.neofs_env.allocate_port()}"
+        self.p2p_address = f"{self.neofs_env.domain}:{self.neofs_env.allocate_port()}"
+        self.control_endpoint = f"{self.neofs_env.domain}:{self.neofs_env.allocate_port()}"
+        self.pprof_address = f"{self.neofs_env.domain}:{self.neofs_env.allocate_port()}"
+        self.prometheus_address = f"{self.neofs_env.domain}:{self.neofs_env.allocate_port()}"
+        self.chain_metadata_seed_port = self.neofs_env.allocate_port()
+        self.chain_metadata_p2p_port = self.chain_metadata_seed_port
+        self.chain_metadata_rpc_port = self.neofs_env.allocate_port()
+
     def generate_network_config(self):
         logger.info(f"Generating network config at: {self.network_config}")
 
@@ -1255,6 +1490,12 @@ class InnerRing(ResurrectableProcess):
         result = neofs_cli.control.healthcheck(endpoint=self.control_endpoint, post_data="--ir")
         assert "READY" in result.stdout
 
+    def wait_until_ready(self, deadline: Optional[float] = None):
+        """Waits until IR is READY; `deadline` is a `time.monotonic()` value to stop polling at."""
+        if deadline is None:
+            return self._wait_until_ready()
+        return self._wait_until_ready.retry_with(stop=stop_after_delay(max(deadline - time.monotonic(), 0)))(self)
+
 
 class Shard:
     def __init__(self, neofs_env: NeoFSEnv, sn_dir: str, gc_remover_batch_size=200, gc_sleep_interval=STORAGE_GC_TIME):
@@ -1303,14 +1544,8 @@ class StorageNode(ResurrectableProcess):
             )
             for _ in range(shards_count)
         ]
-        self.endpoint = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
-        self.control_endpoint = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
-        self.pprof_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
-        self.prometheus_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
+        self.allocate_ports()
         self.metadata_path = self.neofs_env._generate_temp_dir(prefix=f"sn_{sn_number}_metadata")
-        self.metadata_seed_port = self.neofs_env.inner_ring_nodes[0].chain_metadata_seed_port
-        self.metadata_p2p_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
-        self.metadata_rpc_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
         self.fschain_endpoints = fschain_endpoints
         self.stdout = "Not initialized"
         self.stderr = "Not initialized"
@@ -1345,6 +1580,43 @@ class StorageNode(ResurrectableProcess):
     def get_config_template(self):
         return "sn.yaml"
 
+    def allocate_ports(self):
+        self.endpoint = f"{self.neofs_env.domain}:{self.neofs_env.allocate_port()}"
+        self.control_endpoint = f"{self.neofs_env.domain}:{self.neofs_env.allocate_port()}"
+        self.pprof_address = f"{self.neofs_env.domain}:{self.neofs_env.allocate_port()}"
+        self.prometheus_address = f"{self.neofs_env.domain}:{self.neofs_env.allocate_port()}"
+        self.metadata_seed_port = self.neofs_env.inner_ring_nodes[0].chain_metadata_seed_port
+        self.metadata_p2p_address = f"{self.neofs_env.domain}:{self.neofs_env.allocate_port()}"
+        self.metadata_rpc_address = f"{self.neofs_env.domain}:{self.neofs_env.allocate_port()}"
+
+    def generate_config(self):
+        if os.getenv(f"SN{self.sn_number}_CONFIG_PATH", None):
+            return
+        sn_config_template = self.get_config_template()
+
+        NeoFSEnv.generate_config_file(
+            config_template=sn_config_template,
+            config_path=self.storage_node_config_path,
+            custom=Path(sn_config_template).is_file(),
+            fschain_endpoints=[self.neofs_env.fschain_rpc]
+            if self.fschain_endpoints is None
+            else self.fschain_endpoints,
+            shards=self.shards,
+            writecache=self.writecache,
+            wallet=self.wallet,
+            state_file=self.state_file,
+            pprof_address=self.pprof_address,
+            prometheus_address=self.prometheus_address,
+            attrs=self.node_attrs,
+            metadata_path=self.metadata_path,
+            metadata_seed_port=self.metadata_seed_port,
+            metadata_p2p_address=self.metadata_p2p_address,
+            metadata_rpc_address=self.metadata_rpc_address,
+            replication_cooldown=self.replication_cooldown,
+            disable_post_initial_queue=self.disable_post_initial_queue,
+            object_batch_size=self.object_batch_size,
+        )
+
     @allure.step("Start storage node")
     def start(self, fresh=True, prepared_wallet: Optional[NodeWallet] = None, wait_until_ready=True):
         if self.process is not None or self.pid is not None:
@@ -1357,31 +1629,7 @@ class StorageNode(ResurrectableProcess):
                 self.neofs_env.generate_storage_wallet(self.wallet, label=f"sn{self.sn_number}")
             logger.info(f"Generating config for storage node at {self.storage_node_config_path}")
 
-            if not os.getenv(f"SN{self.sn_number}_CONFIG_PATH", None):
-                sn_config_template = self.get_config_template()
-
-                NeoFSEnv.generate_config_file(
-                    config_template=sn_config_template,
-                    config_path=self.storage_node_config_path,
-                    custom=Path(sn_config_template).is_file(),
-                    fschain_endpoints=[self.neofs_env.fschain_rpc]
-                    if self.fschain_endpoints is None
-                    else self.fschain_endpoints,
-                    shards=self.shards,
-                    writecache=self.writecache,
-                    wallet=self.wallet,
-                    state_file=self.state_file,
-                    pprof_address=self.pprof_address,
-                    prometheus_address=self.prometheus_address,
-                    attrs=self.node_attrs,
-                    metadata_path=self.metadata_path,
-                    metadata_seed_port=self.metadata_seed_port,
-                    metadata_p2p_address=self.metadata_p2p_address,
-                    metadata_rpc_address=self.metadata_rpc_address,
-                    replication_cooldown=self.replication_cooldown,
-                    disable_post_initial_queue=self.disable_post_initial_queue,
-                    object_batch_size=self.object_batch_size,
-                )
+            self.generate_config()
             logger.info(f"Generating cli config for storage node at: {self.cli_config}")
             NeoFSEnv.generate_config_file(
                 config_template="cli_cfg.yaml", config_path=self.cli_config, wallet=self.wallet
@@ -1412,6 +1660,7 @@ class StorageNode(ResurrectableProcess):
         with allure.step(f"Kill SN: {self.endpoint}; {self.stderr}"):
             if self.process:
                 self.process.kill()
+                self.process.wait(timeout=60)
                 self.process = None
                 self.pid = None
                 if wait_until_not_ready:
@@ -1431,31 +1680,7 @@ class StorageNode(ResurrectableProcess):
         os.remove(self.state_file)
         self.shards = [Shard(self.neofs_env, self.sn_dir), Shard(self.neofs_env, self.sn_dir)]
 
-        if not os.getenv(f"SN{self.sn_number}_CONFIG_PATH", None):
-            sn_config_template = self.get_config_template()
-
-            NeoFSEnv.generate_config_file(
-                config_template=sn_config_template,
-                config_path=self.storage_node_config_path,
-                custom=Path(sn_config_template).is_file(),
-                fschain_endpoints=[self.neofs_env.fschain_rpc]
-                if self.fschain_endpoints is None
-                else self.fschain_endpoints,
-                shards=self.shards,
-                writecache=self.writecache,
-                wallet=self.wallet,
-                state_file=self.state_file,
-                pprof_address=self.pprof_address,
-                prometheus_address=self.prometheus_address,
-                attrs=self.node_attrs,
-                metadata_path=self.metadata_path,
-                metadata_seed_port=self.metadata_seed_port,
-                metadata_p2p_address=self.metadata_p2p_address,
-                metadata_rpc_address=self.metadata_rpc_address,
-                replication_cooldown=self.replication_cooldown,
-                disable_post_initial_queue=self.disable_post_initial_queue,
-                object_batch_size=self.object_batch_size,
-            )
+        self.generate_config()
         time.sleep(1)
 
     @allure.step("Delete storage node metadata")
@@ -1465,31 +1690,7 @@ class StorageNode(ResurrectableProcess):
             os.remove(shard.metabase_path)
             shard.metabase_path = self.neofs_env._generate_temp_file(self.sn_dir, prefix="shard_metabase")
 
-        if not os.getenv(f"SN{self.sn_number}_CONFIG_PATH", None):
-            sn_config_template = self.get_config_template()
-
-            NeoFSEnv.generate_config_file(
-                config_template=sn_config_template,
-                config_path=self.storage_node_config_path,
-                custom=Path(sn_config_template).is_file(),
-                fschain_endpoints=[self.neofs_env.fschain_rpc]
-                if self.fschain_endpoints is None
-                else self.fschain_endpoints,
-                shards=self.shards,
-                writecache=self.writecache,
-                wallet=self.wallet,
-                state_file=self.state_file,
-                pprof_address=self.pprof_address,
-                prometheus_address=self.prometheus_address,
-                attrs=self.node_attrs,
-                metadata_path=self.metadata_path,
-                metadata_seed_port=self.metadata_seed_port,
-                metadata_p2p_address=self.metadata_p2p_address,
-                metadata_rpc_address=self.metadata_rpc_address,
-                replication_cooldown=self.replication_cooldown,
-                disable_post_initial_queue=self.disable_post_initial_queue,
-                object_batch_size=self.object_batch_size,
-            )
+        self.generate_config()
         time.sleep(1)
 
     @allure.step("Set metabase resync")
@@ -1520,24 +1721,66 @@ class StorageNode(ResurrectableProcess):
         )
         self.pid = self.process.pid
 
-    @retry(wait=wait_fixed(1), stop=stop_after_attempt(200), reraise=True)
-    def _wait_until_ready(self):
-        neofs_cli = self.neofs_env.neofs_cli(self.cli_config)
-        result = neofs_cli.control.healthcheck(endpoint=self.control_endpoint)
-        assert "Health status: READY" in result.stdout, "Health is not ready"
-        assert "Network status: ONLINE" in result.stdout, "Network is not online"
+    def _is_process_exited(self) -> bool:
+        if isinstance(self.process, Popen):
+            return self.process.poll() is not None
+        return self.process is not None and not self.process.is_running()
 
-    @retry(wait=wait_fixed(1), stop=stop_after_attempt(150), reraise=True)
-    def _wait_until_not_ready(self):
+    def _healthcheck(self) -> str:
         neofs_cli = self.neofs_env.neofs_cli(self.cli_config)
-        try:
-            result = neofs_cli.control.healthcheck(endpoint=self.control_endpoint)
-        except Exception as e:
-            with allure.step(f"Exception caught: {e}, node is not ready"):
-                time.sleep(2)
-                return
-        assert "Health status: READY" not in result.stdout, "Health is ready"
-        assert "Network status: ONLINE" not in result.stdout, "Network is online"
+        return neofs_cli.control.healthcheck(endpoint=self.control_endpoint).stdout
+
+    def _wait_until_ready(self, timeout: float = SN_READY_TIMEOUT):
+        """Waits until the node reports READY and ONLINE via `neofs-cli control healthcheck`.
+
+        The node logs and the control port are polled every `SN_READINESS_POLL_INTERVAL` seconds.
+        CLI healthcheck is executed only when the control port accepts connections: right after a ready
+        marker appears in the logs or, if there is none, not more often than once a second.
+        """
+        log_watcher = LogWatcher(self.stdout, self.stderr)
+        deadline = time.monotonic() + timeout
+        last_check_at = 0.0
+        health = ""
+        while time.monotonic() < deadline:
+            if self._is_process_exited():
+                raise RuntimeError(f"Storage node process exited before it became ready:\n{self}")
+            marker_seen = log_watcher.seen(SN_READY_LOG_MARKERS)
+            if (marker_seen or time.monotonic() - last_check_at >= 1) and is_endpoint_listening(self.control_endpoint):
+                last_check_at = time.monotonic()
+                try:
+                    health = self._healthcheck()
+                except Exception as e:
+                    health = str(e)
+                if "Health status: READY" in health and "Network status: ONLINE" in health:
+                    return
+            time.sleep(SN_READINESS_POLL_INTERVAL)
+        assert "Health status: READY" in health, f"Health is not ready: {health}"
+        raise AssertionError(f"Network is not online: {health}")
+
+    def _wait_until_not_ready(self, timeout: float = SN_READY_TIMEOUT):
+        """Waits until the node stops serving its control endpoint or reports that it is not READY.
+
+        The control port and the shutdown markers in the logs are polled every
+        `SN_READINESS_POLL_INTERVAL` seconds, CLI healthcheck is used only as a final confirmation.
+        """
+        log_watcher = LogWatcher(self.stdout, self.stderr)
+        deadline = time.monotonic() + timeout
+        last_check_at = 0.0
+        health = ""
+        while time.monotonic() < deadline:
+            stopping = log_watcher.seen(SN_SHUTDOWN_LOG_MARKERS) or not is_endpoint_listening(self.control_endpoint)
+            if stopping or time.monotonic() - last_check_at >= 1:
+                last_check_at = time.monotonic()
+                try:
+                    health = self._healthcheck()
+                except Exception as e:
+                    with allure.step(f"Exception caught: {e}, node is not ready"):
+                        return
+                if "Health status: READY" not in health and "Network status: ONLINE" not in health:
+                    return
+            time.sleep(SN_READINESS_POLL_INTERVAL)
+        assert "Health status: READY" not in health, "Health is ready"
+        raise AssertionError("Network is online")
 
 
 class S3_GW(ResurrectableProcess):
@@ -1553,9 +1796,7 @@ class S3_GW(ResurrectableProcess):
             address="",
             password=self.neofs_env.default_password,
         )
-        self.endpoint = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
-        self.pprof_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
-        self.prometheus_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
+        self.allocate_ports()
         self.tls_cert_path = self.neofs_env._generate_temp_file(self.s3_gw_dir, prefix="s3gw_tls_cert")
         self.tls_key_path = self.neofs_env._generate_temp_file(self.s3_gw_dir, prefix="s3gw_tls_key")
         self.stdout = "Not initialized"
@@ -1576,6 +1817,11 @@ class S3_GW(ResurrectableProcess):
             - STDERR: {self.stderr}
         """
 
+    def allocate_ports(self):
+        self.endpoint = f"{self.neofs_env.domain}:{self.neofs_env.allocate_port()}"
+        self.pprof_address = f"{self.neofs_env.domain}:{self.neofs_env.allocate_port()}"
+        self.prometheus_address = f"{self.neofs_env.domain}:{self.neofs_env.allocate_port()}"
+
     def start(self, fresh=True):
         if self.process is not None:
             raise RuntimeError(f"This s3 gw instance has already been started:\n{self}")
@@ -1671,9 +1917,7 @@ class REST_GW(ResurrectableProcess):
             address="",
             password=self.neofs_env.default_password,
         )
-        self.endpoint = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
-        self.pprof_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
-        self.prometheus_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
+        self.allocate_ports()
         self.default_timestamp = default_timestamp
         self.stdout = "Not initialized"
         self.stderr = "Not initialized"
@@ -1691,6 +1935,11 @@ class REST_GW(ResurrectableProcess):
             - STDERR: {self.stderr}
         """
 
+    def allocate_ports(self):
+        self.endpoint = f"{self.neofs_env.domain}:{self.neofs_env.allocate_port()}"
+        self.pprof_address = f"{self.neofs_env.domain}:{self.neofs_env.allocate_port()}"
+        self.prometheus_address = f"{self.neofs_env.domain}:{self.neofs_env.allocate_port()}"
+
     def start(self, fresh=True):
         if self.process is not None:
             raise RuntimeError(f"This rest gw instance has already been started:\n{self}")
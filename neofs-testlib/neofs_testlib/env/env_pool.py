@@ -0,0 +1,110 @@
+import logging
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+
+import allure
+import helpers.common
+
+from neofs_testlib.env.env import NeoFSEnv
+
+logger = logging.getLogger("neofs.testlib.env")
+
+
+def _init_worker(test_run_dir: str):
+    # pooled environments have to be deployed into the same assets dir as the ones of the test session
+    helpers.common.TEST_RUN_DIR = test_run_dir
+    helpers.common.get_assets_dir_path.cache_clear()
+
+
+def _deploy_env(deploy_params: dict, use_snapshot: bool) -> NeoFSEnv:
+    if use_snapshot:
+        return NeoFSEnv.deploy_from_snapshot(**deploy_params)
+    return NeoFSEnv.deploy(**deploy_params)
+
+
+def _finalize_env(neofs_env: NeoFSEnv):
+    neofs_env.finalize(None)
+
+
+class NeoFSEnvPool:
+    """Keeps pre-deployed NeoFS environments ready to be handed out to tests.
+
+    Every time an environment is acquired, the next one with the same deploy parameters starts
+    to be deployed in the background, so it is ready by the time the next test asks for it.
+    Released environments are torn down in the background as well.
+
+    Deployment and teardown happen in separate worker processes, environments are passed between
+    processes with pickle the same way as `NeoFSEnv.persist`/`NeoFSEnv.load` do it.
+    """
+
+    def __init__(self, workers: int = 2, use_snapshot: bool = False):
+        self.use_snapshot = use_snapshot
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(helpers.common.TEST_RUN_DIR,),
+        )
+        self._spare_envs: dict[tuple, Future] = {}
+        self._teardowns: list[Future] = []
+
+    @staticmethod
+    def _key(deploy_params: dict) -> tuple:
+        return tuple(sorted((param, repr(value)) for param, value in deploy_params.items()))
+
+    def acquire(self, request, **deploy_params) -> NeoFSEnv:
+        """Returns a deployed environment and starts preparing the next one with the same parameters.
+
+        Args:
+            request: Pytest request of the fixture that needs the environment.
+            deploy_params: Keyword arguments for `NeoFSEnv.deploy`.
+
+        Returns:
+            Deployed NeoFS environment.
+        """
+        key = self._key(deploy_params)
+        neofs_env = None
+        spare_env = self._spare_envs.pop(key, None)
+        if spare_env is not None:
+            with allure.step("Take pre-deployed NeoFS environment from the pool"):
+                try:
+                    neofs_env = spare_env.result()
+                    neofs_env.log_env_details_to_file()
+                except Exception as e:
+                    logger.warning(f"Pre-deployed NeoFS environment is not available, deploying a new one: {e}")
+
+        if neofs_env is None:
+            neofs_env = _deploy_env(dict(deploy_params, request=request), self.use_snapshot)
+
+        self._spare_envs[key] = self._executor.submit(_deploy_env, deploy_params, self.use_snapshot)
+        return neofs_env
+
+    def release(self, neofs_env: NeoFSEnv, request):
+        """Tears down the environment in the background.
+
+        If there are failed tests in the session, the environment is finalized synchronously,
+        so its logs are collected and attached to the report as usual.
+        """
+        if request.session.testsfailed:
+            neofs_env.finalize(request)
+            return
+        self._teardowns.append(self._executor.submit(_finalize_env, neofs_env))
+
+    @allure.step("Shutdown NeoFS environments pool")
+    def close(self):
+        for spare_env in self._spare_envs.values():
+            try:
+                self._teardowns.append(self._executor.submit(_finalize_env, spare_env.result()))
+            except Exception as e:
+                logger.warning(f"Failed to deploy NeoFS environment in the pool: {e}")
+        self._spare_envs.clear()
+
+        for teardown in self._teardowns:
+            try:
+                teardown.result()
+            except Exception as e:
+                logger.warning(f"Failed to finalize NeoFS environment from the pool: {e}")
+        self._teardowns.clear()
+
+        self._executor.shutdown()
+        NeoFSEnv.cleanup_unused_ports()
@@ -0,0 +1,138 @@
+import fcntl
+import os
+import random
+import socket
+import threading
+import uuid
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import psutil
+
+
+def is_port_in_use(port: int) -> bool:
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        s.bind(("", port))
+    except OSError:
+        return True
+    finally:
+        s.close()
+    return False
+
+
+def new_ports_owner() -> str:
+    return f"{os.getpid()}-{uuid.uuid4().hex[:12]}"
+
+
+def _owner_pid(owner: str) -> Optional[int]:
+    pid, _, _ = owner.partition("-")
+    return int(pid) if pid.isdigit() else None
+
+
+class PortAllocator:
+    """Reserves TCP ports for NeoFS environments on the local host.
+
+    Reservations are shared between all test processes via a file, each line of which holds a port
+    and an ID of its owner (usually an environment). Ports are reserved in blocks of `block_size`
+    contiguous ports in a single locked transaction and then handed out from a process-local
+    free list, so the file is touched once per block instead of once per port.
+    """
+
+    def __init__(
+        self,
+        ports_file: str,
+        lock_file: str,
+        block_size: int = 32,
+        port_range: tuple[int, int] = (20000, 32000),
+    ):
+        self.ports_file = ports_file
+        self.lock_file = lock_file
+        self.block_size = block_size
+        self.port_range = port_range
+        self._free_ports: dict[str, list[int]] = {}
+        self._lock = threading.Lock()
+        self._process_owner = None
+
+    @property
+    def process_owner(self) -> str:
+        """Owner of ports that are not bound to any environment, one per process."""
+        if self._process_owner is None or _owner_pid(self._process_owner) != os.getpid():
+            self._process_owner = new_ports_owner()
+        return self._process_owner
+
+    def get_port(self, owner: Optional[str] = None) -> int:
+        """Returns a port reserved for the owner.
+
+        Args:
+            owner: ID of the ports owner, ports of the current process are used if not specified.
+
+        Returns:
+            Reserved port.
+        """
+        owner = owner or self.process_owner
+        with self._lock:
+            free_ports = self._free_ports.setdefault(owner, [])
+            if not free_ports:
+                free_ports.extend(self._reserve_block(owner))
+            return free_ports.pop(0)
+
+    def release(self, owner: str) -> None:
+        """Releases all ports reserved for the owner, including the ones reserved by other processes."""
+        with self._lock:
+            self._free_ports.pop(owner, None)
+            with self._reservations() as reservations:
+                for port, port_owner in list(reservations.items()):
+                    if port_owner == owner:
+                        del reservations[port]
+
+    def release_stale(self) -> None:
+        """Releases ports of owners whose processes do not exist anymore."""
+        with self._lock:
+            with self._reservations() as reservations:
+                for port, owner in list(reservations.items()):
+                    pid = _owner_pid(owner)
+                    if pid is None:
+                        # ports without an owner can only be checked by trying to bind them
+                        is_stale = not is_port_in_use(port)
+                    else:
+                        is_stale = not psutil.pid_exists(pid)
+                    if is_stale:
+                        del reservations[port]
+
+    def _reserve_block(self, owner: str) -> list[int]:
+        low, high = self.port_range
+        with self._reservations() as reservations:
+            for _ in range(100):
+                start = random.randrange(low, high - self.block_size, self.block_size)
+                block = [
+                    port
+                    for port in range(start, start + self.block_size)
+                    if port not in reservations and not is_port_in_use(port)
+                ]
+                if len(block) < self.block_size // 2:
+                    continue
+                for port in block:
+                    reservations[port] = owner
+                return block
+        raise RuntimeError(f"Failed to reserve a block of {self.block_size} free ports in range {low}-{high}")
+
+    @contextmanager
+    def _reservations(self) -> Iterator[dict[int, str]]:
+        with open(self.lock_file, "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                reservations = {}
+                if os.path.exists(self.ports_file):
+                    with open(self.ports_file, "r") as f:
+                        for line in f.read().splitlines():
+                            # files written by older versions contain bare ports without owners
+                            port, _, owner = line.partition(" ")
+                            if port:
+                                reservations[int(port)] = owner
+                yield reservations
+                with open(self.ports_file, "w") as f:
+                    for port, owner in reservations.items():
+                        f.write(f"{port} {owner}\n")
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -0,0 +1,3 @@
+from neofs_testlib.grpc_client.channel_pool import ChannelPool
+from neofs_testlib.grpc_client.object_client import ObjectClient, ObjectStatusError, ObjectTooLargeError, SplitInfoError
+from neofs_testlib.grpc_client.signer import Signer
@@ -0,0 +1,42 @@
+import threading
+
+import grpc
+
+MAX_MESSAGE_LENGTH = 64 * 1024 * 1024
+
+DEFAULT_CHANNEL_OPTIONS = [
+    ("grpc.max_send_message_length", MAX_MESSAGE_LENGTH),
+    ("grpc.max_receive_message_length", MAX_MESSAGE_LENGTH),
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_permit_without_calls", 1),
+]
+
+
+class ChannelPool:
+    """Keeps one gRPC channel per endpoint, so connections are reused between requests.
+
+    gRPC channels are thread-safe and multiplex concurrent calls, so a single channel
+    per endpoint is enough for any number of threads.
+    """
+
+    def __init__(self, options: list[tuple] = None):
+        self.options = options or DEFAULT_CHANNEL_OPTIONS
+        self._channels: dict[str, grpc.Channel] = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str) -> grpc.Channel:
+        with self._lock:
+            channel = self._channels.get(endpoint)
+            if channel is None:
+                channel = grpc.insecure_channel(endpoint, options=self.options)
+                self._channels[endpoint] = channel
+            return channel
+
+    def close(self, endpoint: str = None) -> None:
+        """Closes channel of the endpoint or all channels if endpoint is not specified."""
+        with self._lock:
+            endpoints = [endpoint] if endpoint else list(self._channels)
+            for channel_endpoint in endpoints:
+                channel = self._channels.pop(channel_endpoint, None)
+                if channel is not None:
+                    channel.close()
@@ -0,0 +1,574 @@
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, Optional
+
+import base58
+import grpc
+from google.protobuf.json_format import MessageToDict
+from google.protobuf.message import Message
+
+from neofs_testlib.grpc_client.channel_pool import ChannelPool
+from neofs_testlib.grpc_client.signer import Signer
+from neofs_testlib.protobuf.generated.container import service_pb2 as container_service_pb2
+from neofs_testlib.protobuf.generated.netmap import service_pb2 as netmap_service_pb2
+from neofs_testlib.protobuf.generated.object import service_pb2 as object_service_pb2
+from neofs_testlib.protobuf.generated.object import types_pb2 as object_types_pb2
+from neofs_testlib.protobuf.generated.refs import types_pb2 as refs_types_pb2
+from neofs_testlib.protobuf.generated.session import service_pb2 as session_service_pb2
+from neofs_testlib.protobuf.generated.session import types_pb2 as session_types_pb2
+
+API_VERSION = refs_types_pb2.Version(major=2, minor=18)
+DEFAULT_TTL = 2
+PAYLOAD_CHUNK_SIZE = 3 * 1024 * 1024
+SEARCH_QUERY_VERSION = 1
+SEARCH_MAX_COUNT = 1000
+SESSION_LIFETIME_EPOCHS = 10
+
+EXPIRATION_EPOCH_ATTRIBUTE = "__NEOFS__EXPIRATION_EPOCH"
+DISABLE_HOMOMORPHIC_HASHING_ATTRIBUTE = "__NEOFS__DISABLE_HOMOMORPHIC_HASHING"
+
+# match types in the form neofs-cli accepts them in search filters
+SEARCH_MATCH_TYPES = {
+    "EQ": object_types_pb2.MatchType.STRING_EQUAL,
+    "NE": object_types_pb2.MatchType.STRING_NOT_EQUAL,
+    "NOPRESENT": object_types_pb2.MatchType.NOT_PRESENT,
+    "COMMON_PREFIX": object_types_pb2.MatchType.COMMON_PREFIX,
+    "GT": object_types_pb2.MatchType.NUM_GT,
+    "GE": object_types_pb2.MatchType.NUM_GE,
+    "LT": object_types_pb2.MatchType.NUM_LT,
+    "LE": object_types_pb2.MatchType.NUM_LE,
+}
+
+
+class ObjectStatusError(RuntimeError):
+    """NeoFS API status returned by a node in a response.
+
+    The message has the same form as the one printed by neofs-cli, so status patterns
+    from tests match both.
+    """
+
+    def __init__(self, method: str, code: int, message: str):
+        super().__init__(f"{method}: status: code = {code} message = {message}")
+        self.code = code
+        self.message = message
+
+
+class SplitInfoError(Exception):
+    """Node responded with split information of a complex object to a raw request."""
+
+    def __init__(self, split_info: object_types_pb2.SplitInfo):
+        super().__init__("object is complex, split information received")
+        self.split_info = split_info
+
+
+class ObjectTooLargeError(ValueError):
+    """Payload does not fit into a single object and has to be sliced by a client."""
+
+
+@dataclass
+class NetworkInfo:
+    current_epoch: int
+    magic_number: int
+    max_object_size: int
+    homomorphic_hashing_disabled: bool
+
+
+def parse_search_filter(expression: str) -> object_types_pb2.SearchFilter:
+    """Converts a filter in neofs-cli format (`key MATCH value`) to a search filter.
+
+    Args:
+        expression: Filter expression, e.g. `FileName EQ cat.jpg` or `Color NOPRESENT`.
+
+    Returns:
+        Search filter.
+    """
+    parts = expression.split(" ", 2)
+    if len(parts) == 2 and parts[1] == "NOPRESENT":
+        parts.append("")
+    if len(parts) != 3 or parts[1] not in SEARCH_MATCH_TYPES:
+        raise ValueError(f"Invalid search filter: {expression}")
+    key, match_type, value = parts
+    return object_types_pb2.SearchFilter(
+        key=key, match_type=SEARCH_MATCH_TYPES[match_type], value="" if value == '""' else value
+    )
+
+
+def object_to_json(message: Message) -> dict:
+    """Converts a message to a dict in the form neofs-cli prints it with `--json`.
+
+    Unset message fields are kept as None the same way neofs-cli does it.
+    """
+    decoded = MessageToDict(message, always_print_fields_with_no_presence=True)
+    _fill_unset_messages(message, decoded)
+    return decoded
+
+
+def _fill_unset_messages(message: Message, decoded: dict) -> None:
+    for field in message.DESCRIPTOR.fields:
+        if field.message_type is None or field.containing_oneof is not None or field.is_repeated:
+            continue
+        if not message.HasField(field.name):
+            decoded[field.json_name] = None
+        else:
+            _fill_unset_messages(getattr(message, field.name), decoded[field.json_name])
+
+
+def _container_id(cid: str) -> refs_types_pb2.ContainerID:
+    return refs_types_pb2.ContainerID(value=base58.b58decode(cid))
+
+
+def _address(cid: str, oid: str) -> refs_types_pb2.Address:
+    return refs_types_pb2.Address(
+        container_id=_container_id(cid), object_id=refs_types_pb2.ObjectID(value=base58.b58decode(oid))
+    )
+
+
+def _encode_id(object_id: refs_types_pb2.ObjectID) -> str:
+    return base58.b58encode(object_id.value).decode()
+
+
+class ObjectClient:
+    """In-process client of NeoFS object service.
+
+    Requests are sent over channels from a shared pool and signed with a key of the wallet
+    on whose behalf they are made, no CLI processes are spawned.
+
+    Args:
+        channel_pool: Pool of gRPC channels, a new one is created if not specified.
+        homomorphic_hasher: Function that calculates Tillich-Zémor hash of a payload, required
+            to put objects into containers with homomorphic hashing enabled.
+        timeout: Timeout of a single call (in seconds).
+    """
+
+    def __init__(
+        self,
+        channel_pool: Optional[ChannelPool] = None,
+        homomorphic_hasher: Optional[Callable[[bytes], bytes]] = None,
+        timeout: float = 60,
+    ):
+        self.channel_pool = channel_pool or ChannelPool()
+        self.homomorphic_hasher = homomorphic_hasher
+        self.timeout = timeout
+        self._homomorphic_hashing_disabled: dict[str, bool] = {}
+        self._lock = threading.Lock()
+
+    def network_info(self, endpoint: str, signer: Signer) -> NetworkInfo:
+        request = netmap_service_pb2.NetworkInfoRequest()
+        response = self._unary(
+            endpoint,
+            "netmap.NetmapService/NetworkInfo",
+            self._sign_request(request, signer),
+            netmap_service_pb2.NetworkInfoResponse,
+        )
+        info = response.body.network_info
+        parameters = {parameter.key.decode(): parameter.value for parameter in info.network_config.parameters}
+        return NetworkInfo(
+            current_epoch=info.current_epoch,
+            magic_number=info.magic_number,
+            max_object_size=int.from_bytes(parameters.get("MaxObjectSize", b""), "little"),
+            homomorphic_hashing_disabled=any(parameters.get("HomomorphicHashingDisabled", b"")),
+        )
+
+    def put(
+        self,
+        endpoint: str,
+        signer: Signer,
+        cid: str,
+        payload: bytes,
+        attributes: Optional[dict] = None,
+        expire_at: Optional[int] = None,
+        lifetime: Optional[int] = None,
+        object_type: int = object_types_pb2.ObjectType.REGULAR,
+        ttl: int = DEFAULT_TTL,
+        xhdr: Optional[dict] = None,
+    ) -> str:
+        """Puts an object that fits into the maximum object size of the network.
+
+        Args:
+            endpoint: Storage node endpoint.
+            signer: Signer of the object owner.
+            cid: Container ID.
+            payload: Object payload.
+            attributes: Object attributes.
+            expire_at: Last epoch in the life of the object.
+            lifetime: Lifetime of the object relative to the current epoch.
+            object_type: Type of the object.
+            ttl: TTL value in request meta header.
+            xhdr: Request X-Headers.
+
+        Returns:
+            ID of the object.
+        """
+        network_info = self.network_info(endpoint, signer)
+        if len(payload) > network_info.max_object_size:
+            raise ObjectTooLargeError(
+                f"Payload of {len(payload)} bytes exceeds maximum object size {network_info.max_object_size}"
+            )
+
+        header = object_types_pb2.Header(
+            version=API_VERSION,
+            container_id=_container_id(cid),
+            owner_id=signer.owner_id,
+            creation_epoch=network_info.current_epoch,
+            payload_length=len(payload),
+            payload_hash=refs_types_pb2.Checksum(
+                type=refs_types_pb2.ChecksumType.SHA256, sum=hashlib.sha256(payload).digest()
+            ),
+            object_type=object_type,
+        )
+        if not network_info.homomorphic_hashing_disabled and not self._is_homomorphic_hashing_disabled(
+            endpoint, signer, cid
+        ):
+            if self.homomorphic_hasher is None:
+                raise ValueError(f"Container {cid} requires homomorphic hash, but no hasher is configured")
+            header.homomorphic_hash.type = refs_types_pb2.ChecksumType.TZ
+            header.homomorphic_hash.sum = self.homomorphic_hasher(payload)
+
+        attributes = dict(attributes or {})
+        if lifetime is not None:
+            expire_at = network_info.current_epoch + lifetime
+        if expire_at is not None:
+            attributes[EXPIRATION_EPOCH_ATTRIBUTE] = expire_at
+        for key, value in attributes.items():
+            header.attributes.add(key=key, value=str(value))
+
+        object_id = refs_types_pb2.ObjectID(value=hashlib.sha256(header.SerializeToString(deterministic=True)).digest())
+
+        def requests() -> Iterator[object_service_pb2.PutRequest]:
+            request = object_service_pb2.PutRequest()
+            request.body.init.object_id.CopyFrom(object_id)
+            request.body.init.signature.CopyFrom(signer.sign(object_id.SerializeToString(deterministic=True)))
+            request.body.init.header.CopyFrom(header)
+            yield self._sign_request(request, signer, network_info, ttl, xhdr)
+
+            for offset in range(0, len(payload), PAYLOAD_CHUNK_SIZE):
+                request = object_service_pb2.PutRequest()
+                request.body.chunk = payload[offset : offset + PAYLOAD_CHUNK_SIZE]
+                yield self._sign_request(request, signer, network_info, ttl, xhdr)
+
+        response = self._client_stream(
+            endpoint,
+            "object.ObjectService/Put",
+            requests(),
+            object_service_pb2.PutRequest,
+            object_service_pb2.PutResponse,
+        )
+        return _encode_id(response.body.object_id)
+
+    def get(
+        self,
+        endpoint: str,
+        signer: Signer,
+        cid: str,
+        oid: str,
+        raw: bool = False,
+        ttl: int = DEFAULT_TTL,
+        xhdr: Optional[dict] = None,
+    ) -> tuple[object_types_pb2.Object, bytes]:
+        """Gets an object.
+
+        Returns:
+            Object without payload (ID, signature and header) and the payload.
+
+        Raises:
+            SplitInfoError: If the object is complex and the request is raw.
+        """
+        request = object_service_pb2.GetRequest()
+        request.body.address.CopyFrom(_address(cid, oid))
+        request.body.raw = raw
+
+        obj = object_types_pb2.Object()
+        payload = bytearray()
+        for response in self._server_stream(
+            endpoint,
+            "object.ObjectService/Get",
+            self._sign_request(request, signer, ttl=ttl, xhdr=xhdr),
+            object_service_pb2.GetResponse,
+        ):
+            part = response.body.WhichOneof("object_part")
+            if part == "init":
+                obj.object_id.CopyFrom(response.body.init.object_id)
+                obj.signature.CopyFrom(response.body.init.signature)
+                obj.header.CopyFrom(response.body.init.header)
+            elif part == "chunk":
+                payload += response.body.chunk
+            elif part == "split_info":
+                raise SplitInfoError(response.body.split_info)
+        return obj, bytes(payload)
+
+    def head(
+        self,
+        endpoint: str,
+        signer: Signer,
+        cid: str,
+        oid: str,
+        raw: bool = False,
+        ttl: int = DEFAULT_TTL,
+        xhdr: Optional[dict] = None,
+    ) -> object_types_pb2.Object:
+        """Gets an object header.
+
+        Returns:
+            Object without payload (ID, signature and header).
+
+        Raises:
+            SplitInfoError: If the object is complex and the request is raw.
+        """
+        request = object_service_pb2.HeadRequest()
+        request.body.address.CopyFrom(_address(cid, oid))
+        request.body.raw = raw
+
+        response = self._unary(
+            endpoint,
+            "object.ObjectService/Head",
+            self._sign_request(request, signer, ttl=ttl, xhdr=xhdr),
+            object_service_pb2.HeadResponse,
+        )
+        part = response.body.WhichOneof("head")
+        if part == "split_info":
+            raise SplitInfoError(response.body.split_info)
+        if part != "header":
+            raise ValueError(f"Unexpected HEAD response: {part}")
+        return object_types_pb2.Object(
+            object_id=request.body.address.object_id,
+            signature=response.body.header.signature,
+            header=response.body.header.header,
+        )
+
+    def get_range(
+        self,
+        endpoint: str,
+        signer: Signer,
+        cid: str,
+        oid: str,
+        offset: int,
+        length: int,
+        raw: bool = False,
+        ttl: int = DEFAULT_TTL,
+        xhdr: Optional[dict] = None,
+    ) -> bytes:
+        """Gets a range of an object payload.
+
+        Raises:
+            SplitInfoError: If the object is complex and the request is raw.
+        """
+        request = object_service_pb2.GetRangeRequest()
+        request.body.address.CopyFrom(_address(cid, oid))
+        request.body.range.offset = offset
+        request.body.range.length = length
+        request.body.raw = raw
+
+        payload = bytearray()
+        for response in self._server_stream(
+            endpoint,
+            "object.ObjectService/GetRange",
+            self._sign_request(request, signer, ttl=ttl, xhdr=xhdr),
+            object_service_pb2.GetRangeResponse,
+        ):
+            part = response.body.WhichOneof("range_part")
+            if part == "chunk":
+                payload += response.body.chunk
+            elif part == "split_info":
+                raise SplitInfoError(response.body.split_info)
+        return bytes(payload)
+
+    def delete(
+        self,
+        endpoint: str,
+        signer: Signer,
+        cid: str,
+        oid: str,
+        ttl: int = DEFAULT_TTL,
+        xhdr: Optional[dict] = None,
+    ) -> str:
+        """Deletes an object within a session opened with the node, the same way neofs-cli does it.
+
+        Returns:
+            ID of the tombstone.
+        """
+        network_info = self.network_info(endpoint, signer)
+        session_token = self._create_session(
+            endpoint, signer, network_info, session_types_pb2.ObjectSessionContext.DELETE, cid, [oid]
+        )
+
+        request = object_service_pb2.DeleteRequest()
+        request.body.address.CopyFrom(_address(cid, oid))
+        response = self._unary(
+            endpoint,
+            "object.ObjectService/Delete",
+            self._sign_request(request, signer, network_info, ttl, xhdr, session_token),
+            object_service_pb2.DeleteResponse,
+        )
+        return _encode_id(response.body.tombstone.object_id)
+
+    def search(
+        self,
+        endpoint: str,
+        signer: Signer,
+        cid: str,
+        filters: Iterable[object_types_pb2.SearchFilter] = (),
+        attributes: Iterable[str] = (),
+        count: Optional[int] = None,
+        cursor: Optional[str] = None,
+        ttl: int = DEFAULT_TTL,
+        xhdr: Optional[dict] = None,
+    ) -> tuple[list[tuple[str, list[str]]], Optional[str]]:
+        """Searches objects in a container.
+
+        Returns:
+            List of found object IDs with values of requested attributes and a cursor to continue
+            the search, if any.
+        """
+        request = object_service_pb2.SearchV2Request()
+        request.body.container_id.CopyFrom(_container_id(cid))
+        request.body.version = SEARCH_QUERY_VERSION
+        request.body.filters.extend(filters)
+        request.body.attributes.extend(attributes)
+        request.body.count = count or SEARCH_MAX_COUNT
+        if cursor:
+            request.body.cursor = cursor
+
+        response = self._unary(
+            endpoint,
+            "object.ObjectService/SearchV2",
+            self._sign_request(request, signer, ttl=ttl, xhdr=xhdr),
+            object_service_pb2.SearchV2Response,
+        )
+        found_objects = [(_encode_id(item.id), list(item.attributes)) for item in response.body.result]
+        return found_objects, response.body.cursor or None
+
+    def close(self) -> None:
+        self.channel_pool.close()
+
+    def _is_homomorphic_hashing_disabled(self, endpoint: str, signer: Signer, cid: str) -> bool:
+        # container attributes are immutable, so they are requested once per container
+        with self._lock:
+            if cid in self._homomorphic_hashing_disabled:
+                return self._homomorphic_hashing_disabled[cid]
+
+        request = container_service_pb2.GetRequest()
+        request.body.container_id.CopyFrom(_container_id(cid))
+        response = self._unary(
+            endpoint,
+            "container.ContainerService/Get",
+            self._sign_request(request, signer),
+            container_service_pb2.GetResponse,
+        )
+        disabled = any(
+            attribute.key == DISABLE_HOMOMORPHIC_HASHING_ATTRIBUTE and attribute.value == "true"
+            for attribute in response.body.container.attributes
+        )
+        with self._lock:
+            self._homomorphic_hashing_disabled[cid] = disabled
+        return disabled
+
+    def _create_session(
+        self,
+        endpoint: str,
+        signer: Signer,
+        network_info: NetworkInfo,
+        verb: int,
+        cid: str,
+        oids: list[str],
+    ) -> session_types_pb2.SessionToken:
+        expiration = network_info.current_epoch + SESSION_LIFETIME_EPOCHS
+
+        request = session_service_pb2.CreateRequest()
+        request.body.owner_id.CopyFrom(signer.owner_id)
+        request.body.expiration = expiration
+        response = self._unary(
+            endpoint,
+            "session.SessionService/Create",
+            self._sign_request(request, signer, network_info),
+            session_service_pb2.CreateResponse,
+        )
+
+        session_token = session_types_pb2.SessionToken()
+        body = session_token.body
+        body.id = response.body.id
+        body.owner_id.CopyFrom(signer.owner_id)
+        body.lifetime.exp = expiration
+        body.lifetime.nbf = network_info.current_epoch
+        body.lifetime.iat = network_info.current_epoch
+        body.session_key = response.body.session_key
+        body.object.verb = verb
+        body.object.target.container.CopyFrom(_container_id(cid))
+        for oid in oids:
+            body.object.target.objects.add(value=base58.b58decode(oid))
+        session_token.signature.CopyFrom(signer.sign(body.SerializeToString(deterministic=True)))
+        return session_token
+
+    @staticmethod
+    def _sign_request(
+        request: Message,
+        signer: Signer,
+        network_info: Optional[NetworkInfo] = None,
+        ttl: int = DEFAULT_TTL,
+        xhdr: Optional[dict] = None,
+        session_token: Optional[session_types_pb2.SessionToken] = None,
+    ) -> Message:
+        meta_header = request.meta_header
+        meta_header.version.CopyFrom(API_VERSION)
+        meta_header.ttl = ttl
+        if network_info:
+            meta_header.epoch = network_info.current_epoch
+            meta_header.magic_number = network_info.magic_number
+        for key, value in (xhdr or {}).items():
+            meta_header.x_headers.add(key=key, value=str(value))
+        if session_token is not None:
+            meta_header.session_token.CopyFrom(session_token)
+
+        verify_header = request.verify_header
+        verify_header.body_signature.CopyFrom(signer.sign(request.body.SerializeToString(deterministic=True)))
+        verify_header.meta_signature.CopyFrom(signer.sign(meta_header.SerializeToString(deterministic=True)))
+        # origin is an empty verification header for requests that are not forwarded
+        verify_header.origin_signature.CopyFrom(signer.sign(b""))
+        return request
+
+    @staticmethod
+    def _check_status(method: str, response: Message) -> None:
+        status = response.meta_header.status
+        if status.code != 0:
+            raise ObjectStatusError(method, status.code, status.message)
+
+    def _unary(self, endpoint: str, method: str, request: Message, response_type: type) -> Message:
+        call = self.channel_pool.get(endpoint).unary_unary(
+            f"/neo.fs.v2.{method}",
+            request_serializer=type(request).SerializeToString,
+            response_deserializer=response_type.FromString,
+        )
+        try:
+            response = call(request, timeout=self.timeout)
+        except grpc.RpcError as e:
+            raise RuntimeError(f"{method}: rpc error: {e}") from e
+        self._check_status(method, response)
+        return response
+
+    def _server_stream(self, endpoint: str, method: str, request: Message, response_type: type) -> Iterator[Message]:
+        call = self.channel_pool.get(endpoint).unary_stream(
+            f"/neo.fs.v2.{method}",
+            request_serializer=type(request).SerializeToString,
+            response_deserializer=response_type.FromString,
+        )
+        try:
+            for response in call(request, timeout=self.timeout):
+                self._check_status(method, response)
+                yield response
+        except grpc.RpcError as e:
+            raise RuntimeError(f"{method}: rpc error: {e}") from e
+
+    def _client_stream(
+        self, endpoint: str, method: str, requests: Iterator[Message], request_type: type, response_type: type
+    ) -> Message:
+        call = self.channel_pool.get(endpoint).stream_unary(
+            f"/neo.fs.v2.{method}",
+            request_serializer=request_type.SerializeToString,
+            response_deserializer=response_type.FromString,
+        )
+        try:
+            response = call(requests, timeout=self.timeout)
+        except grpc.RpcError as e:
+            raise RuntimeError(f"{method}: rpc error: {e}") from e
+        self._check_status(method, response)
+        return response
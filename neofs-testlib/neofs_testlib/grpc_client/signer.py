@@ -0,0 +1,80 @@
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+
+import base58
+from ecdsa import NIST256p, SigningKey
+from ecdsa.util import sigencode_string
+
+from neofs_testlib.protobuf.generated.refs import types_pb2 as refs_types_pb2
+from neofs_testlib.utils.keyring import keyring
+
+# signatures of small messages (meta headers, verification headers) repeat between requests a lot,
+# bigger messages (bodies with payload chunks) are unique and are not worth caching
+SIGNATURE_CACHE_MAX_DATA_SIZE = 1024
+SIGNATURE_CACHE_SIZE = 4096
+
+
+class Signer:
+    """Signs NeoFS API messages with a key of the first account of a wallet.
+
+    Signatures are deterministic (RFC 6979), so signatures of small messages are cached.
+    """
+
+    def __init__(self, private_key: bytes, public_key: bytes, address: str):
+        self.private_key = private_key
+        self.public_key = public_key
+        self.address = address
+        self._signing_key = SigningKey.from_string(private_key, curve=NIST256p)
+        self._signatures: OrderedDict[bytes, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @classmethod
+    def from_wallet(cls, wallet_path: str, wallet_password: str) -> "Signer":
+        """Returns a signer for the wallet, signers are cached along with wallets decrypted by the keyring."""
+        wallet = keyring.get_wallet(wallet_path, wallet_password)
+        with _signers_lock:
+            signer = _signers.get(wallet)
+            if signer is None:
+                account = wallet.accounts[0]
+                signer = cls(account.private_key, account.public_key.encode_point(True), account.address)
+                _signers[wallet] = signer
+        return signer
+
+    @property
+    def owner_id(self) -> refs_types_pb2.OwnerID:
+        return refs_types_pb2.OwnerID(value=base58.b58decode(self.address))
+
+    def sign(self, data: bytes) -> refs_types_pb2.Signature:
+        return refs_types_pb2.Signature(
+            key=self.public_key,
+            sign=self._sign(data),
+            scheme=refs_types_pb2.SignatureScheme.ECDSA_RFC6979_SHA256,
+        )
+
+    def _sign(self, data: bytes) -> bytes:
+        if len(data) > SIGNATURE_CACHE_MAX_DATA_SIZE:
+            return self._signing_key.sign_deterministic(data, hashfunc=hashlib.sha256, sigencode=sigencode_string)
+
+        with self._lock:
+            signature = self._signatures.get(data)
+            if signature is not None:
+                self._signatures.move_to_end(data)
+                self.cache_hits += 1
+                return signature
+
+        signature = self._signing_key.sign_deterministic(data, hashfunc=hashlib.sha256, sigencode=sigencode_string)
+        with self._lock:
+            self.cache_misses += 1
+            self._signatures[data] = signature
+            if len(self._signatures) > SIGNATURE_CACHE_SIZE:
+                self._signatures.popitem(last=False)
+        return signature
+
+
+# signers live as long as their wallets stay in the keyring
+_signers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_signers_lock = threading.Lock()
@@ -0,0 +1,162 @@
+import os
+import shlex
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from neofs_testlib.defaults import Options
+from neofs_testlib.shell.interfaces import CommandInspector, CommandOptions, CommandResult
+from neofs_testlib.shell.local_shell import LocalShell
+
+# characters that have special meaning for /bin/sh outside of quotes
+SHELL_SPECIAL_CHARS = set("|&;<>()$`\\*?[]{}~#\n")
+# characters that have special meaning for /bin/sh inside of double quotes
+SHELL_SPECIAL_CHARS_IN_DOUBLE_QUOTES = set("$`\\")
+
+
+def split_command(command: str) -> Optional[list[str]]:
+    """Splits command into arguments the same way /bin/sh does it.
+
+    Args:
+        command: Command to split.
+
+    Returns:
+        List of arguments or None if the command uses shell features (pipes, redirects, variables, globs etc.)
+        and can't be executed without a shell.
+    """
+    quote = None
+    for char in command:
+        if quote == "'":
+            if char == "'":
+                quote = None
+        elif quote == '"':
+            if char == '"':
+                quote = None
+            elif char in SHELL_SPECIAL_CHARS_IN_DOUBLE_QUOTES:
+                return None
+        elif char in ("'", '"'):
+            quote = char
+        elif char in SHELL_SPECIAL_CHARS:
+            return None
+    if quote:
+        return None
+
+    argv = shlex.split(command)
+    # leading variable assignments (FOO=bar cmd) are handled by a shell as well
+    if not argv or "=" in argv[0]:
+        return None
+    return argv
+
+
+def command_label(argv: list[str]) -> str:
+    """Returns a short label of a command: binary name and its subcommands.
+
+    Global options that go before subcommands are expected to have values, e.g.
+    `neofs-cli --config /path/to/config object put --cid ...` results in `neofs-cli object put`.
+    """
+    words = [os.path.basename(argv[0])]
+    i = 1
+    while i < len(argv) and argv[i].startswith("-"):
+        i += 2
+    while i < len(argv) and not argv[i].startswith("-"):
+        words.append(argv[i])
+        i += 1
+    return " ".join(words)
+
+
+@dataclass
+class CommandLatency:
+    """Aggregated latency of a command.
+
+    Attributes:
+        count: Number of executions.
+        total: Total execution time (in seconds).
+        max: Longest execution time (in seconds).
+    """
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def average(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class CommandLatencyStats:
+    """Thread-safe accumulator of command latencies grouped by command label."""
+
+    def __init__(self):
+        self._latencies: dict[str, CommandLatency] = {}
+        self._lock = threading.Lock()
+
+    def record(self, label: str, elapsed: float) -> None:
+        with self._lock:
+            latency = self._latencies.setdefault(label, CommandLatency())
+            latency.count += 1
+            latency.total += elapsed
+            latency.max = max(latency.max, elapsed)
+
+    def summary(self) -> dict[str, CommandLatency]:
+        with self._lock:
+            return {label: CommandLatency(**vars(latency)) for label, latency in self._latencies.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._latencies.clear()
+
+    def format(self) -> str:
+        """Returns a text table with latencies, most time-consuming commands first."""
+        lines = [f"{'COMMAND':<50} {'COUNT':>8} {'TOTAL, s':>10} {'AVG, ms':>10} {'MAX, ms':>10}"]
+        for label, latency in sorted(self.summary().items(), key=lambda item: item[1].total, reverse=True):
+            lines.append(
+                f"{label:<50} {latency.count:>8} {latency.total:>10.2f} "
+                f"{latency.average * 1000:>10.1f} {latency.max * 1000:>10.1f}"
+            )
+        return "\n".join(lines)
+
+    def __getstate__(self):
+        return {"_latencies": self._latencies}
+
+    def __setstate__(self, state):
+        self._latencies = state["_latencies"]
+        self._lock = threading.Lock()
+
+
+class DirectShell(LocalShell):
+    """Implements command shell on a local machine that runs commands without an intermediate /bin/sh.
+
+    Commands that rely on shell features (pipes, redirects, variables, globs) are still executed
+    via /bin/sh. Execution time of every command is accumulated in `latency_stats`.
+    """
+
+    def __init__(self, command_inspectors: Optional[list[CommandInspector]] = None) -> None:
+        super().__init__(command_inspectors)
+        self.latency_stats = CommandLatencyStats()
+
+    def exec(self, command: str, options: Optional[CommandOptions] = None) -> CommandResult:
+        start_time = time.perf_counter()
+        try:
+            return super().exec(command, options)
+        finally:
+            argv = split_command(command) or command.split(maxsplit=1)[:1]
+            self.latency_stats.record(command_label(argv) if argv else "", time.perf_counter() - start_time)
+
+    def _run(self, command: str, options: CommandOptions) -> subprocess.CompletedProcess:
+        argv = split_command(command)
+        if argv is None:
+            return super()._run(command, options)
+        try:
+            return subprocess.run(
+                argv,
+                check=options.check,
+                universal_newlines=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                timeout=options.timeout if options.timeout else Options.get_default_shell_timeout(),
+            )
+        except (FileNotFoundError, PermissionError):
+            # let the shell report a missing binary with its usual return code and message
+            return super()._run(command, options)
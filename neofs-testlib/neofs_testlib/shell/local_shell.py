@@ -73,15 +73,7 @@ class LocalShell(Shell):
         result = None
 
         try:
-            command_process = subprocess.run(
-                command,
-                check=options.check,
-                universal_newlines=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                timeout=options.timeout if options.timeout else Options.get_default_shell_timeout(),
-                shell=True,
-            )
+            command_process = self._run(command, options)
 
             result = CommandResult(
                 stdout=command_process.stdout or "",
@@ -122,6 +114,17 @@ class LocalShell(Shell):
             self._report_command_result(command, start_time, end_time, result)
         return result
 
+    def _run(self, command: str, options: CommandOptions) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            command,
+            check=options.check,
+            universal_newlines=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            timeout=options.timeout if options.timeout else Options.get_default_shell_timeout(),
+            shell=True,
+        )
+
     def _get_pexpect_process_result(self, command_process: pexpect.spawn) -> CommandResult:
         """
         Captures output of the process.
@@ -5,6 +5,8 @@ import json
 import base58
 from neo3.wallet import wallet as neo3_wallet
 
+from neofs_testlib.utils.keyring import keyring
+
 
 def str_to_ascii_hex(input: str) -> str:
     b = binascii.hexlify(input.encode())
@@ -64,6 +66,5 @@ def get_wif_from_private_key(priv_key: bytes) -> str:
 
 
 def load_wallet(path: str, passwd: str = "", passwords=None) -> neo3_wallet.Wallet:
-    with open(path, "r") as wallet_file:
-        wlt_data = wallet_file.read()
-    return neo3_wallet.Wallet.from_json(json.loads(wlt_data), passwords=passwords if passwords else [passwd])
+    """Returns wallet decrypted via process-wide keyring, the wallet is shared and must not be modified."""
+    return keyring.get_wallet(path, wallet_passwords=passwords if passwords else [passwd])
@@ -0,0 +1,126 @@
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+from neo3.wallet import account as neo3_account
+from neo3.wallet import wallet as neo3_wallet
+
+
+class Keyring:
+    """Process-wide cache of decrypted wallets.
+
+    Decryption of NEP-2 keys uses scrypt and takes tens of milliseconds per account, so wallets are
+    decrypted once and kept by (path, mtime, size, passwords). A wallet file rewritten in place gets
+    a new key and is decrypted again. Cached wallets are shared between callers and must not be modified.
+    """
+
+    def __init__(self):
+        self._wallets: dict[tuple, neo3_wallet.Wallet] = {}
+        self._key_locks: dict[tuple, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_wallet(
+        self,
+        wallet_path: str,
+        wallet_password: Optional[str] = None,
+        wallet_passwords: Optional[list[str]] = None,
+    ) -> neo3_wallet.Wallet:
+        """Returns decrypted wallet.
+
+        Args:
+            wallet_path: The path to the wallet.
+            wallet_password: The password for all accounts of the wallet, takes precedence over `wallet_passwords`.
+            wallet_passwords: The password list for the given accounts in the wallet.
+                If neither is set, accounts are loaded as watch-only.
+
+        Returns:
+            Wallet with decrypted accounts.
+        """
+        path = os.path.realpath(wallet_path)
+        stat = os.stat(path)
+        passwords = wallet_password if wallet_password is not None else tuple(wallet_passwords or ())
+        key = (path, stat.st_mtime_ns, stat.st_size, passwords)
+
+        with self._lock:
+            wallet = self._wallets.get(key)
+            if wallet is not None:
+                self.hits += 1
+                return wallet
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # wallets are decrypted concurrently, but each one only once
+        with key_lock:
+            with self._lock:
+                wallet = self._wallets.get(key)
+                if wallet is not None:
+                    self.hits += 1
+                    return wallet
+            try:
+                wallet = _decrypt_wallet(path, wallet_password, wallet_passwords)
+            finally:
+                with self._lock:
+                    self._key_locks.pop(key, None)
+            with self._lock:
+                self.misses += 1
+                # entries of the previous versions of the file are stale now
+                for stale_key in [k for k in self._wallets if k[0] == path and k[1:3] != key[1:3]]:
+                    del self._wallets[stale_key]
+                self._wallets[key] = wallet
+        return wallet
+
+    def get_accounts(
+        self,
+        wallet_path: str,
+        wallet_password: Optional[str] = None,
+        wallet_passwords: Optional[list[str]] = None,
+    ) -> list[neo3_account.Account]:
+        return list(self.get_wallet(wallet_path, wallet_password, wallet_passwords).accounts)
+
+    def invalidate(self, wallet_path: Optional[str] = None) -> None:
+        """Drops cached wallet by path or the whole cache if path is not specified."""
+        path = os.path.realpath(wallet_path) if wallet_path is not None else None
+        with self._lock:
+            for key in [key for key in self._wallets if path is None or key[0] == path]:
+                del self._wallets[key]
+
+
+def _decrypt_wallet(
+    path: str, wallet_password: Optional[str], wallet_passwords: Optional[list[str]]
+) -> neo3_wallet.Wallet:
+    with open(path) as wallet_file:
+        wallet_json = json.load(wallet_file)
+    if wallet_password is not None:
+        wallet_passwords = [wallet_password] * len(wallet_json["accounts"])
+    return neo3_wallet.Wallet.from_json(wallet_json, passwords=wallet_passwords)
+
+
+keyring = Keyring()
+
+
+def benchmark(wallet_path: str, wallet_password: str, iterations: int = 20) -> dict[str, float]:
+    """Measures per-call time of wallet loading with and without the keyring.
+
+    Args:
+        wallet_path: The path to the wallet.
+        wallet_password: The password for the wallet.
+        iterations: Number of calls to measure.
+
+    Returns:
+        Average time of a call in seconds for `uncached` and `cached` loading.
+    """
+    start = time.perf_counter()
+    for _ in range(iterations):
+        _decrypt_wallet(wallet_path, wallet_password, None)
+    uncached = (time.perf_counter() - start) / iterations
+
+    local_keyring = Keyring()
+    local_keyring.get_wallet(wallet_path, wallet_password)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        local_keyring.get_wallet(wallet_path, wallet_password)
+    cached = (time.perf_counter() - start) / iterations
+    return {"uncached": uncached, "cached": cached}
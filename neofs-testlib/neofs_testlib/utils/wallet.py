@@ -5,6 +5,7 @@ from neo3.wallet import account as neo3_account
 from neo3.wallet import wallet as neo3_wallet
 
 from neofs_testlib.cli.neogo import NeoGo
+from neofs_testlib.utils.keyring import keyring
 
 logger = logging.getLogger("neofs.testlib.utils")
 
@@ -21,6 +22,7 @@ def init_wallet(wallet_path: str, wallet_password: str) -> str:
     wallet.account_add(account)
     with open(wallet_path, "w") as out:
         json.dump(wallet.to_json(wallet_password), out)
+    keyring.invalidate(wallet_path)
     logger.info(f"Init new wallet: {wallet_path}, address: {account.address}")
     return account.address
 
@@ -40,11 +42,7 @@ def get_last_address_from_wallet(
     if wallet_password is None and wallet_passwords is None:
         raise ValueError("Either wallet_password or wallet_passwords should be specified")
 
-    with open(wallet_path) as wallet_file:
-        wallet_json = json.load(wallet_file)
-        if wallet_password is not None:
-            wallet_passwords = [wallet_password] * len(wallet_json["accounts"])
-        wallet = neo3_wallet.Wallet.from_json(wallet_json, passwords=wallet_passwords)
+    wallet = keyring.get_wallet(wallet_path, wallet_password, wallet_passwords)
     address = wallet.accounts[-1].address
     logger.info(f"got address: {address}")
     return address
@@ -65,12 +63,8 @@ def get_accounts_from_wallet(
     if wallet_password is None and wallet_passwords is None:
         raise ValueError("Either wallet_password or wallet_passwords should be specified")
 
-    with open(wallet_path) as wallet_file:
-        wallet_json = json.load(wallet_file)
-        if wallet_password is not None:
-            wallet_passwords = [wallet_password] * len(wallet_json["accounts"])
-        wallet = neo3_wallet.Wallet.from_json(wallet_json, passwords=wallet_passwords)
-    return wallet.accounts
+    wallet = keyring.get_wallet(wallet_path, wallet_password, wallet_passwords)
+    return list(wallet.accounts)
 
 
 def get_last_public_key_from_wallet(
@@ -88,11 +82,7 @@ def get_last_public_key_from_wallet(
     if wallet_password is None and wallet_passwords is None:
         raise ValueError("Either wallet_password or wallet_passwords should be specified")
 
-    with open(wallet_path) as wallet_file:
-        wallet_json = json.load(wallet_file)
-        if wallet_password is not None:
-            wallet_passwords = [wallet_password] * len(wallet_json["accounts"])
-        wallet = neo3_wallet.Wallet.from_json(wallet_json, passwords=wallet_passwords)
+    wallet = keyring.get_wallet(wallet_path, wallet_password, wallet_passwords)
     public_key = wallet.accounts[-1].public_key
     logger.info(f"got public_key: {public_key}")
     return public_key
@@ -0,0 +1,151 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import TestCase
+from unittest.mock import patch
+
+from neofs_testlib.blockchain import BlockWatcher, NeoRPCException, get_block_watcher, stop_block_watchers
+
+CONTRACT_HASH = "0x" + "ab" * 20
+
+
+class FakeChain:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.blocks = [{"index": 0, "tx": []}]
+        self.application_logs = {}
+        self.available = True
+
+    def add_block(self, *transactions: tuple[str, list[dict]]) -> int:
+        with self.lock:
+            index = len(self.blocks)
+            self.blocks.append({"index": index, "tx": [{"hash": tx_hash} for tx_hash, _ in transactions]})
+            for tx_hash, notifications in transactions:
+                self.application_logs[tx_hash] = {
+                    "txid": tx_hash,
+                    "executions": [{"vmstate": "HALT", "notifications": notifications}],
+                }
+            return index
+
+    def handle(self, call: dict) -> dict:
+        method, params = call["method"], call["params"]
+        with self.lock:
+            if method == "getblockcount":
+                result = len(self.blocks)
+            elif method == "getblock":
+                result = self.blocks[params[0]]
+            elif method == "getapplicationlog" and params[0] in self.application_logs:
+                result = self.application_logs[params[0]]
+            else:
+                return {"jsonrpc": "2.0", "id": call["id"], "error": {"code": -100, "message": "Unknown transaction"}}
+        return {"jsonrpc": "2.0", "id": call["id"], "result": result}
+
+
+class FakeChainHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if not self.server.chain.available:
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if isinstance(request, list):
+            response = [self.server.chain.handle(call) for call in request]
+        else:
+            response = self.server.chain.handle(request)
+
+        body = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestBlockWatcher(TestCase):
+    def setUp(self):
+        self.chain = FakeChain()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeChainHandler)
+        self.server.chain = self.chain
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.watcher = BlockWatcher(f"http://127.0.0.1:{self.server.server_port}", poll_interval=0.01)
+        self.watcher.start()
+
+    def tearDown(self):
+        self.watcher.stop()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_await_height(self):
+        self.assertEqual(0, self.watcher.await_height(0).result(timeout=1))
+
+        futures = [self.watcher.await_height(height) for height in (1, 2)]
+        self.chain.add_block()
+        self.assertEqual(1, futures[0].result(timeout=5))
+        self.assertFalse(futures[1].done())
+        self.chain.add_block()
+        self.assertEqual(2, futures[1].result(timeout=5))
+
+    def test_await_transaction(self):
+        accepted = self.watcher.await_transaction("0x01")
+        pending = [self.watcher.await_transaction("0x02") for _ in range(3)]
+        self.assertFalse(accepted.done())
+
+        self.chain.add_block(("0x01", []))
+        self.assertEqual("HALT", accepted.result(timeout=5)["executions"][0]["vmstate"])
+
+        self.chain.add_block(("0x02", []))
+        self.assertEqual(["0x02"] * 3, [future.result(timeout=5)["txid"] for future in pending])
+
+        # transaction is already in chain
+        self.assertEqual("0x01", self.watcher.await_transaction("01").result(timeout=1)["txid"])
+
+    def test_expired_transaction(self):
+        future = self.watcher.await_transaction("0x03", valid_until_block=1)
+        self.chain.add_block()
+        self.chain.add_block()
+        with self.assertRaisesRegex(NeoRPCException, "expired at block 2"):
+            future.result(timeout=5)
+
+    def test_await_notification(self):
+        transfer = self.watcher.await_notification(CONTRACT_HASH, "Transfer")
+        large_deposit = self.watcher.await_notification(
+            CONTRACT_HASH.upper().replace("0X", ""), "Deposit", lambda notification: notification["state"] > 10
+        )
+
+        self.chain.add_block(("0x04", [{"contract": CONTRACT_HASH, "eventname": "Deposit", "state": 5}]))
+        self.chain.add_block(
+            ("0x05", [{"contract": CONTRACT_HASH, "eventname": "Transfer", "state": 1}]),
+            ("0x06", [{"contract": CONTRACT_HASH, "eventname": "Deposit", "state": 50}]),
+        )
+        self.assertEqual("0x05", transfer.result(timeout=5)["txid"])
+        self.assertEqual(50, large_deposit.result(timeout=5)["state"])
+
+    def test_stop_cancels_futures(self):
+        future = self.watcher.await_height(100)
+        self.watcher.stop()
+        self.assertTrue(future.cancelled())
+
+    def test_watcher_stops_when_node_is_unreachable(self):
+        future = self.watcher.await_height(100)
+        self.chain.available = False
+        with patch("neofs_testlib.blockchain.block_watcher.BLOCK_POLL_MAX_INTERVAL", 0.05):
+            with self.assertRaisesRegex(NeoRPCException, "Could not poll new blocks"):
+                future.result(timeout=10)
+
+    def test_stop_shared_watchers(self):
+        watcher = get_block_watcher(self.watcher.endpoint)
+        self.assertIs(watcher, get_block_watcher(self.watcher.endpoint))
+        future = watcher.await_height(100)
+
+        stop_block_watchers([])
+        self.assertFalse(future.done())
+        stop_block_watchers([self.watcher.endpoint])
+        self.assertTrue(future.cancelled())
+        self.assertIsNot(watcher, get_block_watcher(self.watcher.endpoint))
+        stop_block_watchers()
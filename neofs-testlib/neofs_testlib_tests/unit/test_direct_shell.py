@@ -0,0 +1,82 @@
+from unittest import TestCase
+
+from helpers import format_error_details
+from neofs_testlib.shell.direct_shell import DirectShell, command_label, split_command
+from neofs_testlib.shell.interfaces import CommandOptions
+
+
+class TestSplitCommand(TestCase):
+    def test_plain_command(self):
+        self.assertEqual(
+            ["neofs-cli", "--config", "/tmp/cfg", "object", "put", "--attributes", "a=1,b=2"],
+            split_command("neofs-cli --config /tmp/cfg object put  --attributes 'a=1,b=2'"),
+        )
+
+    def test_special_chars_in_quotes(self):
+        self.assertEqual(
+            ["neofs-cli", "--filters", "FileName EQ $x|y", "--json", '{"a": [1]}'],
+            split_command("neofs-cli --filters 'FileName EQ $x|y' --json '{\"a\": [1]}'"),
+        )
+
+    def test_commands_that_need_shell(self):
+        for command in (
+            "cat file | grep x",
+            "echo test > file",
+            "ls *.log",
+            "echo $HOME",
+            'echo "$HOME"',
+            "FOO=bar env",
+            "true && false",
+            "echo 'unterminated",
+        ):
+            with self.subTest(command=command):
+                self.assertIsNone(split_command(command))
+
+    def test_command_label(self):
+        self.assertEqual(
+            "neofs-cli object put",
+            command_label(["./bin/neofs-cli", "--config", "/tmp/cfg", "object", "put", "--cid", "x"]),
+        )
+        self.assertEqual("neo-go", command_label(["neo-go", "--version"]))
+
+
+class TestDirectShell(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.shell = DirectShell()
+
+    def test_successful_command(self):
+        result = self.shell.exec("python3 -c \"print('test')\"")
+
+        self.assertEqual(0, result.return_code)
+        self.assertEqual("test", result.stdout.strip())
+        self.assertEqual("", result.stderr)
+
+    def test_command_with_shell_features(self):
+        result = self.shell.exec("echo test | tr a-z A-Z")
+
+        self.assertEqual("TEST", result.stdout.strip())
+
+    def test_invalid_command_without_check(self):
+        result = self.shell.exec('python3 -c "invalid script"', CommandOptions(check=False))
+
+        self.assertEqual(1, result.return_code)
+        self.assertIn("Error", result.stdout)
+
+    def test_non_existing_binary(self):
+        with self.assertRaises(RuntimeError) as exc:
+            self.shell.exec("not-a-command")
+
+        error = format_error_details(exc.exception)
+        self.assertIn("return code: 127", error)
+
+    def test_latency_stats(self):
+        shell = DirectShell()
+        shell.exec("python3 -c pass")
+        shell.exec("python3 -c pass")
+
+        latency = shell.latency_stats.summary()["python3"]
+        self.assertEqual(2, latency.count)
+        self.assertGreater(latency.total, 0)
+        self.assertGreaterEqual(latency.total, latency.max)
+        self.assertIn("python3", shell.latency_stats.format())
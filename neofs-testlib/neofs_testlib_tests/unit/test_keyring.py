@@ -0,0 +1,55 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from neofs_testlib.grpc_client import Signer
+from neofs_testlib.utils.keyring import Keyring, benchmark, keyring
+from neofs_testlib.utils.wallet import get_last_address_from_wallet, init_wallet
+
+
+class TestKeyring(TestCase):
+    PASSWORD = "password"
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.wallet_path = os.path.join(self.tmp_dir.name, "wallet.json")
+        self.address = init_wallet(self.wallet_path, self.PASSWORD)
+
+    def tearDown(self):
+        keyring.invalidate(self.wallet_path)
+        self.tmp_dir.cleanup()
+
+    def test_wallet_is_decrypted_once(self):
+        local_keyring = Keyring()
+        wallet = local_keyring.get_wallet(self.wallet_path, self.PASSWORD)
+        self.assertIs(wallet, local_keyring.get_wallet(self.wallet_path, self.PASSWORD))
+        self.assertIs(
+            wallet, local_keyring.get_wallet(self.wallet_path, wallet_passwords=None, wallet_password="password")
+        )
+        self.assertEqual((1, 2), (local_keyring.misses, local_keyring.hits))
+        self.assertEqual(self.address, wallet.accounts[0].address)
+
+        with self.assertRaises(ValueError):
+            local_keyring.get_wallet(self.wallet_path, "wrong_password")
+
+        local_keyring.invalidate(self.wallet_path)
+        self.assertIsNot(wallet, local_keyring.get_wallet(self.wallet_path, self.PASSWORD))
+
+    def test_rewritten_wallet(self):
+        self.assertEqual(self.address, get_last_address_from_wallet(self.wallet_path, self.PASSWORD))
+
+        new_address = init_wallet(self.wallet_path, self.PASSWORD)
+        self.assertNotEqual(self.address, new_address)
+        self.assertEqual(new_address, get_last_address_from_wallet(self.wallet_path, self.PASSWORD))
+
+    def test_signer_shares_keyring(self):
+        signer = Signer.from_wallet(self.wallet_path, self.PASSWORD)
+        self.assertIs(signer, Signer.from_wallet(self.wallet_path, self.PASSWORD))
+        self.assertEqual(self.address, signer.address)
+
+        keyring.invalidate(self.wallet_path)
+        self.assertIsNot(signer, Signer.from_wallet(self.wallet_path, self.PASSWORD))
+
+    def test_benchmark(self):
+        result = benchmark(self.wallet_path, self.PASSWORD, iterations=3)
+        self.assertLess(result["cached"] * 100, result["uncached"])
@@ -0,0 +1,197 @@
+import hashlib
+from concurrent import futures
+from unittest import TestCase
+
+import base58
+import grpc
+from ecdsa import NIST256p, SigningKey
+from neofs_testlib.grpc_client import ObjectClient, ObjectStatusError, ObjectTooLargeError, Signer
+from neofs_testlib.grpc_client.object_client import object_to_json, parse_search_filter
+from neofs_testlib.protobuf.generated.container import service_pb2 as container_service_pb2
+from neofs_testlib.protobuf.generated.netmap import service_pb2 as netmap_service_pb2
+from neofs_testlib.protobuf.generated.object import service_pb2 as object_service_pb2
+from neofs_testlib.protobuf.generated.object import types_pb2 as object_types_pb2
+
+CID = base58.b58encode(b"\x01" * 32).decode()
+OWNER_ADDRESS = "NbUgTSFvPmsRxmGeWpuuGeJUoRoi6PErcM"
+MAX_OBJECT_SIZE = 1024
+
+
+class FakeObjectService:
+    """Minimal in-memory implementation of services used by the object client."""
+
+    def __init__(self):
+        self.objects: dict[bytes, tuple[object_types_pb2.Header, bytes]] = {}
+
+    def network_info(self, request, context):
+        response = netmap_service_pb2.NetworkInfoResponse()
+        response.body.network_info.current_epoch = 7
+        response.body.network_info.network_config.parameters.add(
+            key=b"MaxObjectSize", value=MAX_OBJECT_SIZE.to_bytes(8, "little")
+        )
+        return response
+
+    def get_container(self, request, context):
+        response = container_service_pb2.GetResponse()
+        response.body.container.attributes.add(key="__NEOFS__DISABLE_HOMOMORPHIC_HASHING", value="true")
+        return response
+
+    def put(self, requests, context):
+        header, payload = None, b""
+        for request in requests:
+            if request.body.WhichOneof("object_part") == "init":
+                header = request.body.init.header
+                object_id = request.body.init.object_id.value
+            else:
+                payload += request.body.chunk
+        self.objects[object_id] = (header, payload)
+        response = object_service_pb2.PutResponse()
+        response.body.object_id.value = object_id
+        return response
+
+    def head(self, request, context):
+        response = object_service_pb2.HeadResponse()
+        stored = self.objects.get(request.body.address.object_id.value)
+        if stored is None:
+            response.meta_header.status.code = 2049
+            response.meta_header.status.message = "object not found"
+            return response
+        response.body.header.header.CopyFrom(stored[0])
+        return response
+
+    def get(self, request, context):
+        header, payload = self.objects[request.body.address.object_id.value]
+        response = object_service_pb2.GetResponse()
+        response.body.init.header.CopyFrom(header)
+        yield response
+        for offset in range(0, len(payload), 100):
+            response = object_service_pb2.GetResponse()
+            response.body.chunk = payload[offset : offset + 100]
+            yield response
+
+    def get_range(self, request, context):
+        _, payload = self.objects[request.body.address.object_id.value]
+        response = object_service_pb2.GetRangeResponse()
+        offset = request.body.range.offset
+        response.body.chunk = payload[offset : offset + request.body.range.length]
+        yield response
+
+    def handlers(self) -> list:
+        def unary(handler, request_type, response_type):
+            return grpc.unary_unary_rpc_method_handler(
+                handler,
+                request_deserializer=request_type.FromString,
+                response_serializer=response_type.SerializeToString,
+            )
+
+        def server_stream(handler, request_type, response_type):
+            return grpc.unary_stream_rpc_method_handler(
+                handler,
+                request_deserializer=request_type.FromString,
+                response_serializer=response_type.SerializeToString,
+            )
+
+        return [
+            grpc.method_handlers_generic_handler(
+                "neo.fs.v2.netmap.NetmapService",
+                {
+                    "NetworkInfo": unary(
+                        self.network_info,
+                        netmap_service_pb2.NetworkInfoRequest,
+                        netmap_service_pb2.NetworkInfoResponse,
+                    )
+                },
+            ),
+            grpc.method_handlers_generic_handler(
+                "neo.fs.v2.container.ContainerService",
+                {"Get": unary(self.get_container, container_service_pb2.GetRequest, container_service_pb2.GetResponse)},
+            ),
+            grpc.method_handlers_generic_handler(
+                "neo.fs.v2.object.ObjectService",
+                {
+                    "Put": grpc.stream_unary_rpc_method_handler(
+                        self.put,
+                        request_deserializer=object_service_pb2.PutRequest.FromString,
+                        response_serializer=object_service_pb2.PutResponse.SerializeToString,
+                    ),
+                    "Head": unary(self.head, object_service_pb2.HeadRequest, object_service_pb2.HeadResponse),
+                    "Get": server_stream(self.get, object_service_pb2.GetRequest, object_service_pb2.GetResponse),
+                    "GetRange": server_stream(
+                        self.get_range, object_service_pb2.GetRangeRequest, object_service_pb2.GetRangeResponse
+                    ),
+                },
+            ),
+        ]
+
+
+class TestObjectClient(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.service = FakeObjectService()
+        cls.server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+        cls.server.add_generic_rpc_handlers(cls.service.handlers())
+        port = cls.server.add_insecure_port("127.0.0.1:0")
+        cls.server.start()
+        cls.endpoint = f"127.0.0.1:{port}"
+
+        signing_key = SigningKey.generate(curve=NIST256p)
+        cls.signer = Signer(
+            signing_key.to_string(), signing_key.get_verifying_key().to_string("compressed"), OWNER_ADDRESS
+        )
+        cls.client = ObjectClient()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.close()
+        cls.server.stop(None)
+
+    def test_put_get_head_range(self):
+        payload = bytes(range(256)) * 3
+        oid = self.client.put(self.endpoint, self.signer, CID, payload, attributes={"FileName": "cat.jpg"}, lifetime=3)
+
+        header, stored_payload = self.service.objects[base58.b58decode(oid)]
+        self.assertEqual(payload, stored_payload)
+        self.assertEqual(base58.b58decode(oid), hashlib.sha256(header.SerializeToString(deterministic=True)).digest())
+        self.assertEqual(7, header.creation_epoch)
+        self.assertEqual(
+            {"FileName": "cat.jpg", "__NEOFS__EXPIRATION_EPOCH": "10"},
+            {attribute.key: attribute.value for attribute in header.attributes},
+        )
+
+        obj, received_payload = self.client.get(self.endpoint, self.signer, CID, oid)
+        self.assertEqual(payload, received_payload)
+        self.assertEqual(len(payload), obj.header.payload_length)
+
+        obj = self.client.head(self.endpoint, self.signer, CID, oid)
+        head_json = object_to_json(obj)
+        self.assertEqual(str(len(payload)), head_json["header"]["payloadLength"])
+        self.assertIsNone(head_json["header"]["split"])
+
+        self.assertEqual(payload[10:30], self.client.get_range(self.endpoint, self.signer, CID, oid, 10, 20))
+
+    def test_status_error(self):
+        missing_oid = base58.b58encode(b"\x02" * 32).decode()
+        with self.assertRaisesRegex(ObjectStatusError, "code = 2049.*message = object not found"):
+            self.client.head(self.endpoint, self.signer, CID, missing_oid)
+
+    def test_too_large_object(self):
+        with self.assertRaises(ObjectTooLargeError):
+            self.client.put(self.endpoint, self.signer, CID, b"0" * (MAX_OBJECT_SIZE + 1))
+
+    def test_signature_cache(self):
+        hits = self.signer.cache_hits
+        first = self.signer.sign(b"meta header")
+        second = self.signer.sign(b"meta header")
+
+        self.assertEqual(first, second)
+        self.assertEqual(hits + 1, self.signer.cache_hits)
+
+    def test_parse_search_filter(self):
+        search_filter = parse_search_filter("FileName EQ cat dog.jpg")
+        self.assertEqual("FileName", search_filter.key)
+        self.assertEqual(object_types_pb2.MatchType.STRING_EQUAL, search_filter.match_type)
+        self.assertEqual("cat dog.jpg", search_filter.value)
+
+        self.assertEqual(object_types_pb2.MatchType.NOT_PRESENT, parse_search_filter("Color NOPRESENT").match_type)
+        with self.assertRaises(ValueError):
+            parse_search_filter("/path/to/filters.json")
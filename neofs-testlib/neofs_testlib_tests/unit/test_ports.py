@@ -0,0 +1,56 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from neofs_testlib.env.ports import PortAllocator, new_ports_owner
+
+
+class TestPortAllocator(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.ports_file = os.path.join(self.tmp_dir.name, "ports.txt")
+        self.allocator = PortAllocator(
+            self.ports_file, os.path.join(self.tmp_dir.name, "ports.lock"), block_size=8, port_range=(20000, 32000)
+        )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _reserved_ports(self) -> dict[int, str]:
+        with open(self.ports_file) as f:
+            return {int(port): owner for port, owner in (line.split(" ") for line in f.read().splitlines())}
+
+    def test_ports_are_reserved_in_blocks(self):
+        owner = new_ports_owner()
+        ports = [self.allocator.get_port(owner) for _ in range(3)]
+
+        self.assertEqual(len(set(ports)), 3)
+        reserved_ports = self._reserved_ports()
+        self.assertGreaterEqual(len(reserved_ports), 4)
+        self.assertTrue(set(ports).issubset(reserved_ports))
+        self.assertEqual(set(reserved_ports.values()), {owner})
+        self.assertLess(max(reserved_ports) - min(reserved_ports), 8)
+
+    def test_release_removes_only_owner_ports(self):
+        first_owner, second_owner = new_ports_owner(), new_ports_owner()
+        first_port = self.allocator.get_port(first_owner)
+        second_port = self.allocator.get_port(second_owner)
+
+        self.allocator.release(first_owner)
+
+        reserved_ports = self._reserved_ports()
+        self.assertNotIn(first_port, reserved_ports)
+        self.assertEqual(reserved_ports[second_port], second_owner)
+        self.assertNotEqual(self.allocator.get_port(second_owner), second_port)
+
+    def test_release_stale_removes_ports_of_dead_processes(self):
+        with open(self.ports_file, "w") as f:
+            f.write("21000 999999999-dead\n21001\n")
+        port = self.allocator.get_port()
+
+        self.allocator.release_stale()
+
+        reserved_ports = self._reserved_ports()
+        self.assertNotIn(21000, reserved_ports)
+        self.assertNotIn(21001, reserved_ports)
+        self.assertEqual(reserved_ports[port], self.allocator.process_owner)
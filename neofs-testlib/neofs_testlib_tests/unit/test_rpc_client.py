@@ -0,0 +1,92 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import TestCase, skipIf
+
+from neofs_testlib.blockchain import AsyncRPCClient, NeoRPCException, RPCClient
+from neofs_testlib.blockchain.rpc_client import aiohttp
+
+
+class JSONRPCHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.server.requests_count += 1
+        self.server.connections.add(self.client_address)
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if isinstance(request, list):
+            # reply in reversed order to check that client matches responses by id
+            response = [self._handle(call) for call in reversed(request)]
+        else:
+            response = self._handle(request)
+
+        body = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, call: dict) -> dict:
+        if call["method"] == "getstorage":
+            return {"jsonrpc": "2.0", "id": call["id"], "result": "value-" + call["params"][1]}
+        return {"jsonrpc": "2.0", "id": call["id"], "error": {"code": -32601, "message": "Method not found"}}
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestRPCClient(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), JSONRPCHandler)
+        cls.server.requests_count = 0
+        cls.server.connections = set()
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.endpoint = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.requests_count = 0
+        self.server.connections.clear()
+
+    def test_call(self):
+        client = RPCClient(self.endpoint)
+        self.assertEqual("value-key", client.get_storage("0x01", "key"))
+        self.assertIn("error", client.get_application_log("0x02"))
+
+    def test_connection_reuse(self):
+        for i in range(5):
+            RPCClient(self.endpoint).get_storage("0x01", str(i))
+        self.assertEqual(5, self.server.requests_count)
+        self.assertEqual(1, len(self.server.connections))
+
+    def test_batch(self):
+        batch = RPCClient(self.endpoint).batch()
+        self.assertEqual(0, batch.get_storage("0x01", "a"))
+        self.assertEqual(1, batch.get_application_log("0x02"))
+        self.assertEqual(2, batch.get_storage("0x01", "b"))
+
+        results = batch.execute()
+        self.assertEqual(1, self.server.requests_count)
+        self.assertEqual("value-a", results[0])
+        self.assertEqual(-32601, results[1]["error"]["code"])
+        self.assertEqual("value-b", results[2])
+        self.assertEqual([], batch.execute())
+
+    def test_unreachable_endpoint(self):
+        with self.assertRaisesRegex(NeoRPCException, "Could not call method getstorage"):
+            RPCClient("http://127.0.0.1:1", timeout=1).get_storage("0x01", "key")
+
+    @skipIf(aiohttp is None, "AsyncRPCClient requires aiohttp package")
+    def test_async_client(self):
+        async def query():
+            async with AsyncRPCClient(self.endpoint) as client:
+                return await client.call_many([("getstorage", ["0x01", str(i)]) for i in range(10)])
+
+        self.assertEqual([f"value-{i}" for i in range(10)], asyncio.run(query()))
@@ -46,6 +46,9 @@ NEOFS_CLI_EXEC = os.getenv("NEOFS_CLI_EXEC", "./neofs-cli")
 NEOFS_AUTHMATE_EXEC = os.getenv("NEOFS_AUTHMATE_EXEC", "./neofs-s3-authmate")
 NEOFS_ADM_EXEC = os.getenv("NEOFS_ADM_EXEC", "./neofs-adm")
 
+# Backend of object verbs in helpers.neofs_verbs: "cli" (neofs-cli) or "grpc" (in-process gRPC client)
+NEOFS_OBJECT_BACKEND = os.getenv("NEOFS_OBJECT_BACKEND", "cli")
+
 NEOFS_ADM_CONFIG_PATH = os.getenv("NEOFS_ADM_CONFIG_PATH", os.path.join(DEVENV_PATH, "neofs-adm.yml"))
 
 FREE_STORAGE = os.getenv("FREE_STORAGE", "false").lower() == "true"
@@ -61,10 +64,29 @@ ENDPOINT_INTERNAL0 = "endpoint_internal0"
 
 ALLOCATED_PORTS_LOCK_FILE = "/tmp/allocated_ports.lock"
 ALLOCATED_PORTS_FILE = "/tmp/allocated_ports.txt"
+ALLOCATED_PORTS_BLOCK_SIZE = 32
+# kept below ephemeral port ranges of Linux (32768-60999) and macOS (49152-65535)
+ALLOCATED_PORTS_RANGE = (20000, 32000)
 BINARY_DOWNLOADS_LOCK_FILE = "/tmp/binary_downloads.lock"
 
+# Content-addressed cache of generated payloads, files are linked from it into TEST_FILES_DIR
+PAYLOAD_CACHE_DIR = os.getenv("PAYLOAD_CACHE_DIR", "/tmp/neofs_payload_cache")
+PAYLOAD_CACHE_MAX_SIZE = int(os.getenv("PAYLOAD_CACHE_MAX_SIZE", str(2 * 1024**3)))
+
+# Interval of background scraping of service metrics during tests in seconds, 0 disables recording
+METRICS_RECORDER_INTERVAL = float(os.getenv("METRICS_RECORDER_INTERVAL", "0"))
+
+# Storage node profiles are captured for tests running longer than this number of seconds, 0 disables capture
+# (tests marked with `pprof` are profiled regardless)
+PPROF_DURATION_THRESHOLD = float(os.getenv("PPROF_DURATION_THRESHOLD", "0"))
+
 DEFAULT_OBJECT_OPERATION_TIMEOUT = 600
 DEFAULT_REST_OPERATION_TIMEOUT = 10
+IR_READY_TIMEOUT = 200
+SN_READY_TIMEOUT = 200
+SN_READINESS_POLL_INTERVAL = 0.05
+SN_READY_LOG_MARKERS = ("application started",)
+SN_SHUTDOWN_LOG_MARKERS = ("termination signal has been received", "application stopped")
 
 SN_VALIDATOR_DEFAULT_PORT = 8181
 
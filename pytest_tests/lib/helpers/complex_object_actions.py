@@ -1,7 +1,8 @@
 import logging
 import string
 import time
-from typing import Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Callable, Optional, Tuple
 
 import allure
 from helpers.grpc_responses import OBJECT_NOT_FOUND, error_matches_status
@@ -12,6 +13,14 @@ from neofs_testlib.shell import Shell
 
 logger = logging.getLogger("NeoLogger")
 
+# Max number of concurrent HEAD requests made while scanning nodes for object copies
+PLACEMENT_SCAN_WORKERS = 16
+# Object replication is polled with growing intervals until the timeout (in seconds) expires
+REPLICATION_WAIT_TIMEOUT = 300
+REPLICATION_POLL_INTERVAL = 1
+REPLICATION_MAX_POLL_INTERVAL = 15
+REPLICATION_POLL_BACKOFF = 1.5
+
 
 def get_object_chunks(
     wallet_file_path: string,
@@ -229,17 +238,15 @@ def get_simple_object_copies(wallet: str, cid: str, oid: str, shell: Shell, node
     Returns:
         (int): the number of object copies in the container
     """
-    copies = 0
-    for node in nodes:
+
+    def has_object(cid: str, oid: str, node: StorageNode) -> bool:
         try:
-            response = head_object(wallet, cid, oid, shell=shell, endpoint=node.endpoint, is_direct=True)
-            if response:
-                logger.info(f"Found object {oid} on node {node}")
-                copies += 1
+            return bool(head_object.__wrapped__(wallet, cid, oid, shell=shell, endpoint=node.endpoint, is_direct=True))
         except Exception:
             logger.info(f"No {oid} object copy found on {node}, continue")
-            continue
-    return copies
+            return False
+
+    return len(scan_object_placement([(cid, oid)], nodes, has_object)[(cid, oid)])
 
 
 @allure.step("Get Complex Object Copies")
@@ -264,6 +271,68 @@ def get_complex_object_copies(wallet: str, cid: str, oid: str, shell: Shell, nod
     return get_simple_object_copies(wallet, cid, last_oid, shell, nodes)
 
 
+def scan_object_placement(
+    objects: list[tuple[str, str]],
+    nodes: list[StorageNode],
+    has_object: Callable[[str, str, StorageNode], bool],
+    required_copies: Optional[int] = None,
+) -> dict[tuple[str, str], list[StorageNode]]:
+    """
+    Checks which nodes store the objects, all (object, node) pairs are checked concurrently.
+    `has_object` is called from worker threads, so it must not make allure steps or attachments,
+    a summary of the scan is attached by the calling thread.
+    Args:
+        objects: (cid, oid) pairs of objects to look for
+        nodes: nodes to check
+        has_object: callable that returns whether the node stores the object,
+                    an exception raised by it aborts the scan
+        required_copies: if set, scanning of an object stops as soon as it is found
+                    on this number of nodes, checks of other nodes that haven't started yet are cancelled
+    Returns:
+        (dict): nodes storing every object, in the same order as in `nodes`
+    """
+    if not objects or not nodes:
+        return {obj: [] for obj in objects}
+
+    found: dict[tuple[str, str], list[int]] = {obj: [] for obj in objects}
+    cancelled = 0
+
+    executor = ThreadPoolExecutor(max_workers=min(PLACEMENT_SCAN_WORKERS, len(objects) * len(nodes)))
+    try:
+        futures: dict[Future, tuple[tuple[str, str], int]] = {}
+        object_futures: dict[tuple[str, str], list[Future]] = {obj: [] for obj in objects}
+        for cid, oid in objects:
+            for index, node in enumerate(nodes):
+                future = executor.submit(has_object, cid, oid, node)
+                futures[future] = ((cid, oid), index)
+                object_futures[(cid, oid)].append(future)
+
+        unsatisfied = set(objects)
+        for future in as_completed(futures):
+            if future.cancelled():
+                cancelled += 1
+                continue
+            obj, index = futures[future]
+            if not future.result() or obj not in unsatisfied:
+                continue
+            found[obj].append(index)
+            if required_copies is not None and len(found[obj]) >= required_copies:
+                unsatisfied.discard(obj)
+                for pending in object_futures[obj]:
+                    pending.cancel()
+                if not unsatisfied:
+                    break
+    finally:
+        # checks that have already started are bounded by CLI timeout
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    placement = {obj: [nodes[index] for index in sorted(indexes)] for obj, indexes in found.items()}
+    summary = [f"objects: {len(objects)}, nodes: {len(nodes)}, cancelled checks: {cancelled}"]
+    summary.extend(f"{cid}/{oid}: {', '.join(map(str, placement[(cid, oid)])) or '-'}" for cid, oid in objects)
+    allure.attach("\n".join(summary), "Object placement", allure.attachment_type.TEXT)
+    return placement
+
+
 @allure.step("Get Nodes With Object")
 def get_nodes_with_object(
     cid: str, oid: str, shell: Shell, nodes: list[StorageNode], neofs_env: NeoFSEnv
@@ -279,11 +348,32 @@ def get_nodes_with_object(
     Returns:
          (list): nodes which store the object
     """
+    return get_nodes_with_objects([(cid, oid)], shell, nodes, neofs_env)[(cid, oid)]
 
-    nodes_list = []
-    for node in nodes:
+
+@allure.step("Get Nodes With Objects")
+def get_nodes_with_objects(
+    objects: list[tuple[str, str]],
+    shell: Shell,
+    nodes: list[StorageNode],
+    neofs_env: NeoFSEnv,
+    required_copies: Optional[int] = None,
+) -> dict[tuple[str, str], list[StorageNode]]:
+    """
+    The function returns nodes which store each of the given objects.
+    Args:
+         objects: (cid, oid) pairs of objects
+         shell: executor for cli command
+         nodes: nodes to find on
+         required_copies: if set, an object is not looked for on other nodes
+                     once it is found on this number of nodes
+    Returns:
+         (dict): nodes which store the object for every (cid, oid) pair
+    """
+
+    def has_object(cid: str, oid: str, node: StorageNode) -> bool:
         try:
-            res = head_object(
+            res = head_object.__wrapped__(
                 node.wallet.path,
                 cid,
                 oid,
@@ -292,13 +382,14 @@ def get_nodes_with_object(
                 is_direct=True,
                 wallet_config=node.cli_config,
             )
-            if res is not None:
-                logger.info(f"Found object {oid} on node {node}")
-                nodes_list.append(node)
         except Exception:
             logger.info(f"No {oid} object copy found on {node}, continue")
-            continue
-    return nodes_list
+            return False
+        if res is not None:
+            logger.info(f"Found object {oid} on node {node}")
+        return res is not None
+
+    return scan_object_placement(objects, nodes, has_object, required_copies)
 
 
 @allure.step("Get Nodes Without Object")
@@ -317,18 +408,20 @@ def get_nodes_without_object(
     Returns:
          (list): nodes which do not store the object
     """
-    nodes_list = []
-    for node in nodes:
+
+    def has_object(cid: str, oid: str, node: StorageNode) -> bool:
         try:
-            res = head_object(wallet, cid, oid, shell=shell, endpoint=node.endpoint, is_direct=True)
-            if res is None:
-                nodes_list.append(node)
+            return (
+                head_object.__wrapped__(wallet, cid, oid, shell=shell, endpoint=node.endpoint, is_direct=True)
+                is not None
+            )
         except Exception as err:
             if error_matches_status(err, OBJECT_NOT_FOUND):
-                nodes_list.append(node)
-            else:
-                raise Exception(f"Got error {err} on head object command") from err
-    return nodes_list
+                return False
+            raise Exception(f"Got error {err} on head object command") from err
+
+    nodes_with_object = scan_object_placement([(cid, oid)], nodes, has_object)[(cid, oid)]
+    return [node for node in nodes if node not in nodes_with_object]
 
 
 @allure.step("Wait for object replication")
@@ -339,15 +432,59 @@ def wait_object_replication(
     shell: Shell,
     nodes: list[StorageNode],
     neofs_env: NeoFSEnv,
+    timeout: float = REPLICATION_WAIT_TIMEOUT,
 ) -> list[StorageNode]:
-    sleep_interval, attempts = 15, 20
-    nodes_with_object = []
-    for _ in range(attempts):
-        nodes_with_object = get_nodes_with_object(cid, oid, shell=shell, nodes=nodes, neofs_env=neofs_env)
-        if len(nodes_with_object) >= expected_copies:
-            return nodes_with_object
+    """
+    Waits until the object is stored on at least the expected number of nodes.
+    Returns:
+         (list): all nodes which store the object
+    """
+    return wait_objects_replication([(cid, oid)], expected_copies, shell, nodes, neofs_env, timeout)[(cid, oid)]
+
+
+@allure.step("Wait for objects replication")
+def wait_objects_replication(
+    objects: list[tuple[str, str]],
+    expected_copies: int,
+    shell: Shell,
+    nodes: list[StorageNode],
+    neofs_env: NeoFSEnv,
+    timeout: float = REPLICATION_WAIT_TIMEOUT,
+) -> dict[tuple[str, str], list[StorageNode]]:
+    """
+    Waits until each of the objects is stored on the expected number of nodes.
+
+    Nodes are polled with intervals growing from REPLICATION_POLL_INTERVAL to REPLICATION_MAX_POLL_INTERVAL,
+    objects that have already been replicated are not polled anymore. A poll of an object stops as soon as
+    `expected_copies` are found, once all objects are replicated, all nodes are checked once more.
+    Args:
+         objects: (cid, oid) pairs of objects
+         expected_copies: number of copies to wait for
+         shell: executor for cli command
+         nodes: nodes to find on
+         timeout: how long to wait (in seconds)
+    Returns:
+         (dict): all nodes which store the object for every (cid, oid) pair
+    """
+    deadline = time.monotonic() + timeout
+    sleep_interval = REPLICATION_POLL_INTERVAL
+    placement: dict[tuple[str, str], list[StorageNode]] = {}
+    remaining = list(objects)
+    while True:
+        placement.update(get_nodes_with_objects(remaining, shell, nodes, neofs_env, required_copies=expected_copies))
+        remaining = [obj for obj in remaining if len(placement[obj]) < expected_copies]
+        if not remaining:
+            # callers need every node storing the objects, not only the first ones that answered
+            placement = get_nodes_with_objects(list(objects), shell, nodes, neofs_env)
+            remaining = [obj for obj in objects if len(placement[obj]) < expected_copies]
+            if not remaining:
+                return placement
+        if time.monotonic() + sleep_interval > deadline:
+            break
         time.sleep(sleep_interval)
+        sleep_interval = min(sleep_interval * REPLICATION_POLL_BACKOFF, REPLICATION_MAX_POLL_INTERVAL)
+
+    found_copies = ", ".join(f"{len(placement[(cid, oid)])} of {cid}/{oid}" for cid, oid in remaining)
     raise AssertionError(
-        f"Expected {expected_copies} copies of object, but found {len(nodes_with_object)}. "
-        f"Waiting time {sleep_interval * attempts}"
+        f"Expected {expected_copies} copies of object, but found {found_copies}. Waiting time {timeout}"
     )
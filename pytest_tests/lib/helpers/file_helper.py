@@ -1,12 +1,21 @@
+import fcntl
 import hashlib
+import json
 import logging
+import mmap
 import os
 import random
+import shutil
+import sys
+import time
 import uuid
-from typing import Any, Optional
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Iterator, Optional
 
 import allure
-from helpers.common import TEST_FILES_DIR, get_assets_dir_path
+from helpers.common import PAYLOAD_CACHE_DIR, PAYLOAD_CACHE_MAX_SIZE, TEST_FILES_DIR, get_assets_dir_path
+from helpers.tzhash import TZHash
 
 logger = logging.getLogger("NeoLogger")
 
@@ -14,6 +23,12 @@ RANGES_COUNT = 4
 RANGE_MIN_LEN = 10
 RANGE_MAX_LEN = 500
 
+# Size of blocks in which payloads are generated, hashed and copied, so memory usage doesn't depend on file size
+FILE_CHUNK_SIZE = 4 * 1024 * 1024
+
+# ioctl that clones a file as copy-on-write (reflink) on Linux file systems supporting it (btrfs, xfs)
+FICLONE = 0x40049409
+
 
 def generate_payload_ranges(file_size: int) -> list[tuple[int, int]]:
     """Generate randomized `(offset, length)` payload ranges for tests.
@@ -48,18 +63,53 @@ def generate_payload_ranges(file_size: int) -> list[tuple[int, int]]:
     return ranges_to_test
 
 
-def generate_file(size: int) -> str:
+def iter_random_chunks(size: int, seed: Optional[int] = None, chunk_size: int = FILE_CHUNK_SIZE) -> Iterator[bytes]:
+    """Generates random payload of the specified size chunk by chunk.
+
+    Args:
+        size: Size of the payload in bytes.
+        seed: Seed of the pseudo-random generator, the same seed produces the same payload.
+            If not specified, then random bytes are taken from the OS.
+        chunk_size: Maximum size of a chunk.
+
+    Returns:
+        Iterator over chunks of the payload.
+    """
+    rng = random.Random(seed) if seed is not None else None
+    for offset in range(0, size, chunk_size):
+        length = min(chunk_size, size - offset)
+        yield rng.randbytes(length) if rng else os.urandom(length)
+
+
+def write_random_payload(file: BinaryIO, size: int, seed: Optional[int] = None) -> None:
+    """Writes random payload of the specified size to a file without holding it in memory.
+
+    Args:
+        file: File opened in binary mode.
+        size: Size of the payload in bytes.
+        seed: Seed of the pseudo-random generator, see `iter_random_chunks`.
+    """
+    for chunk in iter_random_chunks(size, seed):
+        file.write(chunk)
+
+
+def generate_file(size: int, seed: Optional[int] = None) -> str:
     """Generates a binary file with the specified size in bytes.
 
     Args:
         size: Size in bytes, can be declared as 6e+6 for example.
+        seed: Seed of the pseudo-random generator to produce reproducible content. Files with a seed
+            are linked from the payload cache, so they must not be modified in place.
 
     Returns:
         The path to the generated file.
     """
     file_path = os.path.join(get_assets_dir_path(), TEST_FILES_DIR, f"temp_file_{uuid.uuid4()}")
-    with open(file_path, "wb") as file:
-        file.write(os.urandom(size))
+    if seed is not None:
+        payload_cache.link(int(size), seed, file_path)
+    else:
+        with open(file_path, "wb") as file:
+            write_random_payload(file, int(size))
     logger.info(f"File with size {size} bytes has been generated: {file_path}")
 
     return file_path
@@ -69,6 +119,7 @@ def generate_file_with_content(
     size: int,
     file_path: Optional[str] = None,
     content: Optional[str] = None,
+    seed: Optional[int] = None,
 ) -> str:
     """Creates a new file with specified content.
 
@@ -77,27 +128,74 @@ def generate_file_with_content(
             path will be generated.
         content: Content that should be stored in the file. If not specified, then random binary
             content will be generated.
+        seed: Seed of the pseudo-random generator for random binary content, such content is linked
+            from the payload cache.
 
     Returns:
         Path to the generated file.
     """
-    mode = "w+"
-    if content is None:
-        content = os.urandom(size)
-        mode = "wb"
 
     if not file_path:
         file_path = os.path.join(get_assets_dir_path(), TEST_FILES_DIR, f"temp_file_{uuid.uuid4()}")
     else:
         if not os.path.exists(os.path.dirname(file_path)):
             os.makedirs(os.path.dirname(file_path))
-
-    with open(file_path, mode) as file:
-        file.write(content)
+        # the file might be linked from the payload cache, so it is replaced instead of being rewritten in place
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+    if content is None and seed is not None:
+        payload_cache.link(size, seed, file_path)
+    elif content is None:
+        with open(file_path, "wb") as file:
+            write_random_payload(file, size)
+    else:
+        with open(file_path, "w+") as file:
+            file.write(content)
 
     return file_path
 
 
+def iter_file_chunks(
+    file_path: str, length: Optional[int] = None, offset: int = 0, chunk_size: int = FILE_CHUNK_SIZE
+) -> Iterator[memoryview]:
+    """Iterates over a range of the file content through a memory map.
+
+    Chunks are views of the map, so they are valid only until the next chunk is requested.
+
+    Args:
+        file_path: Path to the file.
+        length: Length of the range. If not specified, the range lasts till the end of the file.
+        offset: Start of the range.
+        chunk_size: Maximum size of a chunk.
+
+    Returns:
+        Iterator over chunks of the range.
+    """
+    with open(file_path, "rb") as file:
+        file_size = os.fstat(file.fileno()).st_size
+        end = file_size if length is None else min(offset + length, file_size)
+        if offset >= end:
+            return
+        map_offset = offset - offset % mmap.ALLOCATIONGRANULARITY
+        with mmap.mmap(file.fileno(), end - map_offset, offset=map_offset, access=mmap.ACCESS_READ) as mapped:
+            can_advise = hasattr(mapped, "madvise") and hasattr(mmap, "MADV_DONTNEED")
+            if can_advise:
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            released = 0
+            with memoryview(mapped) as view:
+                for start in range(offset - map_offset, end - map_offset, chunk_size):
+                    stop = min(start + chunk_size, end - map_offset)
+                    with view[start:stop] as chunk:
+                        yield chunk
+                    if can_advise:
+                        # drop pages that have been read so that resident memory doesn't grow with file size
+                        release_to = stop - stop % mmap.PAGESIZE
+                        if release_to > released:
+                            mapped.madvise(mmap.MADV_DONTNEED, released, release_to - released)
+                            released = release_to
+
+
 @allure.step("Get File Hash")
 def get_file_hash(file_path: str, len: Optional[int] = None, offset: Optional[int] = None) -> str:
     """Generates hash for the specified file.
@@ -110,21 +208,73 @@ def get_file_hash(file_path: str, len: Optional[int] = None, offset: Optional[in
     Returns:
         Hash of the file as hex-encoded string.
     """
+    if not len and not offset:
+        payload = payload_cache.find(file_path)
+        if payload:
+            return payload.sha256
+
     file_hash = hashlib.sha256()
-    with open(file_path, "rb") as out:
-        if len and not offset:
-            file_hash.update(out.read(len))
-        elif len and offset:
-            out.seek(offset, 0)
-            file_hash.update(out.read(len))
-        elif offset and not len:
-            out.seek(offset, 0)
-            file_hash.update(out.read())
-        else:
-            file_hash.update(out.read())
+    for chunk in iter_file_chunks(file_path, len or None, offset or 0):
+        file_hash.update(chunk)
     return file_hash.hexdigest()
 
 
+def get_file_tz_hash(file_path: str) -> bytes:
+    """Returns Tillich-Zémor hash of the file, taking it from the payload cache if the file is linked from there.
+
+    Args:
+        file_path: Path to the file to generate hash for.
+
+    Returns:
+        Hash of the file.
+    """
+    payload = payload_cache.find(file_path)
+    if payload:
+        return payload_cache.get_tz_hash(payload)
+    return TZHash.hash_file(file_path)
+
+
+def copy_file_range(src: BinaryIO, dst: BinaryIO, offset: int, count: int) -> None:
+    """Appends a range of one file to another one without copying data through user space when possible.
+
+    Uses `os.copy_file_range` (which may reflink on CoW file systems) or `os.sendfile`
+    and falls back to buffered copying if neither is supported.
+
+    Args:
+        src: Source file opened in binary mode.
+        dst: Destination file opened in binary mode, data is written at its current position.
+        offset: Start of the range in the source file.
+        count: Length of the range.
+    """
+    dst.flush()
+    src_fd, dst_fd = src.fileno(), dst.fileno()
+    for copy in (getattr(os, "copy_file_range", None), getattr(os, "sendfile", None)):
+        if copy is None:
+            continue
+        try:
+            while count > 0:
+                if copy is os.sendfile:
+                    copied = os.sendfile(dst_fd, src_fd, offset, count)
+                else:
+                    copied = os.copy_file_range(src_fd, dst_fd, count, offset)
+                if copied == 0:
+                    return
+                offset += copied
+                count -= copied
+            return
+        except OSError as err:
+            # the call is not supported for these files, continue from where it stopped
+            logger.debug(f"{copy.__name__} is not supported, falling back: {err}")
+    dst.seek(0, os.SEEK_END)
+    src.seek(offset)
+    while count > 0:
+        chunk = src.read(min(count, FILE_CHUNK_SIZE))
+        if not chunk:
+            return
+        dst.write(chunk)
+        count -= len(chunk)
+
+
 @allure.step("Concatenation set of files to one file")
 def concat_files(file_paths: list, resulting_file_path: Optional[str] = None) -> str:
     """Concatenates several files into a single file.
@@ -141,7 +291,7 @@ def concat_files(file_paths: list, resulting_file_path: Optional[str] = None) ->
     with open(resulting_file_path, "wb") as f:
         for file in file_paths:
             with open(file, "rb") as part_file:
-                f.write(part_file.read())
+                copy_file_range(part_file, f, 0, os.fstat(part_file.fileno()).st_size)
     return resulting_file_path
 
 
@@ -157,20 +307,18 @@ def split_file(file_path: str, parts: int) -> list[str]:
     Returns:
         Paths to the part files.
     """
-    with open(file_path, "rb") as file:
-        content = file.read()
-
-    content_size = len(content)
+    content_size = os.path.getsize(file_path)
     chunk_size = int((content_size + parts) / parts)
 
     part_id = 1
     part_file_paths = []
-    for content_offset in range(0, content_size + 1, chunk_size):
-        part_file_name = f"{file_path}_part_{part_id}"
-        part_file_paths.append(part_file_name)
-        with open(part_file_name, "wb") as out_file:
-            out_file.write(content[content_offset : content_offset + chunk_size])
-        part_id += 1
+    with open(file_path, "rb") as file:
+        for content_offset in range(0, content_size + 1, chunk_size):
+            part_file_name = f"{file_path}_part_{part_id}"
+            part_file_paths.append(part_file_name)
+            with open(part_file_name, "wb") as out_file:
+                copy_file_range(file, out_file, content_offset, min(chunk_size, content_size - content_offset))
+            part_id += 1
 
     return part_file_paths
 
@@ -203,3 +351,173 @@ def get_file_content(
             content = file.read()
 
     return content
+
+
+@dataclass
+class CachedPayload:
+    """Payload stored in the payload cache.
+
+    Attributes:
+        path: Path to the payload file in the cache.
+        size: Size of the payload in bytes.
+        seed: Seed the payload has been generated with.
+        sha256: Hex-encoded SHA-256 hash of the payload.
+        tz_hash: Hex-encoded Tillich-Zémor hash of the payload, it is computed on first request.
+    """
+
+    path: str
+    size: int
+    seed: int
+    sha256: str
+    tz_hash: Optional[str] = None
+
+
+class PayloadCache:
+    """Content-addressed cache of generated payloads shared by all test processes.
+
+    Payloads are keyed by (size, seed) and stored along with their hashes. Cached files are linked into
+    test directories (reflinked if the file system supports it, hardlinked otherwise) instead of being
+    generated again. Least recently used payloads are evicted once total size of the cache exceeds the limit.
+    """
+
+    INDEX_FILE = "index.json"
+    LOCK_FILE = "index.lock"
+
+    def __init__(self, cache_dir: str = PAYLOAD_CACHE_DIR, max_size: int = PAYLOAD_CACHE_MAX_SIZE):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        # files linked from the cache by this process: path -> ((size, mtime) of the file when it was linked, payload)
+        self._linked: dict[str, tuple[tuple[int, int], CachedPayload]] = {}
+
+    def link(self, size: int, seed: int, file_path: str) -> CachedPayload:
+        """Links payload of the specified size and seed to the path, generating the payload on a cache miss.
+
+        Args:
+            size: Size of the payload in bytes.
+            seed: Seed of the pseudo-random generator.
+            file_path: Path where the payload should appear.
+
+        Returns:
+            The cached payload.
+        """
+        with self._index() as index:
+            payload = self._get(index, size, seed)
+            _link_file(payload.path, file_path)
+        stat = os.stat(file_path)
+        self._linked[file_path] = ((stat.st_size, stat.st_mtime_ns), payload)
+        return payload
+
+    def find(self, file_path: str) -> Optional[CachedPayload]:
+        """Returns payload the file has been linked from, if the file hasn't been modified since then."""
+        linked = self._linked.get(file_path)
+        if linked is None:
+            return None
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+        signature, payload = linked
+        return payload if (stat.st_size, stat.st_mtime_ns) == signature else None
+
+    def get_tz_hash(self, payload: CachedPayload) -> bytes:
+        """Returns Tillich-Zémor hash of the payload, computing and storing it on first request."""
+        if payload.tz_hash is None:
+            key = self._key(payload.size, payload.seed)
+            with self._index() as index:
+                payload.tz_hash = index.get(key, {}).get("tz_hash")
+            if payload.tz_hash is None:
+                payload.tz_hash = TZHash.hash_file(payload.path).hex()
+                with self._index() as index:
+                    if key in index:
+                        index[key]["tz_hash"] = payload.tz_hash
+        return bytes.fromhex(payload.tz_hash)
+
+    def _get(self, index: dict, size: int, seed: int) -> CachedPayload:
+        key = self._key(size, seed)
+        path = os.path.join(self.cache_dir, f"payload_{key}")
+        entry = index.get(key)
+        if entry is None or not self._is_intact(path, entry):
+            self.misses += 1
+            entry = self._generate(path, size, seed)
+            index[key] = entry
+        else:
+            self.hits += 1
+        entry["last_used"] = time.time()
+        self._evict(index, keep=key)
+        return CachedPayload(path, size, seed, entry["sha256"], entry.get("tz_hash"))
+
+    def _generate(self, path: str, size: int, seed: int) -> dict:
+        sha256 = hashlib.sha256()
+        # new payload replaces the old file instead of overwriting it, as the old one may still be linked to tests
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as file:
+            for chunk in iter_random_chunks(size, seed):
+                sha256.update(chunk)
+                file.write(chunk)
+        os.replace(tmp_path, path)
+        logger.info(f"Payload with size {size} bytes and seed {seed} has been cached: {path}")
+        return {"size": size, "seed": seed, "sha256": sha256.hexdigest(), "mtime": os.stat(path).st_mtime_ns}
+
+    def _evict(self, index: dict, keep: str) -> None:
+        total_size = sum(entry["size"] for entry in index.values())
+        for key in sorted(index, key=lambda key: index[key]["last_used"]):
+            if total_size <= self.max_size:
+                break
+            if key == keep:
+                continue
+            total_size -= index.pop(key)["size"]
+            try:
+                os.remove(os.path.join(self.cache_dir, f"payload_{key}"))
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _key(size: int, seed: int) -> str:
+        return f"{size}_{seed}"
+
+    @staticmethod
+    def _is_intact(path: str, entry: dict) -> bool:
+        # a file linked to a test and modified there has another mtime
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return False
+        return (stat.st_size, stat.st_mtime_ns) == (entry["size"], entry["mtime"])
+
+    @contextmanager
+    def _index(self) -> Iterator[dict]:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        index_path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        with open(os.path.join(self.cache_dir, self.LOCK_FILE), "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                with open(index_path) as file:
+                    index = json.load(file)
+            except (FileNotFoundError, json.JSONDecodeError):
+                index = {}
+
+            yield index
+
+            with open(f"{index_path}.tmp", "w") as file:
+                json.dump(index, file)
+            os.replace(f"{index_path}.tmp", index_path)
+
+
+def _link_file(src: str, dst: str) -> None:
+    """Makes file available under another path without copying its data when possible."""
+    if sys.platform == "linux":
+        try:
+            with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+                fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+            return
+        except OSError:
+            os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+payload_cache = PayloadCache()
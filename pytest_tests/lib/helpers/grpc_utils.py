@@ -7,14 +7,12 @@ import grpc
 from ecdsa import NIST256p, SigningKey
 from helpers.tzhash import TZHash
 from helpers.utility import get_signature_slice, sign_ecdsa
-from neo3.wallet.wallet import Wallet
 from neofs_testlib.env.env import NodeWallet
 from neofs_testlib.protobuf.generated.object import service_pb2 as object_service_pb2
 from neofs_testlib.protobuf.generated.object import types_pb2 as object_types_pb2
 from neofs_testlib.protobuf.generated.refs import types_pb2 as refs_types_pb2
 from neofs_testlib.protobuf.generated.session import service_pb2 as session_service_pb2
 from neofs_testlib.protobuf.generated.session import types_pb2 as session_types_pb2
-from neofs_testlib.utils.converters import load_wallet
 
 logger = logging.getLogger("NeoLogger")
 
@@ -30,8 +28,7 @@ def create_ecdsa_signature(data: bytes, public_key: bytes, private_key: bytes) -
 
 
 def get_wallet_keys(default_wallet: NodeWallet):
-    neo3_wallet: Wallet = load_wallet(default_wallet.path, default_wallet.password)
-    acc = neo3_wallet.accounts[0]
+    acc = default_wallet.accounts[0]
     public_key = acc.public_key.encode_point(True)
     private_key = acc.private_key
     return public_key, private_key
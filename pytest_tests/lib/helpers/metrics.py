@@ -1,57 +1,298 @@
 import json
 import logging
 import re
+import threading
+import time
 from collections import defaultdict
-from typing import Union
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Optional, Union
 
 import allure
 import requests
-from helpers.test_control import wait_for_success
 from neofs_testlib.env.env import S3_GW, InnerRing, StorageNode
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger("NeoLogger")
 
+METRICS_SCRAPE_TIMEOUT = 10
+METRICS_WAIT_TIMEOUT = 120
+METRICS_POLL_INTERVAL = 0.5
+# Max number of keep-alive connections kept per metrics endpoint
+METRICS_POOL_SIZE = 16
+
+# Suffixes of samples that belong to histogram and summary families
+FAMILY_SAMPLE_SUFFIXES = ("_bucket", "_sum", "_count", "_created")
+
+LABEL_PATTERN = re.compile(r'\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*"((?:[^"\\]|\\.)*)"\s*,?')
+LABEL_ESCAPES = {"\\\\": "\\", '\\"': '"', "\\n": "\n"}
+
+
+def _unescape_label_value(value: str) -> str:
+    if "\\" not in value:
+        return value
+    return re.sub(r"\\[\\\"n]", lambda match: LABEL_ESCAPES[match.group(0)], value)
+
+
+def _sample_name(line: str) -> str:
+    end = len(line)
+    for separator in ("{", " ", "\t"):
+        position = line.find(separator)
+        if position != -1:
+            end = min(end, position)
+    return line[:end]
+
+
+def _family_requested(name: str, families: Optional[frozenset]) -> bool:
+    if families is None or name in families:
+        return True
+    return any(name.endswith(suffix) and name[: -len(suffix)] in families for suffix in FAMILY_SAMPLE_SUFFIXES)
+
+
+def _parse_sample(line: str, name: str) -> Optional[dict]:
+    rest = line[len(name) :]
+    params = {}
+    if rest.startswith("{"):
+        position = 1
+        while True:
+            match = LABEL_PATTERN.match(rest, position)
+            if match is None:
+                break
+            params[match.group(1)] = _unescape_label_value(match.group(2))
+            position = match.end()
+        if not rest.startswith("}", position):
+            logger.warning(f"Could not parse labels of metric sample: {line}")
+            return None
+        rest = rest[position + 1 :]
+
+    # value might be followed by an optional timestamp
+    tokens = rest.split()
+    if not tokens:
+        return None
+    return {"value": float(tokens[0]), "params": params}
+
+
+def parse_prometheus_metrics(
+    metrics_lines: Union[str, Iterable[str]], families: Optional[Iterable[str]] = None
+) -> dict:
+    """Parses metrics in Prometheus text exposition format.
+
+    Args:
+        metrics_lines: Exposition page or an iterable of its lines.
+        families: Names of metric families to parse, histogram and summary families include their
+            `_bucket`, `_sum` and `_count` samples. All metrics are parsed if omitted.
+
+    Returns:
+        Samples by metric name, each sample is a dict with `value` and `params` (labels).
+    """
+    if isinstance(metrics_lines, str):
+        metrics_lines = metrics_lines.splitlines()
+    families = frozenset(families) if families is not None else None
 
-def parse_prometheus_metrics(metrics_lines: str) -> dict:
     parsed_metrics = defaultdict(list)
-    for line in metrics_lines.strip().splitlines():
-        if line.startswith("#"):
+    for line in metrics_lines:
+        if not line or line.startswith("#"):
+            continue
+        name = _sample_name(line)
+        if not _family_requested(name, families):
             continue
-        match = re.match(r"^(?P<name>[^\{]+)(\{(?P<params>[^\}]+)\})?\s+(?P<value>\S+)$", line)
-        if match:
-            name = match.group("name")
-            params = match.group("params")
-            value = float(match.group("value"))
-
-            params_dict = {}
-            if params:
-                params_pairs = params.split(",")
-                for pair in params_pairs:
-                    key, val = pair.split("=")
-                    params_dict[key.strip()] = val.strip().strip('"')
-
-            parsed_metrics[name].append({"value": value, "params": params_dict})
+        sample = _parse_sample(line, name)
+        if sample is not None:
+            parsed_metrics[name].append(sample)
     return parsed_metrics
 
 
-def get_metrics(node: Union[StorageNode | InnerRing | S3_GW]) -> dict:
-    resp = requests.get(f"http://{node.prometheus_address}")
-    if resp.status_code != 200:
-        raise AssertionError(f"Invalid status code from metrics url: {resp.status_code}; {resp.reason}; {resp.text};")
-    return parse_prometheus_metrics(resp.text)
+@dataclass
+class MetricsSnapshot:
+    """Samples of a single scrape of a metrics endpoint."""
+
+    address: str
+    timestamp: float
+    families: Optional[frozenset]
+    samples: dict = field(default_factory=dict)
+
+    def covers(self, families: Optional[frozenset]) -> bool:
+        if self.families is None:
+            return True
+        return families is not None and families <= self.families
+
+    def get_samples(self, name: str, **labels: str) -> list[dict]:
+        return [
+            sample
+            for sample in self.samples.get(name, [])
+            if all(sample["params"].get(key) == value for key, value in labels.items())
+        ]
+
+    def get_value(self, name: str, **labels: str) -> Optional[float]:
+        """Returns value of the first sample of the metric with the given labels."""
+        samples = self.get_samples(name, **labels)
+        return samples[0]["value"] if samples else None
+
+
+class MetricsClient:
+    """Scrapes metrics endpoints of NeoFS services over keep-alive connections.
+
+    Only requested metric families are parsed while the page is streamed. The last two snapshots
+    of every endpoint are cached, so deltas and rates can be computed between scrapes.
+    """
+
+    def __init__(self, timeout: float = METRICS_SCRAPE_TIMEOUT):
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=METRICS_POOL_SIZE, pool_maxsize=METRICS_POOL_SIZE)
+        self.session.mount("http://", adapter)
+        self._snapshots: dict[str, tuple[Optional[MetricsSnapshot], MetricsSnapshot]] = {}
+        self._lock = threading.Lock()
+
+    def scrape(
+        self,
+        node: Union[StorageNode | InnerRing | S3_GW],
+        families: Optional[Iterable[str]] = None,
+        max_age: float = 0,
+    ) -> MetricsSnapshot:
+        """Returns metrics of the node.
+
+        Args:
+            node: Service with `prometheus_address`.
+            families: Names of metric families to parse, all metrics are parsed if omitted.
+            max_age: Cached snapshot not older than this number of seconds is returned without scraping.
+
+        Returns:
+            Snapshot of the node metrics.
+        """
+        address = node.prometheus_address
+        families = frozenset(families) if families is not None else None
+        if max_age > 0:
+            cached = self.get_cached(node)
+            if cached and cached.covers(families) and time.monotonic() - cached.timestamp <= max_age:
+                return cached
+
+        with self.session.get(f"http://{address}", stream=True, timeout=self.timeout) as resp:
+            if resp.status_code != 200:
+                raise AssertionError(
+                    f"Invalid status code from metrics url: {resp.status_code}; {resp.reason}; {resp.text};"
+                )
+            timestamp = time.monotonic()
+            resp.encoding = resp.encoding or "utf-8"
+            samples = parse_prometheus_metrics(resp.iter_lines(decode_unicode=True), families)
+
+        snapshot = MetricsSnapshot(address, timestamp, families, samples)
+        with self._lock:
+            _, last = self._snapshots.get(address, (None, None))
+            self._snapshots[address] = (last, snapshot)
+        return snapshot
+
+    def get_cached(self, node: Union[StorageNode | InnerRing | S3_GW]) -> Optional[MetricsSnapshot]:
+        with self._lock:
+            return self._snapshots.get(node.prometheus_address, (None, None))[1]
+
+    def delta(self, node: Union[StorageNode | InnerRing | S3_GW], name: str, **labels: str) -> Optional[float]:
+        """Returns change of the metric between the last two scrapes of the node."""
+        previous, last = self._last_two(node, name)
+        if previous is None:
+            return None
+        previous_value, last_value = previous.get_value(name, **labels), last.get_value(name, **labels)
+        if last_value is None:
+            return None
+        return last_value - (previous_value or 0)
+
+    def rate(self, node: Union[StorageNode | InnerRing | S3_GW], name: str, **labels: str) -> Optional[float]:
+        """Returns per-second rate of the metric between the last two scrapes of the node."""
+        delta = self.delta(node, name, **labels)
+        if delta is None:
+            return None
+        previous, last = self._last_two(node, name)
+        elapsed = last.timestamp - previous.timestamp
+        return delta / elapsed if elapsed > 0 else None
+
+    def wait_for_metrics(
+        self,
+        expectations: list[tuple[Union[StorageNode | InnerRing | S3_GW], str, Union[float, Callable[[float], bool]]]],
+        timeout: float = METRICS_WAIT_TIMEOUT,
+        interval: float = METRICS_POLL_INTERVAL,
+    ) -> list[float]:
+        """Waits for metrics of several nodes concurrently.
+
+        Args:
+            expectations: Triples of node, metric name and either expected value or a predicate of the value.
+            timeout: Time to wait for all metrics, in seconds.
+            interval: Interval between scrapes of a single node, in seconds.
+
+        Returns:
+            Values of the metrics in the order of expectations.
+        """
+        deadline = time.monotonic() + timeout
+        with ThreadPoolExecutor(max_workers=len(expectations) or 1) as executor:
+            futures = [
+                executor.submit(self._wait_for_metric, node, name, expected, deadline, interval)
+                for node, name, expected in expectations
+            ]
+            values = [future.result() for future in futures]
+
+        allure.attach(
+            json.dumps(
+                [
+                    {"address": node.prometheus_address, "metric": name, "value": value}
+                    for (node, name, _), value in zip(expectations, values)
+                ]
+            ),
+            "metrics",
+            allure.attachment_type.JSON,
+        )
+        return values
+
+    def _wait_for_metric(
+        self,
+        node: Union[StorageNode | InnerRing | S3_GW],
+        name: str,
+        expected: Union[float, Callable[[float], bool]],
+        deadline: float,
+        interval: float,
+    ) -> float:
+        check = expected if callable(expected) else lambda value: value == expected
+        while True:
+            actual_value, error = None, None
+            try:
+                actual_value = self.scrape(node, [name]).get_value(name)
+            except (requests.RequestException, AssertionError) as exc:
+                error = exc
+            if actual_value is not None and check(actual_value):
+                return actual_value
+            if time.monotonic() + interval > deadline:
+                raise AssertionError(
+                    f"invalid value for {name} on {node.prometheus_address}, "
+                    f"expected: {expected}, got: {actual_value}" + (f", last error: {error}" if error else "")
+                )
+            logger.info(f"Current value of {name} on {node.prometheus_address} = {actual_value}")
+            time.sleep(interval)
+
+    def _last_two(
+        self, node: Union[StorageNode | InnerRing | S3_GW], name: str
+    ) -> tuple[Optional[MetricsSnapshot], Optional[MetricsSnapshot]]:
+        with self._lock:
+            previous, last = self._snapshots.get(node.prometheus_address, (None, None))
+        if last is None:
+            raise ValueError(f"Metrics of {node.prometheus_address} were not scraped yet")
+        if previous is not None and not previous.covers(frozenset([name])):
+            previous = None
+        return previous, last
+
+
+metrics_client = MetricsClient()
+
+
+def get_metrics(node: Union[StorageNode | InnerRing | S3_GW], families: Optional[Iterable[str]] = None) -> dict:
+    return metrics_client.scrape(node, families).samples
 
 
 @allure.step("Wait for correct metric value")
-@wait_for_success(120, 1)
 def wait_for_metric_to_arrive(node: Union[StorageNode | InnerRing | S3_GW], metric_name: str, expected_value: float):
-    metrics = get_metrics(node)
-    allure.attach(
-        json.dumps(dict(metrics)),
-        "metrics",
-        allure.attachment_type.JSON,
-    )
-    actual_value = metrics[metric_name][0]["value"]
-    logger.info(f"Current value of {metric_name} = {actual_value}")
-    assert actual_value == expected_value, (
-        f"invalid value for {metric_name}, expected: {expected_value}, got: {actual_value}"
-    )
+    metrics_client.wait_for_metrics([(node, metric_name, expected_value)])
+
+
+@allure.step("Wait for correct metric values")
+def wait_for_metrics_to_arrive(
+    expectations: list[tuple[Union[StorageNode | InnerRing | S3_GW], str, float]],
+    timeout: float = METRICS_WAIT_TIMEOUT,
+) -> list[float]:
+    return metrics_client.wait_for_metrics(expectations, timeout)
@@ -0,0 +1,255 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
+
+import allure
+from helpers.metrics import MetricsClient
+from neofs_testlib.env.env import NeoFSEnv
+
+logger = logging.getLogger("NeoLogger")
+
+# Metric families recorded by default: resource usage of processes, object counters,
+# GC activity and latencies of object requests
+RECORDED_METRIC_FAMILIES = (
+    "process_cpu_seconds_total",
+    "process_resident_memory_bytes",
+    "go_memstats_heap_inuse_bytes",
+    "go_goroutines",
+    "go_gc_duration_seconds",
+    "neofs_node_engine_object_counter",
+    "neofs_node_object_rpc_put_time",
+    "neofs_node_object_rpc_get_time",
+    "neofs_node_object_rpc_head_time",
+    "neofs_node_object_rpc_search_time",
+    "neofs_node_object_rpc_delete_time",
+    "neofs_node_object_rpc_range_time",
+    "neofs_s3_request_seconds",
+)
+# Number of samples of a series kept in memory, older samples are spilled to disk
+SERIES_BUFFER_SIZE = 4096
+HISTOGRAM_QUANTILES = (0.5, 0.95, 0.99)
+
+
+class SeriesBuffer:
+    """Array-backed buffer of (timestamp, value) samples of a single series.
+
+    When the buffer is full, its samples are appended to spill files and the buffer starts over.
+    """
+
+    def __init__(self, spill_path: str, capacity: int = SERIES_BUFFER_SIZE):
+        self.spill_path = spill_path
+        self.capacity = capacity
+        self.spilled = 0
+        self._timestamps = array("d")
+        self._values = array("d")
+
+    def __len__(self) -> int:
+        return self.spilled + len(self._timestamps)
+
+    def append(self, timestamp: float, value: float) -> None:
+        self._timestamps.append(timestamp)
+        self._values.append(value)
+        if len(self._timestamps) >= self.capacity:
+            self._spill()
+
+    def read(self, start: float = 0, end: float = float("inf")) -> list[tuple[float, float]]:
+        """Returns samples taken within [start, end], including spilled ones."""
+        timestamps, values = array("d"), array("d")
+        if self.spilled:
+            with open(f"{self.spill_path}.ts", "rb") as ts_file, open(f"{self.spill_path}.val", "rb") as val_file:
+                timestamps.fromfile(ts_file, self.spilled)
+                values.fromfile(val_file, self.spilled)
+        timestamps.extend(self._timestamps)
+        values.extend(self._values)
+        return [(ts, value) for ts, value in zip(timestamps, values) if start <= ts <= end]
+
+    def _spill(self) -> None:
+        with open(f"{self.spill_path}.ts", "ab") as ts_file, open(f"{self.spill_path}.val", "ab") as val_file:
+            self._timestamps.tofile(ts_file)
+            self._values.tofile(val_file)
+        self.spilled += len(self._timestamps)
+        self._timestamps = array("d")
+        self._values = array("d")
+
+
+class MetricsRecorder:
+    """Scrapes metrics of all services of an env in background and keeps them as time series.
+
+    Example:
+        with MetricsRecorder(neofs_env, interval=1) as recorder:
+            start = time.time()
+            ...
+            recorder.attach_summary(start)
+    """
+
+    def __init__(
+        self,
+        neofs_env: NeoFSEnv,
+        interval: float,
+        families: Iterable[str] = RECORDED_METRIC_FAMILIES,
+        spill_dir: Optional[str] = None,
+    ):
+        self.nodes = [
+            node
+            for node in [
+                *neofs_env.inner_ring_nodes,
+                *neofs_env.storage_nodes,
+                neofs_env.s3_gw,
+                neofs_env.rest_gw,
+            ]
+            if getattr(node, "prometheus_address", None)
+        ]
+        self.interval = interval
+        self.families = tuple(families)
+        self.client = MetricsClient(timeout=max(interval, 1))
+        self.series: dict[tuple[str, str, tuple], SeriesBuffer] = {}
+        self.scrape_errors = 0
+
+        self._spill_dir = tempfile.TemporaryDirectory(prefix="metrics_recorder_", dir=spill_dir)
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="metrics-recorder", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops background scraping, the final state of metrics is scraped before returning."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self.scrape()
+
+    def close(self) -> None:
+        self.stop()
+        self._spill_dir.cleanup()
+
+    def __enter__(self) -> "MetricsRecorder":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def scrape(self) -> None:
+        """Scrapes all nodes once and appends samples to the series."""
+        with ThreadPoolExecutor(max_workers=len(self.nodes) or 1) as executor:
+            snapshots = list(executor.map(self._scrape_node, self.nodes))
+
+        timestamp = time.time()
+        with self._lock:
+            for snapshot in snapshots:
+                if snapshot is None:
+                    continue
+                for name, samples in snapshot.samples.items():
+                    for sample in samples:
+                        key = (snapshot.address, name, tuple(sorted(sample["params"].items())))
+                        buffer = self.series.get(key)
+                        if buffer is None:
+                            spill_path = os.path.join(self._spill_dir.name, str(len(self.series)))
+                            buffer = self.series[key] = SeriesBuffer(spill_path)
+                        buffer.append(timestamp, sample["value"])
+
+    def summary(self, start: float = 0, end: float = float("inf")) -> dict:
+        """Summarizes series recorded within [start, end] by node address.
+
+        Gauges are summarized by min/max/last, counters by delta and rate, histogram buckets
+        are turned into request count and estimated quantiles.
+        """
+        with self._lock:
+            series = {key: buffer.read(start, end) for key, buffer in self.series.items()}
+
+        summary: dict[str, dict] = {}
+        histograms: dict[tuple[str, str, tuple], list[tuple[float, float]]] = {}
+        for (address, name, labels), samples in series.items():
+            if not samples:
+                continue
+            node_summary = summary.setdefault(address, {})
+            first, last = samples[0], samples[-1]
+            if name.endswith("_bucket"):
+                le = dict(labels).get("le")
+                other_labels = tuple((key, value) for key, value in labels if key != "le")
+                histograms.setdefault((address, name[: -len("_bucket")], other_labels), []).append(
+                    (float(le), _increase(samples))
+                )
+            elif name.endswith(("_total", "_count", "_sum")):
+                elapsed = last[0] - first[0]
+                delta = _increase(samples)
+                node_summary[_series_name(name, labels)] = {
+                    "delta": delta,
+                    "rate": delta / elapsed if elapsed > 0 else None,
+                }
+            else:
+                values = [value for _, value in samples]
+                node_summary[_series_name(name, labels)] = {"min": min(values), "max": max(values), "last": last[1]}
+
+        for (address, name, labels), buckets in histograms.items():
+            buckets.sort()
+            count = buckets[-1][1]
+            if count <= 0:
+                continue
+            histogram_summary = {"count": count}
+            for quantile in HISTOGRAM_QUANTILES:
+                histogram_summary[f"p{int(quantile * 100)}"] = _estimate_quantile(buckets, quantile)
+            summary.setdefault(address, {})[_series_name(name, labels)] = histogram_summary
+        return summary
+
+    def attach_summary(self, start: float = 0, end: float = float("inf"), name: str = "metrics summary") -> None:
+        allure.attach(json.dumps(self.summary(start, end), indent=2), name, allure.attachment_type.JSON)
+
+    def _run(self) -> None:
+        while True:
+            started = time.monotonic()
+            self.scrape()
+            if self._stop_event.wait(max(0, self.interval - (time.monotonic() - started))):
+                break
+
+    def _scrape_node(self, node):
+        try:
+            return self.client.scrape(node, self.families)
+        except Exception as exc:
+            with self._lock:
+                self.scrape_errors += 1
+            logger.debug(f"Could not scrape metrics of {node.prometheus_address}: {exc}")
+            return None
+
+
+def _series_name(name: str, labels: tuple) -> str:
+    if not labels:
+        return name
+    return name + "{" + ",".join(f'{key}="{value}"' for key, value in labels) + "}"
+
+
+def _increase(samples: list[tuple[float, float]]) -> float:
+    """Returns increase of a counter, counter resets (e.g. on service restart) are taken into account."""
+    increase = 0.0
+    for (_, previous), (_, value) in zip(samples, samples[1:]):
+        increase += value - previous if value >= previous else value
+    return increase
+
+
+def _estimate_quantile(buckets: list[tuple[float, float]], quantile: float) -> Optional[float]:
+    """Estimates quantile from cumulative histogram buckets the same way as Prometheus histogram_quantile."""
+    rank = quantile * buckets[-1][1]
+    lower_bound, lower_count = 0.0, 0.0
+    for upper_bound, count in buckets:
+        if count >= rank:
+            if upper_bound == float("inf"):
+                return lower_bound
+            if count == lower_count:
+                return upper_bound
+            return lower_bound + (upper_bound - lower_bound) * (rank - lower_count) / (count - lower_count)
+        lower_bound, lower_count = upper_bound, count
+    return None
@@ -3,19 +3,28 @@ import logging
 import os
 import random
 import re
+import time
 import uuid
-from typing import Any, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Optional, Union
 
 import allure
+import yaml
 from helpers import json_transformers
 from helpers.common import (
     NEOFS_CLI_EXEC,
+    NEOFS_OBJECT_BACKEND,
     TEST_FILES_DIR,
     TEST_OBJECTS_DIR,
     WALLET_CONFIG,
     get_assets_dir_path,
 )
+from helpers.tzhash import TZHash
 from neofs_testlib.cli import NeofsCli
+from neofs_testlib.grpc_client import ObjectClient, ObjectTooLargeError, Signer
+from neofs_testlib.grpc_client.object_client import DEFAULT_TTL, object_to_json, parse_search_filter
 from neofs_testlib.shell import Shell
 
 logger = logging.getLogger("NeoLogger")
@@ -23,6 +32,9 @@ logger = logging.getLogger("NeoLogger")
 # https://github.com/nspcc-dev/neofs-api/blob/5c3535423c564fe63991812cb84d8334db1c553a/object/service.proto#L319
 NEOFS_API_HEADER_LIMIT = 16384
 
+# Max number of concurrent operations of batch verbs (put_objects, get_objects, head_objects)
+BATCH_MAX_WORKERS = 8
+
 CONFIG_KEYS_MAPPING = {
     "MaxObjectSize": "maximum_object_size",
     "BasicIncomeRate": "storage_price",
@@ -34,6 +46,44 @@ CONFIG_KEYS_MAPPING = {
 }
 
 
+@lru_cache(maxsize=1)
+def get_grpc_object_client() -> ObjectClient:
+    return ObjectClient(homomorphic_hasher=TZHash.hash_data)
+
+
+@lru_cache
+def _wallet_config_password(wallet_config: str) -> str:
+    with open(wallet_config) as file:
+        return (yaml.safe_load(file) or {}).get("password", "")
+
+
+def _grpc_signer(wallet: str, wallet_config: Optional[str]) -> Signer:
+    return Signer.from_wallet(wallet, _wallet_config_password(wallet_config or WALLET_CONFIG))
+
+
+def _use_grpc_backend(wallet: str, endpoint: Optional[str], *cli_only_options) -> bool:
+    """
+    Checks whether an object verb should be executed with the in-process gRPC client.
+
+    Options the gRPC backend doesn't support (tokens, raw requests etc.) are passed as
+    `cli_only_options`, calls with any of them set are executed with neofs-cli.
+    """
+    return NEOFS_OBJECT_BACKEND == "grpc" and bool(endpoint) and os.path.isfile(wallet) and not any(cli_only_options)
+
+
+def _parse_range(range_cut: str) -> Optional[tuple[int, int]]:
+    """
+    Parses `offset:length` range, returns None for ranges neofs-cli rejects, so their errors are kept.
+    """
+    match = re.fullmatch(r"(\d+):(\d+)", range_cut)
+    if not match:
+        return None
+    offset, length = int(match.group(1)), int(match.group(2))
+    if length == 0 or offset + length >= 2**64:
+        return None
+    return offset, length
+
+
 @allure.step("Get object from random node")
 def get_object_from_random_node(
     wallet: str,
@@ -154,6 +204,12 @@ def get_object(
         write_object = str(uuid.uuid4())
     file_path = os.path.join(get_assets_dir_path(), TEST_OBJECTS_DIR, write_object)
 
+    if _use_grpc_backend(wallet, endpoint, bearer, session, is_raw, complex_object):
+        _, payload = get_grpc_object_client().get(endpoint, _grpc_signer(wallet, wallet_config), cid, oid, xhdr=xhdr)
+        with open(file_path, "wb") as file:
+            file.write(payload)
+        return file_path
+
     cli = NeofsCli(shell, NEOFS_CLI_EXEC, wallet_config or WALLET_CONFIG)
     stdout = cli.object.get(
         rpc_endpoint=endpoint,
@@ -336,6 +392,24 @@ def put_object(
         (str): ID of uploaded Object
     """
 
+    if _use_grpc_backend(wallet, endpoint, bearer, session):
+        with open(path, "rb") as file:
+            payload = file.read()
+        try:
+            return get_grpc_object_client().put(
+                endpoint,
+                _grpc_signer(wallet, wallet_config),
+                cid,
+                payload,
+                # neofs-cli sets these attributes by default
+                attributes={"FileName": os.path.basename(path), "Timestamp": int(time.time()), **(attributes or {})},
+                expire_at=expire_at,
+                lifetime=lifetime,
+                xhdr=xhdr,
+            )
+        except ObjectTooLargeError as e:
+            logger.info(f"{e}, putting object with neofs-cli")
+
     cli = NeofsCli(shell, NEOFS_CLI_EXEC, wallet_config or WALLET_CONFIG)
     result = cli.object.put(
         rpc_endpoint=endpoint,
@@ -387,6 +461,9 @@ def delete_object(
         (str): Tombstone ID
     """
 
+    if _use_grpc_backend(wallet, endpoint, bearer, session):
+        return get_grpc_object_client().delete(endpoint, _grpc_signer(wallet, wallet_config), cid, oid, xhdr=xhdr)
+
     cli = NeofsCli(shell, NEOFS_CLI_EXEC, wallet_config or WALLET_CONFIG)
     result = cli.object.delete(
         rpc_endpoint=endpoint,
@@ -437,6 +514,15 @@ def get_range(
     """
     range_file_path = os.path.join(get_assets_dir_path(), TEST_OBJECTS_DIR, str(uuid.uuid4()))
 
+    payload_range = _parse_range(range_cut)
+    if _use_grpc_backend(wallet, endpoint, bearer, session, is_raw, complex_object, payload_range is None):
+        content = get_grpc_object_client().get_range(
+            endpoint, _grpc_signer(wallet, wallet_config), cid, oid, *payload_range, xhdr=xhdr
+        )
+        with open(range_file_path, "wb") as file:
+            file.write(content)
+        return range_file_path, content
+
     cli = NeofsCli(shell, NEOFS_CLI_EXEC, wallet_config or WALLET_CONFIG)
     stdout = cli.object.range(
         rpc_endpoint=endpoint,
@@ -615,27 +701,47 @@ def search_object(
         and a cursor to continue the search, if any
     """
 
-    cli = NeofsCli(shell, NEOFS_CLI_EXEC, wallet_config or WALLET_CONFIG)
-    result = cli.object.search(
-        rpc_endpoint=rpc_endpoint,
-        wallet=wallet,
-        cid=cid,
-        filters=",".join(filters) if filters else None,
-        attributes=",".join(attributes) if attributes else None,
-        count=count,
-        cursor=cursor,
-        address=address,
-        bearer=bearer,
-        oid=oid,
-        phy=phy,
-        root=root,
-        session=session,
-        ttl=ttl,
-        xhdr=xhdr,
-        timeout=timeout,
-    )
-
-    found_objects, next_cursor = parse_search_output(result.stdout)
+    try:
+        search_filters = [parse_search_filter(search_filter) for search_filter in filters or []]
+    except ValueError:
+        # filters in JSON files and invalid filters are handled by neofs-cli
+        search_filters = None
+
+    if _use_grpc_backend(
+        wallet, rpc_endpoint, search_filters is None, attributes, address, bearer, oid, phy, root, session
+    ):
+        found_ids, next_cursor = get_grpc_object_client().search(
+            rpc_endpoint,
+            _grpc_signer(wallet, wallet_config),
+            cid,
+            filters=search_filters,
+            count=count,
+            cursor=cursor,
+            ttl=ttl or DEFAULT_TTL,
+            xhdr=xhdr,
+        )
+        found_objects = [{"id": found_id, "attrs": []} for found_id, _ in found_ids]
+    else:
+        cli = NeofsCli(shell, NEOFS_CLI_EXEC, wallet_config or WALLET_CONFIG)
+        result = cli.object.search(
+            rpc_endpoint=rpc_endpoint,
+            wallet=wallet,
+            cid=cid,
+            filters=",".join(filters) if filters else None,
+            attributes=",".join(attributes) if attributes else None,
+            count=count,
+            cursor=cursor,
+            address=address,
+            bearer=bearer,
+            oid=oid,
+            phy=phy,
+            root=root,
+            session=session,
+            ttl=ttl,
+            xhdr=xhdr,
+            timeout=timeout,
+        )
+        found_objects, next_cursor = parse_search_output(result.stdout)
 
     if expected_objects_list:
         found_objects_ids = [obj["id"] for obj in found_objects]
@@ -750,33 +856,44 @@ def head_object(
         (str): HEAD response as a plain text
     """
 
-    cli = NeofsCli(shell, NEOFS_CLI_EXEC, wallet_config or WALLET_CONFIG)
-    result = cli.object.head(
-        rpc_endpoint=endpoint,
-        wallet=wallet,
-        cid=cid,
-        oid=oid,
-        bearer=bearer,
-        json_mode=json_output,
-        raw=is_raw,
-        ttl=1 if is_direct else None,
-        xhdr=xhdr,
-        session=session,
-    )
-
-    if not json_output:
-        return result
-
-    try:
-        decoded = json.loads(result.stdout)
-    except Exception as exc:
-        # If we failed to parse output as JSON, the cause might be
-        # the plain text string in the beginning of the output.
-        # Here we cut off first string and try to parse again.
-        logger.info(f"failed to parse output: {exc}")
-        logger.info("parsing output in another way")
-        fst_line_idx = result.stdout.find("\n")
-        decoded = json.loads(result.stdout[fst_line_idx:])
+    if _use_grpc_backend(wallet, endpoint, bearer, session, not json_output, is_raw):
+        obj = get_grpc_object_client().head(
+            endpoint,
+            _grpc_signer(wallet, wallet_config),
+            cid,
+            oid,
+            ttl=1 if is_direct else DEFAULT_TTL,
+            xhdr=xhdr,
+        )
+        decoded = object_to_json(obj)
+    else:
+        cli = NeofsCli(shell, NEOFS_CLI_EXEC, wallet_config or WALLET_CONFIG)
+        result = cli.object.head(
+            rpc_endpoint=endpoint,
+            wallet=wallet,
+            cid=cid,
+            oid=oid,
+            bearer=bearer,
+            json_mode=json_output,
+            raw=is_raw,
+            ttl=1 if is_direct else None,
+            xhdr=xhdr,
+            session=session,
+        )
+
+        if not json_output:
+            return result
+
+        try:
+            decoded = json.loads(result.stdout)
+        except Exception as exc:
+            # If we failed to parse output as JSON, the cause might be
+            # the plain text string in the beginning of the output.
+            # Here we cut off first string and try to parse again.
+            logger.info(f"failed to parse output: {exc}")
+            logger.info("parsing output in another way")
+            fst_line_idx = result.stdout.find("\n")
+            decoded = json.loads(result.stdout[fst_line_idx:])
 
     # If response is Complex Object header, it has `splitId` key
     if "splitId" in decoded.keys():
@@ -800,3 +917,188 @@ def head_object(
 
     logger.info("decoding simple header")
     return json_transformers.decode_simple_header(decoded)
+
+
+@dataclass
+class BatchResult:
+    """Result of a single operation of a batch verb.
+
+    Attributes:
+        endpoint: Endpoint the operation has been sent to.
+        value: Result of the operation (as returned by the corresponding single-object verb).
+        error: Exception raised by the operation, if any.
+        latency: Duration of the operation in seconds.
+    """
+
+    endpoint: str
+    value: Any = None
+    error: Optional[Exception] = None
+    latency: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _batch_endpoints(neofs_env, endpoints: Optional[list[str]]) -> list[str]:
+    if endpoints:
+        return endpoints
+    if neofs_env is None:
+        raise ValueError("Either neofs_env or endpoints should be specified")
+    return [node.endpoint for node in neofs_env.storage_nodes]
+
+
+def _run_batch(
+    operation: Callable[[int, str], Any], count: int, endpoints: list[str], max_workers: int, raise_on_error: bool
+) -> list[BatchResult]:
+    """Runs `operation(index, endpoint)` for every index over a thread pool, endpoints are taken round-robin."""
+
+    def run(index: int) -> BatchResult:
+        result = BatchResult(endpoint=endpoints[index % len(endpoints)])
+        start_time = time.perf_counter()
+        try:
+            result.value = operation(index, result.endpoint)
+        except Exception as err:
+            result.error = err
+        result.latency = time.perf_counter() - start_time
+        return result
+
+    if count == 0:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, count)) as executor:
+        results = list(executor.map(run, range(count)))
+
+    latencies = sorted(result.latency for result in results)
+    failed = [(index, result) for index, result in enumerate(results) if not result.ok]
+    summary = [
+        f"operations: {count}, failed: {len(failed)}, workers: {min(max_workers, count)}",
+        f"latency, s: min {latencies[0]:.3f}, median {latencies[len(latencies) // 2]:.3f}, max {latencies[-1]:.3f}",
+    ]
+    summary.extend(f"#{index} at {result.endpoint}: {result.error}" for index, result in failed)
+    allure.attach("\n".join(summary), "Batch summary", allure.attachment_type.TEXT)
+
+    if failed and raise_on_error:
+        index, result = failed[0]
+        raise RuntimeError(f"{len(failed)} of {count} operations failed, first one (#{index}): {result.error}") from (
+            result.error
+        )
+    return results
+
+
+def put_objects(
+    wallet: str,
+    paths: list[str],
+    cid: str,
+    shell: Shell,
+    neofs_env=None,
+    endpoints: Optional[list[str]] = None,
+    attributes: Optional[list[Optional[dict]]] = None,
+    max_workers: int = BATCH_MAX_WORKERS,
+    raise_on_error: bool = True,
+    **kwargs,
+) -> list[BatchResult]:
+    """
+    PUT of given files concurrently, requests are spread across storage nodes.
+
+    Args:
+        wallet: wallet on whose behalf PUT is done
+        paths: paths to files to be PUT
+        cid: ID of Container where we put the Objects to
+        shell: executor for cli command
+        neofs_env: neofs env under test, its storage nodes are used if `endpoints` are not specified
+        endpoints: NeoFS endpoints to send requests to
+        attributes: user attributes of every object
+        max_workers: max number of concurrent requests
+        raise_on_error: raise an exception if any PUT fails
+        kwargs: other arguments of `put_object` common for all objects
+    Returns:
+        results of PUTs in the order of `paths`, values are IDs of uploaded objects
+    """
+    endpoints = _batch_endpoints(neofs_env, endpoints)
+
+    def put(index: int, endpoint: str) -> str:
+        # the batch is reported as a single step, so the undecorated verb is called
+        return put_object.__wrapped__(
+            wallet,
+            paths[index],
+            cid,
+            shell,
+            endpoint,
+            attributes=attributes[index] if attributes else None,
+            **kwargs,
+        )
+
+    with allure.step(f"Put {len(paths)} objects in container {cid}"):
+        return _run_batch(put, len(paths), endpoints, max_workers, raise_on_error)
+
+
+def get_objects(
+    wallet: str,
+    cid: str,
+    oids: list[str],
+    shell: Shell,
+    neofs_env=None,
+    endpoints: Optional[list[str]] = None,
+    max_workers: int = BATCH_MAX_WORKERS,
+    raise_on_error: bool = True,
+    **kwargs,
+) -> list[BatchResult]:
+    """
+    GET of given objects concurrently, requests are spread across storage nodes.
+
+    Args:
+        wallet: wallet on whose behalf GET is done
+        cid: ID of Container where we get the Objects from
+        oids: Object IDs
+        shell: executor for cli command
+        neofs_env: neofs env under test, its storage nodes are used if `endpoints` are not specified
+        endpoints: NeoFS endpoints to send requests to
+        max_workers: max number of concurrent requests
+        raise_on_error: raise an exception if any GET fails
+        kwargs: other arguments of `get_object` common for all objects
+    Returns:
+        results of GETs in the order of `oids`, values are paths to downloaded files
+    """
+    endpoints = _batch_endpoints(neofs_env, endpoints)
+
+    def get(index: int, endpoint: str) -> str:
+        return get_object.__wrapped__(wallet, cid, oids[index], shell, endpoint, **kwargs)
+
+    with allure.step(f"Get {len(oids)} objects from container {cid}"):
+        return _run_batch(get, len(oids), endpoints, max_workers, raise_on_error)
+
+
+def head_objects(
+    wallet: str,
+    cid: str,
+    oids: list[str],
+    shell: Shell,
+    neofs_env=None,
+    endpoints: Optional[list[str]] = None,
+    max_workers: int = BATCH_MAX_WORKERS,
+    raise_on_error: bool = True,
+    **kwargs,
+) -> list[BatchResult]:
+    """
+    HEAD of given objects concurrently, requests are spread across storage nodes.
+
+    Args:
+        wallet: wallet on whose behalf HEAD is done
+        cid: ID of Container where we get the Objects from
+        oids: Object IDs
+        shell: executor for cli command
+        neofs_env: neofs env under test, its storage nodes are used if `endpoints` are not specified
+        endpoints: NeoFS endpoints to send requests to
+        max_workers: max number of concurrent requests
+        raise_on_error: raise an exception if any HEAD fails
+        kwargs: other arguments of `head_object` common for all objects
+    Returns:
+        results of HEADs in the order of `oids`, values are HEAD responses
+    """
+    endpoints = _batch_endpoints(neofs_env, endpoints)
+
+    def head(index: int, endpoint: str) -> Any:
+        return head_object.__wrapped__(wallet, cid, oids[index], shell, endpoint, **kwargs)
+
+    with allure.step(f"Head {len(oids)} objects from container {cid}"):
+        return _run_batch(head, len(oids), endpoints, max_workers, raise_on_error)
@@ -6,19 +6,30 @@ import shutil
 import threading
 import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import BinaryIO, Iterator, Optional
 
 import allure
+import base58
 import neofs_env.neofs_epoch as neofs_epoch
+from google.protobuf.message import DecodeError
 from helpers.common import FSCHAIN_BLOCK_TIME, NEOFS_CLI_EXEC
 from helpers.utility import parse_time
 from neofs_testlib.cli import NeofsCli
 from neofs_testlib.env.env import NeoFSEnv, StorageNode
+from neofs_testlib.protobuf.generated.object import types_pb2 as object_types_pb2
+from neofs_testlib.protobuf.generated.refs import types_pb2 as refs_types_pb2
 from neofs_testlib.shell import Shell
 from neofs_testlib.utils import wallet as wallet_utils
 
 logger = logging.getLogger("NeoLogger")
 
+# Files written by FSTree that hold several objects start with this byte (it can't start a protobuf message),
+# every object in such a file is prefixed with the byte, a version byte, object ID and 4-byte BE length of the object
+FSTREE_COMBINED_PREFIX = 0x7F
+FSTREE_COMBINED_ID_OFFSET = 2
+FSTREE_OBJECT_ID_SIZE = 32
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
 
 @dataclass
 class HealthStatus:
@@ -183,65 +194,216 @@ def delete_node_metadata(node: StorageNode) -> None:
     node.delete_metadata()
 
 
-def find_and_extract_lock_objects(node: StorageNode, neofs_env: NeoFSEnv) -> list[dict]:
-    lock_objects = []
+@dataclass
+class FSTreeObject:
+    """Object stored in FSTree of a shard.
+
+    Attributes:
+        cid: Container ID.
+        oid: Object ID.
+        type: Object type (REGULAR, TOMBSTONE, LOCK, LINK, ...) or UNKNOWN if it can't be determined.
+        size: Payload length or None if it is unknown.
+        path: Path to the file with the object.
+    """
 
-    for shard in node.shards:
-        fstree_path = shard.fstree_path
+    cid: str
+    oid: str
+    type: str
+    size: Optional[int]
+    path: str
+
+    @property
+    def address(self) -> str:
+        return f"{self.cid}/{self.oid}"
+
+
+def _read_varint(file: BinaryIO) -> Optional[int]:
+    result, shift = 0, 0
+    while True:
+        byte = file.read(1)
+        if not byte:
+            return None
+        result |= (byte[0] & 0x7F) << shift
+        if not byte[0] & 0x80:
+            return result
+        shift += 7
+
+
+def _read_object_header(file: BinaryIO) -> Optional[tuple[bytes, object_types_pb2.Header]]:
+    """Reads ID and header of a protobuf-encoded object from the current position, skipping its payload.
+
+    Returns:
+        Object ID and header or None if data is not an object in the expected format.
+    """
+    object_id = b""
+    while True:
+        key = _read_varint(file)
+        # all fields of an object are length-delimited
+        if key is None or key & 0x7 != 2:
+            return None
+        length = _read_varint(file)
+        if length is None:
+            return None
+        field = key >> 3
+        if field == 1:
+            object_id = refs_types_pb2.ObjectID.FromString(file.read(length)).value
+        elif field == 3:
+            header = object_types_pb2.Header.FromString(file.read(length))
+            return object_id, header
+        else:
+            file.seek(length, os.SEEK_CUR)
+
+
+def _seek_combined_object(file: BinaryIO, object_id: bytes) -> bool:
+    """Moves position of a file with several objects to the start of the specified one."""
+    while True:
+        prefix = file.read(FSTREE_COMBINED_ID_OFFSET + FSTREE_OBJECT_ID_SIZE + 4)
+        if len(prefix) < FSTREE_COMBINED_ID_OFFSET + FSTREE_OBJECT_ID_SIZE + 4 or prefix[0] != FSTREE_COMBINED_PREFIX:
+            return False
+        if prefix[FSTREE_COMBINED_ID_OFFSET : FSTREE_COMBINED_ID_OFFSET + FSTREE_OBJECT_ID_SIZE] == object_id:
+            return True
+        file.seek(int.from_bytes(prefix[-4:], "big"), os.SEEK_CUR)
+
+
+def _parse_fstree_file(path: str, cid: str, oid: str) -> Optional[FSTreeObject]:
+    with open(path, "rb") as file:
+        first_byte = file.read(1)
+        file.seek(0)
+        if (
+            first_byte
+            and first_byte[0] == FSTREE_COMBINED_PREFIX
+            and not _seek_combined_object(file, base58.b58decode(oid))
+        ):
+            return None
+        start = file.tell()
+        if file.read(len(ZSTD_MAGIC)) == ZSTD_MAGIC:
+            return None
+        file.seek(start)
+        try:
+            parsed = _read_object_header(file)
+        except DecodeError:
+            return None
+    if parsed is None:
+        return None
+    object_id, header = parsed
+    object_type = header.object_type
+    return FSTreeObject(
+        cid=base58.b58encode(header.container_id.value).decode() or cid,
+        oid=base58.b58encode(object_id).decode() or oid,
+        type=object_types_pb2.ObjectType.Name(object_type)
+        if object_type in object_types_pb2.ObjectType.values()
+        else str(object_type),
+        size=header.payload_length,
+        path=path,
+    )
+
+
+def _inspect_fstree_file_with_lens(
+    path: str, fstree_path: str, cid: str, oid: str, neofs_env: NeoFSEnv
+) -> FSTreeObject:
+    obj_info = neofs_env.neofs_lens().fstree.get(f"{cid}/{oid}", fstree_path).stdout
+    object_type = re.search(r"Type: (\w+)", obj_info)
+    return FSTreeObject(cid, oid, object_type.group(1) if object_type else "UNKNOWN", None, path)
+
+
+def iter_fstree_objects(
+    fstree_path: str, types: Optional[set[str]] = None, neofs_env: Optional[NeoFSEnv] = None
+) -> Iterator[FSTreeObject]:
+    """Lazily lists objects of an FSTree by reading its files directly, the node may be stopped.
 
-        result = neofs_env.neofs_lens().fstree.list(fstree_path)
-        object_addresses = result.stdout.strip().split("\n")
+    Object headers are parsed in Python; compressed objects are inspected with `neofs-lens fstree get`
+    if `neofs_env` is given (otherwise their type is UNKNOWN).
 
-        for address in object_addresses:
-            if not address.strip():
+    Args:
+        fstree_path: FSTree root directory.
+        types: Object types to return, all objects are returned if not specified.
+        neofs_env: Environment to run neofs-lens from.
+
+    Returns:
+        Iterator over objects of the FSTree.
+    """
+    for root, dirs, files in os.walk(fstree_path):
+        dirs.sort()
+        for file_name in sorted(files):
+            path = os.path.join(root, file_name)
+            # file names are "<oid>.<cid>" split into nested directories by prefix
+            address = os.path.relpath(path, fstree_path).replace(os.sep, "")
+            if address.startswith(".") or "." not in address:
+                continue
+            oid, cid = address.split(".", 1)
+            try:
+                obj = _parse_fstree_file(path, cid, oid)
+            except (FileNotFoundError, ValueError):
+                # the object has been removed meanwhile or the file name is not an address
                 continue
+            if obj is None:
+                if neofs_env is None:
+                    obj = FSTreeObject(cid, oid, "UNKNOWN", None, path)
+                else:
+                    obj = _inspect_fstree_file_with_lens(path, fstree_path, cid, oid, neofs_env)
+            if types is None or obj.type in types:
+                yield obj
+
+
+def iter_node_objects(
+    node: StorageNode, types: Optional[set[str]] = None, neofs_env: Optional[NeoFSEnv] = None
+) -> Iterator[FSTreeObject]:
+    """Lazily lists objects of all shards of the node, see `iter_fstree_objects`."""
+    for shard in node.shards:
+        yield from iter_fstree_objects(shard.fstree_path, types, neofs_env)
 
-            obj_info = neofs_env.neofs_lens().fstree.get(address, fstree_path)
 
-            if "Type: LOCK" in obj_info.stdout:
-                parts = address.split("/")
-                if len(parts) == 2:
-                    cid, oid = parts[0], parts[1]
+@allure.step("Build object index of {node}")
+def build_node_object_index(node: StorageNode, neofs_env: Optional[NeoFSEnv] = None) -> dict[str, list[FSTreeObject]]:
+    """
+    The function reads all shards of the node in one pass, the node may be stopped.
+    Args:
+        node: node to index.
+        neofs_env: environment to run neofs-lens from for objects that can't be parsed in Python.
+    Returns:
+        objects of the node by their addresses (cid/oid), an object may be stored in several shards.
+    """
+    index: dict[str, list[FSTreeObject]] = {}
+    for obj in iter_node_objects(node, neofs_env=neofs_env):
+        index.setdefault(obj.address, []).append(obj)
+    return index
 
-                    temp_dir = "/tmp/lock_objects"
-                    os.makedirs(temp_dir, exist_ok=True)
-                    temp_path = os.path.join(temp_dir, f"lock_{oid}")
 
-                    neofs_env.neofs_lens().fstree.get(address, fstree_path, out=temp_path)
+def find_and_extract_lock_objects(node: StorageNode, neofs_env: NeoFSEnv) -> list[dict]:
+    lock_objects = []
 
-                    fstree_file_path = os.path.join(fstree_path, cid, oid)
+    for shard in node.shards:
+        fstree_path = shard.fstree_path
 
-                    lock_objects.append(
-                        {
-                            "cid": cid,
-                            "oid": oid,
-                            "temp_path": temp_path,
-                            "fstree_file_path": fstree_file_path,
-                            "shard_path": fstree_path,
-                            "address": address,
-                        }
-                    )
-                    logger.info(f"Found and extracted LOCK object: {address} to {temp_path}")
+        for obj in iter_fstree_objects(fstree_path, types={"LOCK"}, neofs_env=neofs_env):
+            temp_dir = "/tmp/lock_objects"
+            os.makedirs(temp_dir, exist_ok=True)
+            temp_path = os.path.join(temp_dir, f"lock_{obj.oid}")
 
-    return lock_objects
+            neofs_env.neofs_lens().fstree.get(obj.address, fstree_path, out=temp_path)
 
+            fstree_file_path = os.path.join(fstree_path, obj.cid, obj.oid)
 
-def check_tombstone_objects_exist(nodes: list[StorageNode], neofs_env: NeoFSEnv) -> bool:
-    for node in nodes:
-        for shard in node.shards:
-            fstree_path = shard.fstree_path
+            lock_objects.append(
+                {
+                    "cid": obj.cid,
+                    "oid": obj.oid,
+                    "temp_path": temp_path,
+                    "fstree_file_path": fstree_file_path,
+                    "shard_path": fstree_path,
+                    "address": obj.address,
+                }
+            )
+            logger.info(f"Found and extracted LOCK object: {obj.address} to {temp_path}")
 
-            result = neofs_env.neofs_lens().fstree.list(fstree_path)
-            object_addresses = result.stdout.strip().split("\n")
+    return lock_objects
 
-            for address in object_addresses:
-                if not address.strip():
-                    continue
 
-                obj_info = neofs_env.neofs_lens().fstree.get(address, fstree_path)
-                if "Type: TOMBSTONE" in obj_info.stdout:
-                    logger.info(f"Found TOMBSTONE object: {address}")
-                    return True
+def check_tombstone_objects_exist(nodes: list[StorageNode], neofs_env: NeoFSEnv) -> bool:
+    for node in nodes:
+        for obj in iter_node_objects(node, types={"TOMBSTONE"}, neofs_env=neofs_env):
+            logger.info(f"Found TOMBSTONE object: {obj.address}")
+            return True
 
     return False
 
@@ -0,0 +1,245 @@
+import gzip
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+import allure
+import requests
+from neofs_testlib.env.env import StorageNode
+
+logger = logging.getLogger("NeoLogger")
+
+# Profiles captured from every storage node, CPU profile is collected for PPROF_CPU_SECONDS
+PPROF_PROFILES = ("profile", "heap", "goroutine", "mutex")
+PPROF_CPU_SECONDS = 10
+PPROF_TOP_N = 20
+PPROF_REQUEST_TIMEOUT = 30
+
+
+@dataclass
+class PprofProfile:
+    """Decoded pprof profile, only parts needed to aggregate samples by function are kept."""
+
+    sample_types: list[tuple[str, str]] = field(default_factory=list)
+    samples: list[tuple[list[int], list[int]]] = field(default_factory=list)
+    # function ids of location lines, innermost (inlined) function first
+    locations: dict[int, list[int]] = field(default_factory=dict)
+    functions: dict[int, int] = field(default_factory=dict)
+    string_table: list[str] = field(default_factory=list)
+
+    def function_name(self, function_id: int) -> str:
+        name_index = self.functions.get(function_id)
+        return self.string_table[name_index] if name_index is not None else f"<function {function_id}>"
+
+    def top(self, n: int = PPROF_TOP_N, sample_index: int = -1) -> list[tuple[str, int, int]]:
+        """Returns top functions by flat value as (name, flat, cum) tuples.
+
+        Args:
+            n: Number of functions to return.
+            sample_index: Index of the sample value to aggregate, the last one (e.g. CPU time or
+                in-use heap space) by default, the same as `go tool pprof` does.
+        """
+        flat, cum = defaultdict(int), defaultdict(int)
+        for location_ids, values in self.samples:
+            if not values:
+                continue
+            value = values[sample_index]
+            stack = [function_id for location_id in location_ids for function_id in self.locations.get(location_id, [])]
+            if not stack:
+                continue
+            flat[stack[0]] += value
+            for function_id in set(stack):
+                cum[function_id] += value
+        top = sorted(
+            (function_id for function_id in cum if flat[function_id] or cum[function_id]),
+            key=lambda function_id: (flat[function_id], cum[function_id]),
+            reverse=True,
+        )[:n]
+        return [(self.function_name(function_id), flat[function_id], cum[function_id]) for function_id in top]
+
+    def total(self, sample_index: int = -1) -> int:
+        return sum(values[sample_index] for _, values in self.samples if values)
+
+
+def _read_varint(data: bytes, position: int) -> tuple[int, int]:
+    result, shift = 0, 0
+    while True:
+        byte = data[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, position
+        shift += 7
+
+
+def _iter_fields(data: bytes) -> Iterator[tuple[int, int, int | bytes]]:
+    position = 0
+    while position < len(data):
+        key, position = _read_varint(data, position)
+        field_number, wire_type = key >> 3, key & 0x7
+        if wire_type == 0:
+            value, position = _read_varint(data, position)
+        elif wire_type == 2:
+            length, position = _read_varint(data, position)
+            value = data[position : position + length]
+            position += length
+        elif wire_type == 1:
+            value = int.from_bytes(data[position : position + 8], "little")
+            position += 8
+        elif wire_type == 5:
+            value = int.from_bytes(data[position : position + 4], "little")
+            position += 4
+        else:
+            raise ValueError(f"Unsupported protobuf wire type {wire_type}")
+        yield field_number, wire_type, value
+
+
+def _repeated_varints(value: int | bytes) -> list[int]:
+    # repeated scalars might be either packed or not
+    if isinstance(value, int):
+        return [value]
+    values, position = [], 0
+    while position < len(value):
+        item, position = _read_varint(value, position)
+        values.append(item)
+    return values
+
+
+def _to_int64(value: int) -> int:
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def parse_pprof_profile(data: bytes) -> PprofProfile:
+    """Decodes profile in pprof format (gzipped profile.proto message)."""
+    if data[:2] == b"\x1f\x8b":
+        data = gzip.decompress(data)
+
+    profile = PprofProfile()
+    sample_types = []
+    for field_number, _, value in _iter_fields(data):
+        if field_number == 1:
+            fields = {number: item for number, _, item in _iter_fields(value)}
+            sample_types.append((fields.get(1, 0), fields.get(2, 0)))
+        elif field_number == 2:
+            location_ids, values = [], []
+            for number, _, item in _iter_fields(value):
+                if number == 1:
+                    location_ids.extend(_repeated_varints(item))
+                elif number == 2:
+                    values.extend(_to_int64(v) for v in _repeated_varints(item))
+            profile.samples.append((location_ids, values))
+        elif field_number == 4:
+            location_id, function_ids = 0, []
+            for number, _, item in _iter_fields(value):
+                if number == 1:
+                    location_id = item
+                elif number == 4:
+                    line = {line_number: line_item for line_number, _, line_item in _iter_fields(item)}
+                    function_ids.append(line.get(1, 0))
+            profile.locations[location_id] = function_ids
+        elif field_number == 5:
+            fields = {number: item for number, _, item in _iter_fields(value)}
+            profile.functions[fields.get(1, 0)] = fields.get(2, 0)
+        elif field_number == 6:
+            profile.string_table.append(value.decode(errors="replace"))
+
+    profile.sample_types = [
+        (profile.string_table[type_index], profile.string_table[unit_index]) for type_index, unit_index in sample_types
+    ]
+    return profile
+
+
+def format_top(profile: PprofProfile, n: int = PPROF_TOP_N) -> str:
+    """Formats top functions of the profile like `go tool pprof -top` does."""
+    if not profile.sample_types:
+        return "no sample types in profile"
+    sample_type, unit = profile.sample_types[-1]
+    total = profile.total()
+    lines = [f"{sample_type} ({unit}), total: {total}", f"{'flat':>14} {'flat%':>7} {'cum':>14} {'cum%':>7}  function"]
+    for name, flat, cum in profile.top(n):
+        flat_percent = flat * 100 / total if total else 0
+        cum_percent = cum * 100 / total if total else 0
+        lines.append(f"{flat:>14} {flat_percent:>6.2f}% {cum:>14} {cum_percent:>6.2f}%  {name}")
+    if total == 0:
+        lines.append("no samples")
+    return "\n".join(lines)
+
+
+def fetch_profile(pprof_address: str, profile_name: str, cpu_seconds: int = PPROF_CPU_SECONDS) -> bytes:
+    params = {"seconds": cpu_seconds} if profile_name == "profile" else {}
+    resp = requests.get(
+        f"http://{pprof_address}/debug/pprof/{profile_name}",
+        params=params,
+        timeout=cpu_seconds + PPROF_REQUEST_TIMEOUT,
+    )
+    resp.raise_for_status()
+    return resp.content
+
+
+class PprofCapture:
+    """Captures pprof profiles from storage nodes in parallel in background.
+
+    Example:
+        capture = PprofCapture(neofs_env.storage_nodes)
+        capture.start()
+        ...
+        capture.attach()
+    """
+
+    def __init__(
+        self,
+        nodes: list[StorageNode],
+        profiles: tuple[str, ...] = PPROF_PROFILES,
+        cpu_seconds: int = PPROF_CPU_SECONDS,
+        top_n: int = PPROF_TOP_N,
+    ):
+        self.nodes = nodes
+        self.profiles = profiles
+        self.cpu_seconds = cpu_seconds
+        self.top_n = top_n
+        self.results: dict[tuple[str, str], bytes | Exception] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.capture, name="pprof-capture", daemon=True)
+            self._thread.start()
+
+    def capture(self) -> None:
+        targets = [(node.pprof_address, profile) for node in self.nodes for profile in self.profiles]
+        with ThreadPoolExecutor(max_workers=len(targets) or 1) as executor:
+            futures = {
+                target: executor.submit(fetch_profile, target[0], target[1], self.cpu_seconds) for target in targets
+            }
+            for target, future in futures.items():
+                try:
+                    self.results[target] = future.result()
+                except Exception as exc:
+                    logger.warning(f"Could not capture {target[1]} profile from {target[0]}: {exc}")
+                    self.results[target] = exc
+
+    def wait(self) -> None:
+        if self._thread is not None:
+            self._thread.join()
+
+    def attach(self) -> None:
+        """Waits for capture to finish and attaches gzipped profiles and their top-N summaries to allure."""
+        self.wait()
+        summaries = []
+        for (address, profile_name), result in self.results.items():
+            if isinstance(result, Exception):
+                summaries.append(f"=== {profile_name} @ {address}\ncapture failed: {result}")
+                continue
+            # Go serves profiles gzipped already
+            data = result if result[:2] == b"\x1f\x8b" else gzip.compress(result)
+            allure.attach(data, f"pprof {profile_name} {address}", extension="pb.gz")
+            try:
+                top = format_top(parse_pprof_profile(data), self.top_n)
+            except Exception as exc:
+                top = f"could not parse profile: {exc}"
+            summaries.append(f"=== {profile_name} @ {address}\n{top}")
+        if summaries:
+            allure.attach("\n\n".join(summaries), "pprof top", allure.attachment_type.TEXT)
@@ -1,12 +1,14 @@
 import base64
+import hashlib
 import json
 import logging
 import os
 import random
-import shutil
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
+from http.cookiejar import DefaultCookiePolicy
 from typing import Optional, Union
 from urllib.parse import quote
 
@@ -21,9 +23,29 @@ from helpers.complex_object_actions import get_nodes_without_object
 from helpers.file_helper import get_file_hash
 from helpers.neofs_verbs import get_object
 from neofs_testlib.shell import Shell
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger("NeoLogger")
 
+# Max number of keep-alive connections to REST gateway and number of objects transferred concurrently in batches
+REST_GATE_POOL_SIZE = 32
+REST_GATE_BATCH_WORKERS = 16
+# Size of chunks objects are streamed by
+REST_GATE_CHUNK_SIZE = 1024 * 1024
+
+
+def _create_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=REST_GATE_POOL_SIZE, pool_maxsize=REST_GATE_POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    # cookies set by responses must not be sent with requests of other tests
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+rest_session = _create_session()
+
 
 class SearchV2FilterMatch(Enum):
     MatchStringEqual = "EQ"
@@ -92,7 +114,7 @@ def get_via_rest_gate(
 
     if not skip_options_verify:
         verify_options_request(request)
-    resp = requests.get(request, stream=True, headers=req_headers or None, timeout=DEFAULT_OBJECT_OPERATION_TIMEOUT)
+    resp = rest_session.get(request, stream=True, headers=req_headers or None, timeout=DEFAULT_OBJECT_OPERATION_TIMEOUT)
 
     if not resp.ok:
         if expect_error:
@@ -110,8 +132,7 @@ def get_via_rest_gate(
     if return_response or expect_error:
         return resp
     file_path = os.path.join(get_assets_dir_path(), f"{cid}_{oid}")
-    with open(file_path, "wb") as file:
-        shutil.copyfileobj(resp.raw, file)
+    _download_to_file(resp, file_path)
     return file_path
 
 
@@ -140,7 +161,9 @@ def head_via_rest_gate(
         req_headers["Authorization"] = f"Bearer {session_token}"
 
     verify_options_request(request)
-    resp = requests.head(request, stream=True, headers=req_headers or None, timeout=DEFAULT_OBJECT_OPERATION_TIMEOUT)
+    resp = rest_session.head(
+        request, stream=True, headers=req_headers or None, timeout=DEFAULT_OBJECT_OPERATION_TIMEOUT
+    )
 
     if not resp.ok and not expect_error:
         raise Exception(
@@ -174,7 +197,7 @@ def get_via_rest_gate_by_attribute(
 
     if not skip_options_verify:
         verify_options_request(request)
-    resp = requests.get(request, stream=True, timeout=DEFAULT_OBJECT_OPERATION_TIMEOUT)
+    resp = rest_session.get(request, stream=True, timeout=DEFAULT_OBJECT_OPERATION_TIMEOUT)
 
     if not resp.ok:
         raise Exception(
@@ -191,8 +214,7 @@ def get_via_rest_gate_by_attribute(
         return resp
 
     file_path = os.path.join(get_assets_dir_path(), f"{cid}_{str(uuid.uuid4())}")
-    with open(file_path, "wb") as file:
-        shutil.copyfileobj(resp.raw, file)
+    _download_to_file(resp, file_path)
     return file_path
 
 
@@ -209,7 +231,7 @@ def head_via_rest_gate_by_attribute(cid: str, attribute: dict, endpoint: str) ->
     request = f"{endpoint}/objects/{cid}/by_attribute/{quote(str(attr_name))}/{attr_value}"
 
     verify_options_request(request)
-    resp = requests.head(request, stream=True, timeout=DEFAULT_OBJECT_OPERATION_TIMEOUT)
+    resp = rest_session.head(request, stream=True, timeout=DEFAULT_OBJECT_OPERATION_TIMEOUT)
 
     if not resp.ok:
         raise Exception(
@@ -322,21 +344,20 @@ def upload_via_rest_gate(
     file_content_type: str = None,
     error_pattern: Optional[str] = None,
     session_token: str = None,
+    chunked: bool = False,
 ) -> str:
     """
     This function upload given object through REST gate
     cid:      CID to get object from
-    path:     File path to upload
+    path:     File path to upload, the file is streamed without reading it into memory
     endpoint: REST gate endpoint
     headers:  Object header
     file_content_type: Content-Type header
     session_token: (optional) session token; adds Authorization: Bearer header automatically
+    chunked:  (optional) send the file with chunked transfer encoding instead of Content-Length
     """
     request = f"{endpoint}/objects/{cid}"
 
-    with open(path, "rb") as file:
-        file_content = file.read()
-
     if headers is None:
         headers = {}
 
@@ -347,9 +368,7 @@ def upload_via_rest_gate(
         headers["Content-Type"] = file_content_type
 
     verify_options_request(request)
-    resp = requests.post(
-        request, data=file_content, headers=headers, cookies=cookies, timeout=DEFAULT_OBJECT_OPERATION_TIMEOUT
-    )
+    resp = _post_object(request, path, headers, cookies, chunked)
 
     if not resp.ok:
         if error_pattern:
@@ -371,6 +390,142 @@ def upload_via_rest_gate(
     return resp.json().get("object_id")
 
 
+@dataclass
+class RestObjectDownload:
+    oid: str
+    file_path: str
+    size: int
+    sha256: str
+
+
+@allure.step("Upload objects via REST Gate concurrently")
+def upload_via_rest_gate_batch(
+    cid: str,
+    paths: list[str],
+    endpoint: str,
+    headers: dict = None,
+    session_token: str = None,
+    chunked: bool = False,
+    max_workers: int = REST_GATE_BATCH_WORKERS,
+) -> list[str]:
+    """
+    This function uploads given files through REST gate concurrently
+    cid:      CID to put objects to
+    paths:    File paths to upload
+    endpoint: REST gate endpoint
+    headers:  (optional) headers of every object
+    session_token: (optional) session token; adds Authorization: Bearer header automatically
+    chunked:  (optional) send files with chunked transfer encoding instead of Content-Length
+    max_workers: (optional) number of objects uploaded concurrently
+    Returns IDs of the objects in the order of paths
+    """
+    request = f"{endpoint}/objects/{cid}"
+    headers = dict(headers) if headers else {}
+    if session_token:
+        headers["Authorization"] = f"Bearer {session_token}"
+
+    def upload(path: str) -> str:
+        resp = _post_object(request, path, headers, chunked=chunked)
+        if not resp.ok:
+            raise Exception(
+                f"""Failed to upload object via REST gate:
+                    request: {resp.request.path_url},
+                    file: {path},
+                    response: {resp.text},
+                    status code: {resp.status_code} {resp.reason}"""
+            )
+        oid = resp.json().get("object_id")
+        assert oid, f"OID not found in response {resp.text}"
+        return oid
+
+    verify_options_request(request)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(paths)))) as executor:
+        oids = list(executor.map(upload, paths))
+
+    logger.info(f"Request: {request}, uploaded objects: {oids}")
+    _attach_allure_step(request, f"{len(oids)} objects uploaded", req_type="POST")
+    return oids
+
+
+@allure.step("Get objects via REST Gate concurrently")
+def get_via_rest_gate_batch(
+    cid: str,
+    oids: list[str],
+    endpoint: str,
+    headers: dict = None,
+    session_token: str = None,
+    max_workers: int = REST_GATE_BATCH_WORKERS,
+) -> list[RestObjectDownload]:
+    """
+    This function gets given objects from REST gate concurrently
+    cid:      container id to get objects from
+    oids:     object IDs
+    endpoint: REST gate endpoint
+    headers:  (optional) additional HTTP headers to include in the requests
+    session_token: (optional) session token; adds Authorization: Bearer header automatically
+    max_workers: (optional) number of objects downloaded concurrently
+    Returns downloaded files with their sizes and SHA-256 hashes in the order of oids
+    """
+    headers = dict(headers) if headers else {}
+    if session_token:
+        headers["Authorization"] = f"Bearer {session_token}"
+
+    def download(oid: str) -> RestObjectDownload:
+        request = f"{endpoint}/objects/{cid}/by_id/{oid}"
+        with rest_session.get(
+            request, stream=True, headers=headers or None, timeout=DEFAULT_OBJECT_OPERATION_TIMEOUT
+        ) as resp:
+            if not resp.ok:
+                raise Exception(
+                    f"""Failed to get object via REST gate:
+                        request: {resp.request.path_url},
+                        response: {resp.text},
+                        status code: {resp.status_code} {resp.reason}"""
+                )
+            file_path = os.path.join(get_assets_dir_path(), f"{cid}_{oid}")
+            size, sha256 = _download_to_file(resp, file_path)
+        return RestObjectDownload(oid, file_path, size, sha256)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(oids)))) as executor:
+        downloads = list(executor.map(download, oids))
+
+    logger.info(f"Downloaded objects of {cid} via {endpoint}: {oids}")
+    _attach_allure_step(f"{endpoint}/objects/{cid}/by_id/", f"{len(downloads)} objects downloaded")
+    return downloads
+
+
+def _post_object(
+    request: str, path: str, headers: dict, cookies: Optional[dict] = None, chunked: bool = False
+) -> requests.Response:
+    with open(path, "rb") as file:
+        # file object is streamed with Content-Length, generator is sent with chunked transfer encoding
+        data = iter(lambda: file.read(REST_GATE_CHUNK_SIZE), b"") if chunked else file
+        return rest_session.post(
+            request, data=data, headers=headers, cookies=cookies, timeout=DEFAULT_OBJECT_OPERATION_TIMEOUT
+        )
+
+
+def _download_to_file(resp: requests.Response, file_path: str) -> tuple[int, str]:
+    """Streams response body to the file, returns size and SHA-256 of the body.
+
+    The body is written as it was received, without decoding its Content-Encoding.
+    """
+    expected_size = int(resp.headers.get("Content-Length") or 0)
+    sha256 = hashlib.sha256()
+    size = 0
+    with open(file_path, "wb") as file:
+        if expected_size and hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(file.fileno(), 0, expected_size)
+        for chunk in resp.raw.stream(REST_GATE_CHUNK_SIZE, decode_content=False):
+            file.write(chunk)
+            sha256.update(chunk)
+            size += len(chunk)
+        file.truncate(size)
+    # returns connection to the pool
+    resp.close()
+    return size, sha256.hexdigest()
+
+
 def attr_into_header(attrs: dict) -> dict:
     str_attrs = {k: str(v) if isinstance(v, int) else v for k, v in attrs.items()}
     json_string = json.dumps(str_attrs)
@@ -397,7 +552,7 @@ def get_epoch_duration_via_rest_gate(endpoint: str) -> int:
     request = f"{endpoint}/network-info"
 
     verify_options_request(request)
-    resp = requests.get(request, stream=True, timeout=DEFAULT_OBJECT_OPERATION_TIMEOUT)
+    resp = rest_session.get(request, stream=True, timeout=DEFAULT_OBJECT_OPERATION_TIMEOUT)
 
     if not resp.ok:
         raise Exception(
@@ -415,7 +570,7 @@ def get_epoch_duration_via_rest_gate(endpoint: str) -> int:
 
 
 def verify_options_request(request):
-    options_resp = requests.options(request, timeout=DEFAULT_REST_OPERATION_TIMEOUT)
+    options_resp = rest_session.options(request, timeout=DEFAULT_REST_OPERATION_TIMEOUT)
     assert options_resp.status_code == 200, "Invalid status code for OPTIONS request"
     for cors_header in ("Access-Control-Allow-Headers", "Access-Control-Allow-Methods", "Access-Control-Allow-Origin"):
         assert cors_header in options_resp.headers, f"Not CORS header {cors_header} in OPTIONS response"
@@ -458,7 +613,7 @@ def create_container(
     if wallet_connect:
         params["walletConnect"] = "true"
 
-    resp = requests.post(request, json=body, headers=headers, params=params, timeout=60)
+    resp = rest_session.post(request, json=body, headers=headers, params=params, timeout=60)
 
     if not resp.ok:
         raise Exception(
@@ -511,7 +666,7 @@ def get_unsigned_bearer_token(
     if lifetime is not None:
         body["lifetime"] = lifetime
 
-    resp = requests.post(request, json=body, timeout=DEFAULT_REST_OPERATION_TIMEOUT)
+    resp = rest_session.post(request, json=body, timeout=DEFAULT_REST_OPERATION_TIMEOUT)
 
     if not resp.ok:
         if expect_error:
@@ -564,7 +719,7 @@ def complete_bearer_token(
         "scheme": scheme,
     }
 
-    resp = requests.post(request, json=body, timeout=DEFAULT_REST_OPERATION_TIMEOUT)
+    resp = rest_session.post(request, json=body, timeout=DEFAULT_REST_OPERATION_TIMEOUT)
 
     if not resp.ok:
         if expect_error:
@@ -627,7 +782,7 @@ def get_unsigned_session_token(
     if final:
         body["final"] = True
 
-    resp = requests.post(request, json=body, timeout=60)
+    resp = rest_session.post(request, json=body, timeout=60)
 
     if not resp.ok:
         raise Exception(
@@ -682,7 +837,7 @@ def complete_session_token(
     if origin:
         body["origin"] = origin
 
-    resp = requests.post(
+    resp = rest_session.post(
         request,
         json=body,
         timeout=60,
@@ -707,7 +862,7 @@ def complete_session_token(
 @allure.step("Get containers list via REST GW")
 def get_containers_list(endpoint: str) -> dict:
     request = f"{endpoint}/containers"
-    resp = requests.get(request, timeout=60)
+    resp = rest_session.get(request, timeout=60)
 
     if not resp.ok:
         raise Exception(
@@ -727,7 +882,7 @@ def get_containers_list(endpoint: str) -> dict:
 @allure.step("Get container info via REST GW")
 def get_container_info(endpoint: str, container_id: str) -> dict:
     request = f"{endpoint}/containers/{container_id}"
-    resp = requests.get(request, timeout=60)
+    resp = rest_session.get(request, timeout=60)
 
     if not resp.ok:
         raise Exception(
@@ -747,7 +902,7 @@ def get_container_info(endpoint: str, container_id: str) -> dict:
 @allure.step("Get container eacl via REST GW")
 def get_container_eacl(endpoint: str, container_id: str, expect_error: bool = False) -> dict:
     request = f"{endpoint}/containers/{container_id}/eacl"
-    resp = requests.get(request, timeout=60)
+    resp = rest_session.get(request, timeout=60)
 
     if not resp.ok and not expect_error:
         raise Exception(
@@ -804,7 +959,7 @@ def put_container_eacl(
     if wallet_connect:
         params["walletConnect"] = "true"
 
-    resp = requests.put(request, json=body, headers=headers, params=params, timeout=60)
+    resp = rest_session.put(request, json=body, headers=headers, params=params, timeout=60)
 
     if not resp.ok and not expect_error:
         raise Exception(
@@ -855,7 +1010,7 @@ def delete_container(
     if wallet_connect:
         params["walletConnect"] = "true"
 
-    resp = requests.delete(request, headers=headers, params=params, timeout=60)
+    resp = rest_session.delete(request, headers=headers, params=params, timeout=60)
 
     if not resp.ok:
         raise Exception(
@@ -904,7 +1059,7 @@ def searchv2(
     if session_token:
         headers["Authorization"] = f"Bearer {session_token}"
 
-    resp = requests.post(request, params=params, json=search_request, headers=headers)
+    resp = rest_session.post(request, params=params, json=search_request, headers=headers)
 
     if not resp.ok:
         raise AssertionError(
@@ -937,7 +1092,7 @@ def delete_object(endpoint: str, cid: str, oid: str, session_token: str) -> dict
     request = f"{endpoint}/objects/{cid}/{oid}"
     headers = {"Authorization": f"Bearer {session_token}"}
 
-    resp = requests.delete(request, headers=headers, timeout=DEFAULT_OBJECT_OPERATION_TIMEOUT)
+    resp = rest_session.delete(request, headers=headers, timeout=DEFAULT_OBJECT_OPERATION_TIMEOUT)
 
     if not resp.ok:
         raise Exception(
@@ -965,7 +1120,7 @@ def get_rest_gateway_address(endpoint: str) -> str:
         str: Gateway wallet address
     """
     request = f"{endpoint}/gateway"
-    resp = requests.get(request, timeout=DEFAULT_REST_OPERATION_TIMEOUT)
+    resp = rest_session.get(request, timeout=DEFAULT_REST_OPERATION_TIMEOUT)
 
     if not resp.ok:
         raise Exception(
@@ -1,8 +1,12 @@
 import logging
 import os
+import random
+import re
+import threading
+import time
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Optional
+from typing import Callable, Optional
 
 import allure
 from dateutil.parser import parse
@@ -14,6 +18,11 @@ logger = logging.getLogger("NeoLogger")
 NO_SUCH_TAGS_ERROR = r".*The TagSet does not exist.*"
 GROUP_DEFAULT_URI = "http://acs.amazonaws.com/groups/global/AllUsers"
 
+# Polling of eventually consistent S3 state: time to wait for convergence and bounds of exponential backoff
+CONSISTENCY_TIMEOUT = 30
+CONSISTENCY_MIN_DELAY = 0.05
+CONSISTENCY_MAX_DELAY = 1
+
 
 class GranteeType(Enum):
     CANONICAL_USER = "CanonicalUser"
@@ -72,6 +81,183 @@ ACL_TO_PERMISSION_MAP_OBJECT = {
 }
 
 
+class ConvergenceStats:
+    """Convergence times of eventually consistent S3 state by kind of wait."""
+
+    def __init__(self):
+        self.times: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, elapsed: float) -> None:
+        with self._lock:
+            self.times.setdefault(name, []).append(elapsed)
+
+    def summary(self) -> dict:
+        with self._lock:
+            times = {name: sorted(values) for name, values in self.times.items()}
+        return {
+            name: {
+                "count": len(values),
+                "mean": sum(values) / len(values),
+                "p95": values[min(len(values) - 1, int(len(values) * 0.95))],
+                "max": values[-1],
+            }
+            for name, values in times.items()
+        }
+
+
+convergence_stats = ConvergenceStats()
+
+
+def wait_for_convergence(
+    name: str, probe: Callable[[], None], timeout: float = CONSISTENCY_TIMEOUT, description: str = ""
+) -> float:
+    """Polls S3 state with exponential backoff and jitter until the probe passes.
+
+    Args:
+        name: Kind of the wait, convergence time is recorded under this name.
+        probe: Function that raises an exception while the state has not converged yet.
+        timeout: Time to wait for convergence, in seconds.
+        description: Description of the awaited state for the error message.
+
+    Returns:
+        Time it took the state to converge, in seconds.
+    """
+    start = time.monotonic()
+    delay = CONSISTENCY_MIN_DELAY
+    while True:
+        try:
+            probe()
+            break
+        except Exception as exc:
+            remaining = timeout - (time.monotonic() - start)
+            if remaining <= 0:
+                raise AssertionError(f"{description or name} did not converge in {timeout}s: {exc}") from exc
+        time.sleep(min(remaining, delay / 2 + random.uniform(0, delay / 2)))
+        delay = min(delay * 2, CONSISTENCY_MAX_DELAY)
+
+    elapsed = time.monotonic() - start
+    convergence_stats.record(name, elapsed)
+    logger.info(f"{description or name} converged in {elapsed:.3f}s")
+    return elapsed
+
+
+@allure.step("Wait until object is visible")
+def wait_until_object_visible(
+    s3_client,
+    bucket: str,
+    object_key: str,
+    version_id: Optional[str] = None,
+    visible: bool = True,
+    timeout: float = CONSISTENCY_TIMEOUT,
+) -> float:
+    """Waits until HEAD of the object succeeds or, if `visible` is False, until the object is not found."""
+    params = {"Bucket": bucket, "Key": object_key}
+    if version_id:
+        params["VersionId"] = version_id
+
+    def probe():
+        try:
+            s3_client.head_object(**params)
+        except Exception as err:
+            if not visible and ("(404)" in str(err) or "Not Found" in str(err)):
+                return
+            raise
+        assert visible, f"object {object_key} is still visible"
+
+    state = "visible" if visible else "removed"
+    return wait_for_convergence(f"object {state}", probe, timeout, f"Object {bucket}/{object_key} {state}")
+
+
+@allure.step("Wait for objects in the bucket")
+def wait_for_objects_in_bucket(
+    s3_client,
+    bucket: str,
+    expected_objects: list,
+    unexpected_objects: Optional[list] = None,
+    timeout: float = CONSISTENCY_TIMEOUT,
+) -> float:
+    """Waits until listing of the bucket contains exactly the expected objects."""
+
+    def probe():
+        objects = [obj["Key"] for obj in s3_client.list_objects(Bucket=bucket).get("Contents", [])]
+        assert sorted(objects) == sorted(expected_objects), f"objects in bucket: {objects}"
+        for obj in unexpected_objects or []:
+            assert obj not in objects, f"object {obj} is in bucket"
+
+    return wait_for_convergence("bucket listing", probe, timeout, f"Listing of {bucket}")
+
+
+@allure.step("Wait for number of object versions")
+def wait_for_version_count(
+    s3_client, bucket: str, object_key: str, count: int, timeout: float = CONSISTENCY_TIMEOUT
+) -> float:
+    """Waits until the object has the given number of versions."""
+
+    def probe():
+        response = s3_client.list_object_versions(Bucket=bucket, Prefix=object_key)
+        versions = [version for version in response.get("Versions", []) if version["Key"] == object_key]
+        assert len(versions) == count, f"got {len(versions)} versions"
+
+    return wait_for_convergence("version count", probe, timeout, f"{count} versions of {bucket}/{object_key}")
+
+
+@allure.step("Wait for tags")
+def wait_for_tags(
+    s3_client,
+    bucket: str,
+    object_key: Optional[str],
+    expected_tags: list,
+    version_id: Optional[str] = None,
+    timeout: float = CONSISTENCY_TIMEOUT,
+) -> float:
+    """Waits until tags of the object (or of the bucket if `object_key` is None) are the expected (key, value) pairs."""
+    expected = sorted((key, str(value)) for key, value in expected_tags)
+
+    def probe():
+        if object_key is None:
+            try:
+                response = s3_client.get_bucket_tagging(Bucket=bucket)
+            except Exception as err:
+                # bucket without tags is reported with an error
+                if not re.match(NO_SUCH_TAGS_ERROR, str(err), re.DOTALL):
+                    raise
+                response = {}
+        else:
+            params = {"Bucket": bucket, "Key": object_key}
+            if version_id:
+                params["VersionId"] = version_id
+            response = s3_client.get_object_tagging(**params)
+        tags = sorted((tag["Key"], tag["Value"]) for tag in response.get("TagSet", []))
+        assert tags == expected, f"got tags {tags}"
+
+    target = f"{bucket}/{object_key}" if object_key is not None else bucket
+    return wait_for_convergence("tags", probe, timeout, f"Tags of {target}")
+
+
+@allure.step("Wait for object lock state")
+def wait_for_object_lock(
+    s3_client,
+    bucket: str,
+    object_key: str,
+    object_lock_mode: str,
+    legal_hold_status: str = "OFF",
+    version_id: Optional[str] = None,
+    timeout: float = CONSISTENCY_TIMEOUT,
+) -> float:
+    """Waits until the object has the given retention mode and legal hold status."""
+    params = {"Bucket": bucket, "Key": object_key}
+    if version_id:
+        params["VersionId"] = version_id
+
+    def probe():
+        response = s3_client.head_object(**params)
+        state = (response.get("ObjectLockMode"), response.get("ObjectLockLegalHoldStatus", "OFF"))
+        assert state == (object_lock_mode, legal_hold_status), f"got lock mode and legal hold {state}"
+
+    return wait_for_convergence("object lock", probe, timeout, f"Lock state of {bucket}/{object_key}")
+
+
 @allure.step("Expected all objects are presented in the bucket")
 def check_objects_in_bucket(
     s3_client, bucket, expected_objects: list, unexpected_objects: Optional[list] = None
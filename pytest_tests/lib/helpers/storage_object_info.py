@@ -1,4 +1,3 @@
-import json
 import logging
 from dataclasses import dataclass
 from time import sleep
@@ -10,9 +9,9 @@ import pytest
 from helpers.common import WALLET_PASS
 from helpers.grpc_responses import OBJECT_ALREADY_REMOVED
 from helpers.neofs_verbs import delete_object, get_object, head_object
-from neo3.wallet import wallet
 from neofs_testlib.env.env import NeoFSEnv
 from neofs_testlib.shell import Shell
+from neofs_testlib.utils.converters import load_wallet
 
 logger = logging.getLogger("NeoLogger")
 
@@ -55,10 +54,7 @@ def verify_head_tombstone(wallet_path: str, cid: str, oid_ts: str, oid: str, she
 
     assert header["containerID"] == cid, "Tombstone Header CID is wrong"
 
-    with open(wallet_path, "r") as file:
-        wlt_data = json.loads(file.read())
-    wlt = wallet.Wallet.from_json(wlt_data, passwords=[WALLET_PASS])
-    addr = wlt.accounts[0].address
+    addr = load_wallet(wallet_path, WALLET_PASS).accounts[0].address
 
     assert header["ownerID"] == addr, "Tombstone Owner ID is wrong"
     assert header["objectType"] == "TOMBSTONE", "Header Type isn't Tombstone"
@@ -4,7 +4,11 @@ Pure Python implementation of Tillich-Zémor hash function.
 Based on the Go implementation from https://github.com/nspcc-dev/tzhash
 """
 
+import random
 import struct
+import time
+from array import array
+from functools import lru_cache
 from typing import List, Optional
 
 
@@ -200,8 +204,221 @@ class SL2:
         return cls(matrix)
 
 
-class TZHash:
-    """Tillich-Zémor hash implementation."""
+# Elements of GF(2^127) below are plain ints (bit i is the coefficient of x^i), so Python carries out
+# carry-less arithmetic on a whole element, or on many elements packed into one int, in a single operation.
+GF127_MASK = (1 << 127) - 1
+
+# Matrices by which the hash state is multiplied from the right for every bit of input (MSB first),
+# as row-major tuples of polynomials: 0 -> [[x, 1], [1, 0]], 1 -> [[x, x+1], [1, 1]]
+BIT_MATRICES = ((0b10, 0b01, 0b01, 0b00), (0b10, 0b11, 0b01, 0b01))
+
+# Both rows of the hash state are packed into one int, a row per lane of this width
+ROW_LANE_WIDTH = 256
+ROW_LANES_MASK = GF127_MASK | (GF127_MASK << ROW_LANE_WIDTH)
+ROW_LANES_OVERFLOW = 0x1FF | (0x1FF << ROW_LANE_WIDTH)
+
+# Bit-sliced hashing splits data into up to MAX_LANES equal parts (lanes) of at least MIN_LANE_SIZE bytes;
+# lane i occupies bits [128 * i, 128 * i + 127) of an int, so a bit of every lane takes the same few operations
+MAX_LANES = 1024
+MIN_LANES = 16
+MIN_LANE_SIZE = 256
+
+
+def _clmul(a: int, b: int) -> int:
+    """Carry-less multiplication of polynomials without reduction."""
+    result = 0
+    while b:
+        if b & 1:
+            result ^= a
+        a <<= 1
+        b >>= 1
+    return result
+
+
+def _reduce(value: int) -> int:
+    """Reduces polynomial of degree < 190 modulo x^127 + x^63 + 1."""
+    overflow = value >> 127
+    return (value & GF127_MASK) ^ overflow ^ (overflow << 63)
+
+
+def _gf127_mul(a: int, b: int) -> int:
+    """Multiplies elements of GF(2^127), four bits of `b` at a time."""
+    table = [0] * 16
+    for nibble in range(1, 16):
+        low_bit = nibble & -nibble
+        table[nibble] = table[nibble ^ low_bit] ^ (a << (low_bit.bit_length() - 1))
+
+    result = 0
+    for shift in range(124, -1, -4):
+        result = _reduce(result << 4) ^ table[(b >> shift) & 0xF]
+    return _reduce(result)
+
+
+def _sl2_mul(x: tuple, y: tuple) -> tuple:
+    """Multiplies 2x2 matrices over GF(2^127) given as row-major tuples."""
+    a, b, c, d = x
+    e, f, g, h = y
+    return (
+        _gf127_mul(a, e) ^ _gf127_mul(b, g),
+        _gf127_mul(a, f) ^ _gf127_mul(b, h),
+        _gf127_mul(c, e) ^ _gf127_mul(d, g),
+        _gf127_mul(c, f) ^ _gf127_mul(d, h),
+    )
+
+
+def _byte_shifts() -> tuple:
+    """Precomputes the product of bit matrices for every byte value.
+
+    Entries of the products are polynomials of degree <= 8, they are stored as positions of their non-zero
+    coefficients, i.e. as shifts to apply to an element when it is multiplied by the entry.
+    """
+    table = []
+    for byte in range(256):
+        m = (1, 0, 0, 1)
+        for i in range(7, -1, -1):
+            a, b, c, d = m
+            e, f, g, h = BIT_MATRICES[(byte >> i) & 1]
+            m = (
+                _clmul(a, e) ^ _clmul(b, g),
+                _clmul(a, f) ^ _clmul(b, h),
+                _clmul(c, e) ^ _clmul(d, g),
+                _clmul(c, f) ^ _clmul(d, h),
+            )
+        table.append(tuple(tuple(i for i in range(entry.bit_length()) if entry >> i & 1) for entry in m))
+    return tuple(table)
+
+
+BYTE_SHIFTS = _byte_shifts()
+
+
+def _update_bytes(matrix: tuple, data: bytes) -> tuple:
+    """Multiplies hash state by the precomputed matrix of every byte of data."""
+    a, b, c, d = matrix
+    # columns of the state, both rows are transformed by the same operations
+    left = a | (c << ROW_LANE_WIDTH)
+    right = b | (d << ROW_LANE_WIDTH)
+    for byte in data:
+        shifts00, shifts01, shifts10, shifts11 = BYTE_SHIFTS[byte]
+        new_left = new_right = 0
+        for shift in shifts00:
+            new_left ^= left << shift
+        for shift in shifts10:
+            new_left ^= right << shift
+        for shift in shifts01:
+            new_right ^= left << shift
+        for shift in shifts11:
+            new_right ^= right << shift
+
+        overflow = (new_left >> 127) & ROW_LANES_OVERFLOW
+        left = (new_left & ROW_LANES_MASK) ^ overflow ^ (overflow << 63)
+        overflow = (new_right >> 127) & ROW_LANES_OVERFLOW
+        right = (new_right & ROW_LANES_MASK) ^ overflow ^ (overflow << 63)
+
+    return left & GF127_MASK, right & GF127_MASK, left >> ROW_LANE_WIDTH, right >> ROW_LANE_WIDTH
+
+
+def _lanes_count(size: int) -> int:
+    """Returns number of lanes for bit-sliced hashing of `size` bytes or 0 if it doesn't pay off."""
+    lanes = MAX_LANES
+    while lanes >= MIN_LANES and size < lanes * MIN_LANE_SIZE:
+        lanes //= 2
+    return lanes if lanes >= MIN_LANES else 0
+
+
+@lru_cache(maxsize=None)
+def _lanes_low_bits(lanes: int) -> int:
+    """Returns int with the lowest bit of every lane set."""
+    return int.from_bytes(b"\x01" + bytes(15), "little") * int.from_bytes((b"\x00" * 15 + b"\x01") * lanes, "big")
+
+
+def _gf127_mul_lanes(a: int, b: int, low_bits: int) -> int:
+    """Multiplies elements of GF(2^127) lane by lane."""
+    lanes_mask = low_bits * GF127_MASK
+    result = 0
+    for i in range(127):
+        bit = (b >> i) & low_bits
+        result ^= a & ((bit << 127) - bit)
+        a <<= 1
+        overflow = (a >> 127) & low_bits
+        a = (a & lanes_mask) ^ overflow ^ (overflow << 63)
+    return result
+
+
+def _split_lanes(value: int, lanes: int) -> tuple[int, int]:
+    """Splits `lanes` packed elements into even and odd ones."""
+    words = array("Q", value.to_bytes(lanes * 16, "little"))
+    even = array("Q", bytes(lanes * 8))
+    odd = array("Q", bytes(lanes * 8))
+    even[0::2], even[1::2] = words[0::4], words[1::4]
+    odd[0::2], odd[1::2] = words[2::4], words[3::4]
+    return int.from_bytes(even, "little"), int.from_bytes(odd, "little")
+
+
+def _combine_lanes(matrix: tuple, lanes: int) -> tuple:
+    """Multiplies matrices of all lanes in order by multiplying adjacent pairs of lanes at once."""
+    while lanes > 1:
+        halves = [_split_lanes(entry, lanes) for entry in matrix]
+        lanes //= 2
+        low_bits = _lanes_low_bits(lanes)
+        (a, _), (b, _), (c, _), (d, _) = halves
+        (_, e), (_, f), (_, g), (_, h) = halves
+        matrix = (
+            _gf127_mul_lanes(a, e, low_bits) ^ _gf127_mul_lanes(b, g, low_bits),
+            _gf127_mul_lanes(a, f, low_bits) ^ _gf127_mul_lanes(b, h, low_bits),
+            _gf127_mul_lanes(c, e, low_bits) ^ _gf127_mul_lanes(d, g, low_bits),
+            _gf127_mul_lanes(c, f, low_bits) ^ _gf127_mul_lanes(d, h, low_bits),
+        )
+    return matrix
+
+
+def _hash_lanes(data: bytes, lanes: int) -> tuple:
+    """Hashes the first `lanes * (len(data) // lanes)` bytes of data and returns resulting matrix.
+
+    Data is split into `lanes` equal parts that are hashed simultaneously: a bit of every part is
+    processed by the same operations on ints holding one element of every lane (bit-slicing).
+    """
+    lane_size = len(data) // lanes
+    end = lanes * lane_size
+    low_bits = _lanes_low_bits(lanes)
+    lanes_mask = low_bits * GF127_MASK
+
+    a, b, c, d = low_bits, 0, 0, low_bits
+    column = bytearray(lanes * 16)
+    for offset in range(lane_size):
+        column[0::16] = data[offset:end:lane_size]
+        byte = int.from_bytes(column, "little")
+        for i in range(7, -1, -1):
+            bit = (byte >> i) & low_bits
+            bit = (bit << 127) - bit
+
+            t = a << 1
+            overflow = (t >> 127) & low_bits
+            t = (t & lanes_mask) ^ overflow ^ (overflow << 63) ^ b
+            a, b = t, a ^ (bit & t)
+
+            t = c << 1
+            overflow = (t >> 127) & low_bits
+            t = (t & lanes_mask) ^ overflow ^ (overflow << 63) ^ d
+            c, d = t, c ^ (bit & t)
+
+    return _combine_lanes((a, b, c, d), lanes)
+
+
+def _matrix_from_bytes(data: bytes) -> tuple:
+    if len(data) != TZHash.SIZE:
+        raise ValueError(f"Invalid hash size: {len(data)}")
+    matrix = tuple(int.from_bytes(data[i : i + GF127.SIZE], "big") for i in range(0, TZHash.SIZE, GF127.SIZE))
+    if any(entry > GF127_MASK for entry in matrix):
+        raise ValueError("MSB must be zero")
+    return matrix
+
+
+def _matrix_to_bytes(matrix: tuple) -> bytes:
+    return b"".join(entry.to_bytes(GF127.SIZE, "big") for entry in matrix)
+
+
+class PureTZHash:
+    """Bit-by-bit Tillich-Zémor hash implementation, kept as a reference for TZHash."""
 
     SIZE = 64
     BLOCK_SIZE = 128
@@ -263,27 +480,73 @@ class TZHash:
     def hexdigest(self) -> str:
         return self.digest().hex()
 
+    @staticmethod
+    def hash_data(data: bytes) -> bytes:
+        h = PureTZHash()
+        h.update(data)
+        return h.digest()
+
+
+class TZHash:
+    """Tillich-Zémor hash implementation.
+
+    Produces the same hashes as PureTZHash, but instead of multiplying matrices bit by bit, large inputs
+    are hashed by bit-sliced lanes and short ones by precomputed per-byte matrices.
+    """
+
+    SIZE = 64
+    # data passed to update() is processed in chunks of this size to bound memory usage
+    CHUNK_SIZE = 4 * 1024 * 1024
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        # row-major matrix: [x[0], x[2]]
+        #                   [x[1], x[3]]
+        self._matrix = (1, 0, 0, 1)
+
+    def update(self, data: bytes) -> int:
+        view = memoryview(data).cast("B")
+        for offset in range(0, len(view), self.CHUNK_SIZE):
+            chunk = bytes(view[offset : offset + self.CHUNK_SIZE])
+            lanes = _lanes_count(len(chunk))
+            if lanes:
+                self._matrix = _sl2_mul(self._matrix, _hash_lanes(chunk, lanes))
+                chunk = chunk[lanes * (len(chunk) // lanes) :]
+            self._matrix = _update_bytes(self._matrix, chunk)
+        return len(view)
+
+    def digest(self) -> bytes:
+        return _matrix_to_bytes(self._matrix)
+
+    def hexdigest(self) -> str:
+        return self.digest().hex()
+
     @staticmethod
     def hash_data(data: bytes) -> bytes:
         h = TZHash()
         h.update(data)
         return h.digest()
 
+    @staticmethod
+    def hash_file(path: str, chunk_size: int = CHUNK_SIZE) -> bytes:
+        h = TZHash()
+        with open(path, "rb") as file:
+            while chunk := file.read(chunk_size):
+                h.update(chunk)
+        return h.digest()
+
     @staticmethod
     def concat_hashes(hashes: List[bytes]) -> bytes:
         if not hashes:
             raise ValueError("Empty hash list")
 
-        result = SL2()  # Identity matrix
-
+        result = (1, 0, 0, 1)  # Identity matrix
         for hash_bytes in hashes:
-            if len(hash_bytes) != TZHash.SIZE:
-                raise ValueError(f"Invalid hash size: {len(hash_bytes)}")
-
-            matrix = SL2.from_bytes(hash_bytes)
-            result = result.multiply(matrix)
+            result = _sl2_mul(result, _matrix_from_bytes(hash_bytes))
 
-        return result.to_bytes()
+        return _matrix_to_bytes(result)
 
     @staticmethod
     def validate_hashes(combined_hash: bytes, individual_hashes: List[bytes]) -> bool:
@@ -294,6 +557,61 @@ class TZHash:
             return False
 
 
+# Test vectors of the reference Go implementation (github.com/nspcc-dev/tzhash, tz/hash_test.go)
+REFERENCE_VECTORS = [
+    (
+        b"",
+        "00000000000000000000000000000001000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000001",
+    ),
+    (
+        bytes([0, 1, 2, 3, 4, 5, 6, 7, 8]),
+        "00000000000001e4a545e5b90fb6882b00000000000000c849cd88f79307f67100000000000000cd0c898cb68356e624000000000000007cbcdc7c5e89b16e4b",
+    ),
+    (
+        bytes([4, 8, 15, 16, 23, 42, 255, 0, 127, 65, 32, 123, 42, 45, 201, 210, 213, 244]),
+        "4db8a8e253903c70ab0efb65fe6de05a36d1dc9f567a147152d0148a86817b2062908d9b026a506007c1118e86901b672a39317c55ee3c10ac8efafa79efe8ee",
+    ),
+]
+
+
+def benchmark(sizes: List[int], pure_size_limit: int = 64 * 1024, seed: int = 0) -> List[dict]:
+    """Compares TZHash with PureTZHash on reference vectors and random data of the given sizes.
+
+    Args:
+        sizes: Sizes of data to hash (in bytes).
+        pure_size_limit: PureTZHash is too slow for large data, it is run only for sizes up to this limit.
+        seed: Seed of random data.
+
+    Returns:
+        Timings (in seconds) for every size.
+    """
+    for data, expected in REFERENCE_VECTORS:
+        for hasher in (TZHash, PureTZHash):
+            if hasher.hash_data(data).hex() != expected:
+                raise AssertionError(f"{hasher.__name__} mismatch on reference vector {data!r}")
+
+    rng = random.Random(seed)
+    results = []
+    for size in sizes:
+        data = rng.randbytes(size)
+        start = time.perf_counter()
+        fast_hash = TZHash.hash_data(data)
+        result = {"size": size, "fast": time.perf_counter() - start, "pure": None}
+
+        if size <= pure_size_limit:
+            start = time.perf_counter()
+            pure_hash = PureTZHash.hash_data(data)
+            result["pure"] = time.perf_counter() - start
+            if fast_hash != pure_hash:
+                raise AssertionError(f"TZHash and PureTZHash mismatch on {size} bytes")
+
+        split = rng.randrange(size + 1)
+        if TZHash.concat_hashes([TZHash.hash_data(data[:split]), TZHash.hash_data(data[split:])]) != fast_hash:
+            raise AssertionError(f"Homomorphic property is broken on {size} bytes")
+        results.append(result)
+    return results
+
+
 def main():
     """Demo of TZ hash functionality."""
     print("Tillich-Zémor Hash Demo")
@@ -324,6 +642,11 @@ def main():
     is_valid = TZHash.validate_hashes(hash1, [hash_part1, hash_part2])
     print(f"Validation: {is_valid}")
 
+    print("\nBenchmark:")
+    for result in benchmark([1024, 16 * 1024, 64 * 1024, 1024 * 1024, 16 * 1024 * 1024]):
+        pure = f"{result['pure']:.3f}s" if result["pure"] is not None else "-"
+        print(f"{result['size']:>10} bytes: TZHash {result['fast']:.3f}s, PureTZHash {pure}")
+
 
 if __name__ == "__main__":
     main()
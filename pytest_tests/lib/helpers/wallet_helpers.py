@@ -9,10 +9,8 @@ import yaml
 from helpers.common import get_assets_dir_path
 from helpers.test_control import wait_for_success
 from neo3.core import cryptography
-from neo3.wallet.wallet import Wallet
 from neofs_testlib.cli import NeofsCli, NeoGo
 from neofs_testlib.env.env import NeoFSEnv, NodeWallet
-from neofs_testlib.utils.converters import load_wallet
 from neofs_testlib.utils.wallet import get_last_address_from_wallet, init_wallet
 
 
@@ -148,9 +146,7 @@ def create_wallet_with_money(neofs_env_with_mainchain: NeoFSEnv) -> NodeWallet:
 
 
 def get_private_key(wallet: NodeWallet) -> bytes:
-    neo3_wallet: Wallet = load_wallet(wallet.path, passwords=[wallet.password] * 3)
-    acc = neo3_wallet.accounts[0]
-    return acc.private_key
+    return wallet.private_key
 
 
 def sign_string(str_to_sign: str, private_key: bytes) -> str:
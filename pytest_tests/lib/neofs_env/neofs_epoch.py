@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import allure
@@ -7,6 +8,9 @@ from neofs_testlib.env.env import NeoFSEnv, StorageNode
 
 logger = logging.getLogger("NeoLogger")
 
+# Interval (in seconds) between polls of storage nodes while waiting for an epoch
+EPOCH_POLL_INTERVAL = 0.5
+
 
 @allure.step("Ensure fresh epoch")
 def ensure_fresh_epoch(neofs_env: NeoFSEnv, alive_node: Optional[StorageNode] = None) -> int:
@@ -20,42 +24,96 @@ def ensure_fresh_epoch(neofs_env: NeoFSEnv, alive_node: Optional[StorageNode] =
 
 
 @allure.step("Wait for epochs align in whole cluster")
-@wait_for_success(60, 5)
+@wait_for_success(60, EPOCH_POLL_INTERVAL)
 def wait_for_epochs_align(neofs_env: NeoFSEnv, epoch_number: Optional[int] = None) -> bool:
-    epochs = []
-    for node in neofs_env.storage_nodes:
-        current_epoch = get_epoch(neofs_env, node)
+    epochs = get_epochs(neofs_env)
+    for current_epoch in epochs:
         assert epoch_number is None or current_epoch > epoch_number, (
-            f"Epoch {current_epoch} wasn't ticked yet. Expected epoch > {epoch_number}"
+            f"Epoch {current_epoch} wasn't ticked yet. Expected epoch > {epoch_number}. "
+            f"Epochs: {format_epoch_lag(neofs_env.storage_nodes, epochs)}"
         )
-        epochs.append(current_epoch)
     unique_epochs = list(set(epochs))
-    assert len(unique_epochs) == 1, f"unaligned epochs found,  {epochs}, count of unique epochs {len(unique_epochs)}"
+    assert len(unique_epochs) == 1, (
+        f"unaligned epochs found, {format_epoch_lag(neofs_env.storage_nodes, epochs)}, "
+        f"count of unique epochs {len(unique_epochs)}"
+    )
 
 
 @allure.step("Wait until new epoch arrives")
-@wait_for_success(60, 1)
+@wait_for_success(60, EPOCH_POLL_INTERVAL)
 def wait_until_new_epoch(
     neofs_env: NeoFSEnv,
     current_epoch: int,
     require_all_storage_nodes: bool = True,
 ) -> int:
     expected = current_epoch + 1
-    epochs = [get_epoch(neofs_env, node) for node in neofs_env.storage_nodes]
+    epochs = get_epochs(neofs_env)
     matched = sum(1 for epoch in epochs if epoch == expected)
     required = len(epochs) if require_all_storage_nodes else 1
     assert matched >= required, (
-        f"Next epoch didn't arrive during timeout (expected {expected} on {required} node(s), got {epochs})"
+        f"Next epoch didn't arrive during timeout (expected {expected} on {required} node(s), "
+        f"got {format_epoch_lag(neofs_env.storage_nodes, epochs)})"
     )
     return expected
 
 
+@wait_for_success(60, EPOCH_POLL_INTERVAL)
+def _wait_for_epoch_on_any_node(neofs_env: NeoFSEnv, epoch_number: int) -> int:
+    epochs = get_epochs(neofs_env, raise_on_error=False)
+    assert any(epoch is not None and epoch >= epoch_number for epoch in epochs), (
+        f"Epoch {epoch_number} didn't arrive on any node, got {format_epoch_lag(neofs_env.storage_nodes, epochs)}"
+    )
+    return max(epoch for epoch in epochs if epoch is not None)
+
+
+def _get_node_epoch(neofs_env: NeoFSEnv, node: StorageNode) -> int:
+    cli = neofs_env.neofs_cli(node.cli_config)
+    epoch = cli.netmap.epoch(node.endpoint, node.wallet.path)
+    return int(epoch.stdout)
+
+
+def get_epochs(
+    neofs_env: NeoFSEnv, nodes: Optional[list[StorageNode]] = None, raise_on_error: bool = True
+) -> list[Optional[int]]:
+    """
+    Requests current epoch from all nodes concurrently.
+    Args:
+        neofs_env: neofs env instance under test
+        nodes: nodes to request (all storage nodes by default)
+        raise_on_error: if False, epoch of a node that failed to respond is None
+    Returns:
+        epochs of the nodes in the same order as nodes
+    """
+    nodes = neofs_env.storage_nodes if nodes is None else nodes
+    if not nodes:
+        return []
+
+    def request_epoch(node: StorageNode) -> Optional[int]:
+        try:
+            return _get_node_epoch(neofs_env, node)
+        except Exception as err:
+            if raise_on_error:
+                raise
+            logger.info(f"Failed to get epoch from {node}: {err}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=len(nodes)) as executor:
+        return list(executor.map(request_epoch, nodes))
+
+
+def format_epoch_lag(nodes: list[StorageNode], epochs: list[Optional[int]]) -> str:
+    """Returns epochs of nodes along with their lag behind the most recent epoch among them."""
+    newest = max((epoch for epoch in epochs if epoch is not None), default=None)
+    return ", ".join(
+        f"{node}: {epoch} (lag {newest - epoch})" if epoch is not None else f"{node}: unavailable"
+        for node, epoch in zip(nodes, epochs)
+    )
+
+
 @allure.step("Get Epoch")
 def get_epoch(neofs_env: NeoFSEnv, alive_node: Optional[StorageNode] = None):
     alive_node = alive_node if alive_node else neofs_env.storage_nodes[0]
-    cli = neofs_env.neofs_cli(alive_node.cli_config)
-    epoch = cli.netmap.epoch(alive_node.endpoint, alive_node.wallet.path)
-    return int(epoch.stdout)
+    return _get_node_epoch(neofs_env, alive_node)
 
 
 @allure.step("Tick Epoch")
@@ -83,3 +141,31 @@ def tick_epoch_and_wait(
     current_epoch = current_epoch if current_epoch else get_epoch(neofs_env, node)
     tick_epoch(neofs_env, node)
     wait_for_epochs_align(neofs_env, current_epoch)
+
+
+@allure.step("Tick {epochs_count} epochs and wait for epochs align")
+def tick_epochs_and_wait(
+    neofs_env: NeoFSEnv,
+    epochs_count: int,
+    current_epoch: Optional[int] = None,
+    node: Optional[StorageNode] = None,
+) -> int:
+    """
+    Fast-forwards the network by several epochs: every tick waits only for the first node
+    to see the new epoch, the whole cluster is waited for once at the end.
+    Args:
+        neofs_env: neofs env instance under test
+        epochs_count: number of epochs to tick
+        current_epoch: current epoch (it is requested from the node if not specified)
+        node: node to send requests to (first node in cluster by default)
+    Returns:
+        the new epoch
+    """
+    current_epoch = current_epoch if current_epoch else get_epoch(neofs_env, node)
+    epoch = current_epoch
+    for _ in range(epochs_count):
+        tick_epoch(neofs_env, node)
+        # the next tick must not be sent before the network has applied the previous one
+        epoch = _wait_for_epoch_on_any_node(neofs_env, epoch + 1)
+    wait_for_epochs_align(neofs_env, current_epoch + epochs_count - 1)
+    return epoch
@@ -5,6 +5,7 @@ import random
 import re
 import string
 import sys
+import threading
 import uuid
 from typing import Any, Optional
 
@@ -17,6 +18,7 @@ from botocore.config import Config
 from botocore.exceptions import ClientError
 from helpers.aws_cli_client import AwsCliClient, aws_binary_path
 from helpers.cli_helpers import _cmd_run, _configure_aws_cli
+from helpers.s3_helper import convergence_stats
 from neofs_env.neofs_env_test_base import NeofsEnvTestBase
 from neofs_testlib.env.env import NeoFSEnv, NodeWallet
 from neofs_testlib.utils.wallet import get_last_public_key_from_wallet
@@ -34,6 +36,8 @@ CREDENTIALS_CREATE_TIMEOUT = "1m"
 # without any retries)
 MAX_REQUEST_ATTEMPTS = 1
 RETRY_MODE = "standard"
+# Max number of keep-alive connections boto3 clients keep to S3 gateway, parallel transfers use up to this number
+MAX_POOL_CONNECTIONS = 64
 
 
 def _run_with_passwd(cmd: str, password: str) -> str:
@@ -76,28 +80,19 @@ class TestNeofsS3Base(NeofsEnvTestBase):
         placement_policy: str,
     ) -> Any:
         wallet = default_wallet
-        (
-            cid,
-            bucket,
-            access_key_id,
-            secret_access_key,
-            owner_private_key,
-        ) = init_s3_credentials(wallet, neofs_env, placement_policy=placement_policy)
-
-        cli = neofs_env.neofs_cli(neofs_env.generate_cli_config(wallet))
-        result = cli.container.list(rpc_endpoint=neofs_env.sn_rpc, wallet=wallet.path)
-        containers_list = result.stdout.split()
-        assert cid in containers_list, f"Expected cid {cid} in {containers_list}"
-
-        if "aws cli" in request.param:
-            client = configure_cli_client(access_key_id, secret_access_key, f"https://{neofs_env.s3_gw.endpoint}")
-        else:
-            client = configure_boto3_client(access_key_id, secret_access_key, f"https://{neofs_env.s3_gw.endpoint}")
+        client_type = "aws cli" if "aws cli" in request.param else "boto3"
+        client = s3_client_cache.get_client(wallet, neofs_env, placement_policy, client_type)
+        _, _, access_key_id, secret_access_key, _ = s3_client_cache.get_cached_credentials(
+            wallet, neofs_env, placement_policy=placement_policy
+        )
         TestNeofsS3Base.neofs_env = neofs_env
         TestNeofsS3Base.s3_client = client
         TestNeofsS3Base.wallet = wallet
         TestNeofsS3Base.access_key_id = access_key_id
         TestNeofsS3Base.secret_access_key = secret_access_key
+        yield
+        logger.info(f"S3 client cache stats: {s3_client_cache.stats()}")
+        logger.info(f"S3 convergence times: {convergence_stats.summary()}")
 
     @pytest.fixture
     @allure.title("Create/delete bucket")
@@ -195,6 +190,8 @@ def configure_boto3_client(access_key_id: str, secret_access_key: str, s3gate_en
                 "mode": RETRY_MODE,
             },
             signature_version="v4",
+            max_pool_connections=MAX_POOL_CONNECTIONS,
+            tcp_keepalive=True,
         )
 
         s3_client = session.client(
@@ -234,6 +231,134 @@ def configure_cli_client(access_key_id: str, secret_access_key: str, s3gate_endp
             raise RuntimeError("Error while configuring AwsCliClient") from err
 
 
+class S3ClientCache:
+    """Session-wide cache of S3 credentials and clients.
+
+    Issuing credentials runs neofs-s3-authmate and creates a container, so credentials are issued
+    once per (wallet, placement policy, env, S3 gateway endpoint) and shared between test classes along
+    with clients configured for them. Boto3 clients keep their pools of keep-alive connections.
+    Envs are told apart by their directories, since ports of finalized envs are reused by new ones.
+    """
+
+    def __init__(self):
+        self._credentials: dict[tuple, tuple] = {}
+        self._clients: dict[tuple, Any] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_credentials(
+        self,
+        wallet: NodeWallet,
+        neofs_env: NeoFSEnv,
+        policy: Optional[dict] = None,
+        placement_policy: Optional[str] = "REP 1",
+    ) -> tuple:
+        """Returns credentials issued by `init_s3_credentials`, credentials are issued on the first call only."""
+        key = self._credentials_key(wallet, neofs_env, policy, placement_policy)
+        with self._lock:
+            credentials = self._credentials.get(key)
+            if credentials is not None:
+                self.hits += 1
+                return credentials
+
+        credentials = init_s3_credentials(wallet, neofs_env, policy, placement_policy)
+        cid = credentials[0]
+        cli = neofs_env.neofs_cli(neofs_env.generate_cli_config(wallet))
+        result = cli.container.list(rpc_endpoint=neofs_env.sn_rpc, wallet=wallet.path)
+        containers_list = result.stdout.split()
+        assert cid in containers_list, f"Expected cid {cid} in {containers_list}"
+
+        with self._lock:
+            self.misses += 1
+            return self._credentials.setdefault(key, credentials)
+
+    def get_client(
+        self,
+        wallet: NodeWallet,
+        neofs_env: NeoFSEnv,
+        placement_policy: Optional[str] = "REP 1",
+        client_type: str = "boto3",
+    ) -> Any:
+        """Returns S3 client of the given type ("boto3" or "aws cli") with cached credentials."""
+        key = (wallet.path, placement_policy, neofs_env._env_dir, neofs_env.s3_gw.endpoint, client_type)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self.hits += 1
+                return client
+
+        _, _, access_key_id, secret_access_key, _ = self.get_credentials(
+            wallet, neofs_env, placement_policy=placement_policy
+        )
+        endpoint = f"https://{neofs_env.s3_gw.endpoint}"
+        if client_type == "aws cli":
+            client = configure_cli_client(access_key_id, secret_access_key, endpoint)
+        else:
+            client = configure_boto3_client(access_key_id, secret_access_key, endpoint)
+
+        with self._lock:
+            self.misses += 1
+            return self._clients.setdefault(key, client)
+
+    def get_cached_credentials(
+        self,
+        wallet: NodeWallet,
+        neofs_env: NeoFSEnv,
+        policy: Optional[dict] = None,
+        placement_policy: Optional[str] = "REP 1",
+    ) -> Optional[tuple]:
+        """Returns already issued credentials without counting a cache hit, e.g. credentials of a cached client."""
+        with self._lock:
+            return self._credentials.get(self._credentials_key(wallet, neofs_env, policy, placement_policy))
+
+    def stats(self) -> dict:
+        """Returns cache hits and misses and usage of connection pools of cached boto3 clients.
+
+        Every request sent over an already opened connection is a pool hit, every opened connection is a miss.
+        """
+        with self._lock:
+            clients = list(self._clients.values())
+        pool_stats = [get_connection_pool_stats(client) for client in clients if not isinstance(client, AwsCliClient)]
+        requests = sum(stats["requests"] for stats in pool_stats)
+        connections = sum(stats["connections"] for stats in pool_stats)
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "pool_hits": requests - connections,
+            "pool_misses": connections,
+        }
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._credentials.clear()
+            self._clients.clear()
+
+    @staticmethod
+    def _credentials_key(
+        wallet: NodeWallet, neofs_env: NeoFSEnv, policy: Optional[dict], placement_policy: Optional[str]
+    ) -> tuple:
+        policy_key = json.dumps(policy, sort_keys=True) if isinstance(policy, dict) else policy
+        return (wallet.path, policy_key, placement_policy, neofs_env._env_dir, neofs_env.s3_gw.endpoint)
+
+
+s3_client_cache = S3ClientCache()
+
+
+def get_connection_pool_stats(s3_client) -> dict:
+    """Returns number of requests sent by a boto3 client and number of connections opened for them."""
+    http_session = s3_client._endpoint.http_session
+    managers = [http_session._manager, *http_session._proxy_managers.values()]
+    requests, connections = 0, 0
+    for manager in managers:
+        for pool_key in manager.pools.keys():
+            pool = manager.pools.get(pool_key)
+            if pool is not None:
+                requests += pool.num_requests
+                connections += pool.num_connections
+    return {"requests": requests, "connections": connections}
+
+
 def _generate_random_profile():
     random_postfix = "".join(random.choice(string.ascii_letters + string.digits) for _ in range(10))
     return f"profile__{random_postfix}"
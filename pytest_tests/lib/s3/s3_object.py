@@ -1,6 +1,12 @@
+import hashlib
+import json
 import logging
 import os
+import tempfile
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Optional
 
 import allure
@@ -9,6 +15,7 @@ from botocore.exceptions import ClientError
 from helpers.aws_cli_client import AwsCliClient
 from helpers.cli_helpers import log_command_execution
 from helpers.common import get_assets_dir_path
+from helpers.file_helper import copy_file_range
 
 ##########################################################
 # Disabling warnings on self-signed certificate which the
@@ -27,6 +34,55 @@ ACL_COPY = [
     "bucket-owner-full-control",
 ]
 
+# Parallel multipart transfers: part size and number of parts transferred concurrently
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+MULTIPART_MAX_WORKERS = 8
+# Size of chunks downloaded parts are streamed and hashed by
+MULTIPART_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class MultipartPart:
+    number: int
+    offset: int
+    size: int
+    etag: Optional[str] = None
+    md5: Optional[str] = None
+    sha256: Optional[str] = None
+
+
+@dataclass
+class MultipartTransfer:
+    """Result of a parallel multipart upload or download of an object, also a throughput measurement."""
+
+    bucket: str
+    object_key: str
+    file_path: str
+    part_size: int
+    parts: list[MultipartPart] = field(default_factory=list)
+    duration: float = 0.0
+    upload_id: Optional[str] = None
+    etag: Optional[str] = None
+
+    @property
+    def size(self) -> int:
+        return sum(part.size for part in self.parts)
+
+    @property
+    def throughput(self) -> float:
+        """Transfer rate in MiB/s."""
+        return self.size / (1024 * 1024) / self.duration if self.duration > 0 else 0.0
+
+    def summary(self) -> dict:
+        return {
+            "object": f"{self.bucket}/{self.object_key}",
+            "size": self.size,
+            "parts": len(self.parts),
+            "part_size": self.part_size,
+            "duration": round(self.duration, 3),
+            "throughput_mib_s": round(self.throughput, 2),
+        }
+
 
 @allure.step("List objects S3 v2")
 def list_objects_s3_v2(s3_client, bucket: str, full_output: bool = False) -> list:
@@ -457,6 +513,246 @@ def complete_multipart_upload_s3(s3_client, bucket_name: str, object_key: str, u
         ) from err
 
 
+@allure.step("Upload object S3 by parts in parallel")
+def upload_object_multipart_s3(
+    s3_client,
+    bucket: str,
+    file_path: str,
+    object_key: Optional[str] = None,
+    part_size: int = MULTIPART_PART_SIZE,
+    max_workers: int = MULTIPART_MAX_WORKERS,
+    complete: bool = True,
+) -> MultipartTransfer:
+    """Uploads a file as a multipart object, parts are read from file offsets and uploaded concurrently.
+
+    ETag of every part is verified against MD5 (or SHA-256, which is used by older gateways) of the part.
+    The upload is aborted if any part fails.
+
+    Args:
+        s3_client: Boto3 or AWS CLI client.
+        bucket: Name of the bucket.
+        file_path: Path to the file to upload.
+        object_key: Key of the object, the file name is used if omitted.
+        part_size: Size of every part except the last one.
+        max_workers: Number of parts uploaded concurrently.
+        complete: Whether the upload should be completed.
+
+    Returns:
+        Transfer with upload ID, parts and their ETags and throughput of the upload.
+    """
+    object_key = object_key or os.path.basename(file_path)
+    transfer = MultipartTransfer(
+        bucket, object_key, file_path, part_size, _split_to_parts(os.path.getsize(file_path), part_size)
+    )
+    transfer.upload_id = create_multipart_upload_s3(s3_client, bucket, object_key)
+
+    start = time.perf_counter()
+    try:
+        with tempfile.TemporaryDirectory(dir=get_assets_dir_path()) as parts_dir:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(_upload_part_range, s3_client, transfer, part, parts_dir) for part in transfer.parts
+                ]
+                for future in futures:
+                    future.result()
+        transfer.duration = time.perf_counter() - start
+
+        if complete:
+            parts = [{"ETag": part.etag, "PartNumber": part.number} for part in transfer.parts]
+            response = s3_client.complete_multipart_upload(
+                Bucket=bucket, Key=object_key, UploadId=transfer.upload_id, MultipartUpload={"Parts": parts}
+            )
+            log_command_execution("S3 Complete multipart upload", response)
+            transfer.etag = response.get("ETag")
+            _check_object_etag(transfer)
+    except Exception as err:
+        try:
+            s3_client.abort_multipart_upload(Bucket=bucket, Key=object_key, UploadId=transfer.upload_id)
+        except Exception as abort_err:
+            logger.warning(f"Could not abort multipart upload {transfer.upload_id}: {abort_err}")
+        if isinstance(err, ClientError):
+            raise Exception(
+                f"Error Message: {err.response['Error']['Message']}\n"
+                f"Http status code: {err.response['ResponseMetadata']['HTTPStatusCode']}"
+            ) from err
+        raise
+
+    _attach_transfer(transfer, "Multipart upload")
+    return transfer
+
+
+@allure.step("Download object S3 by ranges in parallel")
+def download_object_multipart_s3(
+    s3_client,
+    bucket: str,
+    object_key: str,
+    version_id: Optional[str] = None,
+    part_size: int = MULTIPART_PART_SIZE,
+    max_workers: int = MULTIPART_MAX_WORKERS,
+    expected: Optional[MultipartTransfer] = None,
+) -> MultipartTransfer:
+    """Downloads an object with concurrent ranged GET requests written to the file at their offsets.
+
+    Args:
+        s3_client: Boto3 or AWS CLI client.
+        bucket: Name of the bucket.
+        object_key: Key of the object.
+        version_id: Version of the object.
+        part_size: Size of every range except the last one.
+        max_workers: Number of ranges downloaded concurrently.
+        expected: Transfer the object was uploaded with, ranges are aligned with its parts and
+            SHA-256 of every range is compared to the uploaded part while it is streamed.
+
+    Returns:
+        Transfer with the path to the downloaded file and throughput of the download.
+    """
+    params = {"Bucket": bucket, "Key": object_key}
+    if version_id:
+        params["VersionId"] = version_id
+    try:
+        size = int(s3_client.head_object(**params)["ContentLength"])
+    except ClientError as err:
+        raise Exception(
+            f"Error Message: {err.response['Error']['Message']}\n"
+            f"Http status code: {err.response['ResponseMetadata']['HTTPStatusCode']}"
+        ) from err
+
+    if expected is not None:
+        assert size == expected.size, f"Expected object of {expected.size} bytes, got {size}"
+        part_size = expected.part_size
+        parts = [MultipartPart(part.number, part.offset, part.size) for part in expected.parts if part.size]
+    else:
+        parts = [part for part in _split_to_parts(size, part_size) if part.size]
+    transfer = MultipartTransfer(
+        bucket, object_key, os.path.join(get_assets_dir_path(), str(uuid.uuid4())), part_size, parts
+    )
+
+    start = time.perf_counter()
+    with open(transfer.file_path, "wb") as dst:
+        os.truncate(dst.fileno(), size)
+        try:
+            with tempfile.TemporaryDirectory(dir=get_assets_dir_path()) as parts_dir:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [
+                        executor.submit(_download_part_range, s3_client, params, dst.fileno(), part, parts_dir)
+                        for part in transfer.parts
+                    ]
+                    for future in futures:
+                        future.result()
+        except ClientError as err:
+            raise Exception(
+                f"Error Message: {err.response['Error']['Message']}\n"
+                f"Http status code: {err.response['ResponseMetadata']['HTTPStatusCode']}"
+            ) from err
+    transfer.duration = time.perf_counter() - start
+
+    if expected is not None:
+        for part, expected_part in zip(transfer.parts, [part for part in expected.parts if part.size]):
+            assert part.sha256 == expected_part.sha256, (
+                f"Range {part.offset}-{part.offset + part.size - 1} of {bucket}/{object_key} differs from uploaded part"
+            )
+
+    _attach_transfer(transfer, "Multipart download")
+    return transfer
+
+
+def _split_to_parts(size: int, part_size: int) -> list[MultipartPart]:
+    if size == 0:
+        # empty object is uploaded as a single empty part
+        return [MultipartPart(1, 0, 0)]
+    return [
+        MultipartPart(number, offset, min(part_size, size - offset))
+        for number, offset in enumerate(range(0, size, part_size), start=1)
+    ]
+
+
+def _upload_part_range(s3_client, transfer: MultipartTransfer, part: MultipartPart, parts_dir: str) -> None:
+    with open(transfer.file_path, "rb") as src:
+        if isinstance(s3_client, AwsCliClient):
+            # AWS CLI reads part body from a file, so the range is copied to a temporary one
+            body = os.path.join(parts_dir, str(part.number))
+            with open(body, "wb") as part_file:
+                copy_file_range(src, part_file, part.offset, part.size)
+            data = None
+        else:
+            body = data = os.pread(src.fileno(), part.size, part.offset)
+
+    md5, sha256 = hashlib.md5(usedforsecurity=False), hashlib.sha256()
+    if data is None:
+        with open(body, "rb") as part_file:
+            while chunk := part_file.read(MULTIPART_CHUNK_SIZE):
+                md5.update(chunk)
+                sha256.update(chunk)
+    else:
+        md5.update(data)
+        sha256.update(data)
+    part.md5, part.sha256 = md5.hexdigest(), sha256.hexdigest()
+
+    try:
+        response = s3_client.upload_part(
+            UploadId=transfer.upload_id,
+            Bucket=transfer.bucket,
+            Key=transfer.object_key,
+            PartNumber=part.number,
+            Body=body,
+        )
+    finally:
+        if data is None:
+            os.remove(body)
+    part.etag = response.get("ETag")
+    assert part.etag, f"Expected ETag in response:\n{response}"
+    if part.etag.strip('"') not in (part.md5, part.sha256):
+        raise AssertionError(
+            f"ETag {part.etag} of part {part.number} matches neither MD5 nor SHA-256 of the part: {part.md5}, {part.sha256}"
+        )
+
+
+def _check_object_etag(transfer: MultipartTransfer) -> None:
+    # S3 ETag of a multipart object is MD5 of concatenated part MD5s followed by the number of parts
+    if not transfer.etag or not all(part.etag.strip('"') == part.md5 for part in transfer.parts):
+        return
+    digest, _, parts_count = transfer.etag.strip('"').partition("-")
+    if not parts_count:
+        return
+    expected_digest = hashlib.md5(
+        b"".join(bytes.fromhex(part.md5) for part in transfer.parts), usedforsecurity=False
+    ).hexdigest()
+    assert (digest, parts_count) == (expected_digest, str(len(transfer.parts))), (
+        f"Invalid ETag of multipart object: {transfer.etag}, expected: {expected_digest}-{len(transfer.parts)}"
+    )
+
+
+def _download_part_range(s3_client, params: dict, dst_fd: int, part: MultipartPart, parts_dir: str) -> None:
+    params = {**params, "Range": f"bytes={part.offset}-{part.offset + part.size - 1}"}
+    if isinstance(s3_client, AwsCliClient):
+        part_path = os.path.join(parts_dir, str(part.number))
+        s3_client.get_object(**params, file_path=part_path)
+        body = open(part_path, "rb")
+    else:
+        part_path = None
+        body = s3_client.get_object(**params)["Body"]
+
+    sha256 = hashlib.sha256()
+    written = 0
+    try:
+        while chunk := body.read(MULTIPART_CHUNK_SIZE):
+            os.pwrite(dst_fd, chunk, part.offset + written)
+            sha256.update(chunk)
+            written += len(chunk)
+    finally:
+        body.close()
+        if part_path is not None:
+            os.remove(part_path)
+    assert written == part.size, f"Expected {part.size} bytes in range at {part.offset}, got {written}"
+    part.sha256 = sha256.hexdigest()
+
+
+def _attach_transfer(transfer: MultipartTransfer, name: str) -> None:
+    summary = transfer.summary()
+    logger.info(f"{name} of {summary['object']}: {summary['size']} bytes at {summary['throughput_mib_s']} MiB/s")
+    allure.attach(json.dumps(summary, indent=2), name, allure.attachment_type.JSON)
+
+
 @allure.step("Put object retention")
 def put_object_retention(
     s3_client,
@@ -1,12 +1,17 @@
 import logging
 import os
 import shutil
+import threading
+import time
 from pathlib import Path
+from typing import Optional
 
 import allure
 import neofs_env.neofs_epoch as neofs_epoch
 import pytest
 from helpers.common import (
+    METRICS_RECORDER_INTERVAL,
+    PPROF_DURATION_THRESHOLD,
     SIMPLE_OBJECT_SIZE,
     SN_VALIDATOR_DEFAULT_PORT,
     STORAGE_GC_TIME,
@@ -15,9 +20,12 @@ from helpers.common import (
     get_assets_dir_path,
 )
 from helpers.file_helper import generate_file
+from helpers.metrics_recorder import MetricsRecorder
 from helpers.node_management import restart_storage_nodes
+from helpers.pprof import PprofCapture
 from helpers.wallet_helpers import create_wallet
 from neofs_testlib.env.env import NeoFSEnv, NodeWallet
+from neofs_testlib.env.env_pool import NeoFSEnvPool
 from neofs_testlib.reporter import AllureHandler, get_reporter
 from neofs_testlib.shell import Shell
 
@@ -33,6 +41,42 @@ logging.getLogger("urllib3").setLevel(logging.WARNING)
 def pytest_addoption(parser):
     parser.addoption("--persist-env", action="store_true", default=False, help="persist deployed env")
     parser.addoption("--load-env", action="store", help="load persisted env from file")
+    parser.addoption(
+        "--env-pool",
+        action="store_true",
+        default=False,
+        help="pre-deploy envs for function-scoped fixtures in the background",
+    )
+    parser.addoption(
+        "--env-snapshot",
+        action="store_true",
+        default=False,
+        help="clone envs from a snapshot of the first deployed env with the same parameters",
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    # profiles are captured from the start of tests marked with `pprof`
+    # and once other tests run longer than PPROF_DURATION_THRESHOLD
+    marker = item.get_closest_marker("pprof")
+    if marker is None and PPROF_DURATION_THRESHOLD <= 0:
+        yield
+        return
+
+    nodes = [node for env in item.funcargs.values() if isinstance(env, NeoFSEnv) for node in env.storage_nodes]
+    if not nodes:
+        yield
+        return
+
+    capture = PprofCapture(nodes, **(marker.kwargs if marker else {}))
+    timer = threading.Timer(0 if marker else PPROF_DURATION_THRESHOLD, capture.start)
+    timer.daemon = True
+    timer.start()
+    yield
+    timer.cancel()
+    timer.join()
+    capture.attach()
 
 
 def get_or_create_neofs_env(
@@ -52,30 +96,55 @@ def get_or_create_neofs_env(
     replication_cooldown="10s",
     disable_post_initial_queue=False,
     object_batch_size=None,
+    neofs_env_pool: Optional[NeoFSEnvPool] = None,
 ):
     NeoFSEnv.cleanup_unused_ports()
     if request.config.getoption("--load-env"):
-        neofs_env = NeoFSEnv.load(request.config.getoption("--load-env"))
+        return NeoFSEnv.load(request.config.getoption("--load-env"))
+
+    deploy_params = dict(
+        with_main_chain=with_main_chain,
+        storage_nodes_count=storage_nodes_count,
+        inner_ring_nodes_count=inner_ring_nodes_count,
+        writecache=writecache,
+        with_s3_gw=with_s3_gw,
+        with_rest_gw=with_rest_gw,
+        chain_meta_data=chain_meta_data,
+        sn_validator_url=sn_validator_url,
+        allow_ec=allow_ec,
+        shards_count=shards_count,
+        gc_remover_batch_size=gc_remover_batch_size,
+        gc_sleep_interval=gc_sleep_interval,
+        replication_cooldown=replication_cooldown,
+        disable_post_initial_queue=disable_post_initial_queue,
+        object_batch_size=object_batch_size,
+    )
+    if neofs_env_pool:
+        return neofs_env_pool.acquire(request, **deploy_params)
+    if request.config.getoption("--env-snapshot"):
+        return NeoFSEnv.deploy_from_snapshot(request=request, **deploy_params)
+    return NeoFSEnv.deploy(request=request, **deploy_params)
+
+
+def finalize_neofs_env(request, neofs_env: NeoFSEnv, neofs_env_pool: Optional[NeoFSEnvPool] = None):
+    if neofs_env_pool:
+        neofs_env_pool.release(neofs_env, request)
     else:
-        neofs_env = NeoFSEnv.deploy(
-            with_main_chain=with_main_chain,
-            storage_nodes_count=storage_nodes_count,
-            inner_ring_nodes_count=inner_ring_nodes_count,
-            writecache=writecache,
-            with_s3_gw=with_s3_gw,
-            with_rest_gw=with_rest_gw,
-            request=request,
-            chain_meta_data=chain_meta_data,
-            sn_validator_url=sn_validator_url,
-            allow_ec=allow_ec,
-            shards_count=shards_count,
-            gc_remover_batch_size=gc_remover_batch_size,
-            gc_sleep_interval=gc_sleep_interval,
-            replication_cooldown=replication_cooldown,
-            disable_post_initial_queue=disable_post_initial_queue,
-            object_batch_size=object_batch_size,
-        )
-    return neofs_env
+        neofs_env.finalize(request)
+
+
+@pytest.fixture(scope="session")
+def neofs_env_pool(temp_directory, request) -> Optional[NeoFSEnvPool]:
+    if (
+        not request.config.getoption("--env-pool")
+        or request.config.getoption("--persist-env")
+        or request.config.getoption("--load-env")
+    ):
+        yield None
+        return
+    neofs_env_pool = NeoFSEnvPool(use_snapshot=request.config.getoption("--env-snapshot"))
+    yield neofs_env_pool
+    neofs_env_pool.close()
 
 
 @pytest.fixture(scope="session")
@@ -94,21 +163,23 @@ def neofs_env(temp_directory, artifacts_directory, request):
         disable_post_initial_queue=params.get("disable_post_initial_queue", False),
     )
     yield neofs_env
-    neofs_env.finalize(request)
+    finalize_neofs_env(request, neofs_env)
 
 
 @pytest.fixture(scope="function")
-def neofs_env_function_scope(temp_directory, artifacts_directory, request):
-    neofs_env = get_or_create_neofs_env(request, with_s3_gw=False, with_rest_gw=False)
+def neofs_env_function_scope(temp_directory, artifacts_directory, neofs_env_pool, request):
+    neofs_env = get_or_create_neofs_env(request, with_s3_gw=False, with_rest_gw=False, neofs_env_pool=neofs_env_pool)
     yield neofs_env
-    neofs_env.finalize(request)
+    finalize_neofs_env(request, neofs_env, neofs_env_pool)
 
 
 @pytest.fixture()
-def neofs_env_with_writecache(temp_directory, artifacts_directory, request):
-    neofs_env = get_or_create_neofs_env(request, writecache=True, with_s3_gw=False, with_rest_gw=False)
+def neofs_env_with_writecache(temp_directory, artifacts_directory, neofs_env_pool, request):
+    neofs_env = get_or_create_neofs_env(
+        request, writecache=True, with_s3_gw=False, with_rest_gw=False, neofs_env_pool=neofs_env_pool
+    )
     yield neofs_env
-    neofs_env.finalize(request)
+    finalize_neofs_env(request, neofs_env, neofs_env_pool)
 
 
 @pytest.fixture()
@@ -122,14 +193,16 @@ def neofs_env_slow_policer(temp_directory, artifacts_directory, request):
         object_batch_size=1,
     )
     yield neofs_env
-    neofs_env.finalize(request)
+    finalize_neofs_env(request, neofs_env)
 
 
 @pytest.fixture()
-def neofs_env_single_sn(temp_directory, artifacts_directory, request):
-    neofs_env = get_or_create_neofs_env(request, storage_nodes_count=1, with_s3_gw=True, with_rest_gw=True)
+def neofs_env_single_sn(temp_directory, artifacts_directory, neofs_env_pool, request):
+    neofs_env = get_or_create_neofs_env(
+        request, storage_nodes_count=1, with_s3_gw=True, with_rest_gw=True, neofs_env_pool=neofs_env_pool
+    )
     yield neofs_env
-    neofs_env.finalize(request)
+    finalize_neofs_env(request, neofs_env, neofs_env_pool)
 
 
 @pytest.fixture()
@@ -144,7 +217,7 @@ def neofs_env_single_sn_custom_gc(temp_directory, artifacts_directory, request):
         gc_sleep_interval=STORAGE_GC_TIME,
     )
     yield neofs_env
-    neofs_env.finalize(request)
+    finalize_neofs_env(request, neofs_env)
 
 
 @pytest.fixture()
@@ -157,14 +230,14 @@ def neofs_env_ir_only_with_sn_validator(temp_directory, artifacts_directory, req
         sn_validator_url=f"http://localhost:{SN_VALIDATOR_DEFAULT_PORT}/verify",
     )
     yield neofs_env
-    neofs_env.finalize(request)
+    finalize_neofs_env(request, neofs_env)
 
 
 @pytest.fixture()
 def neofs_env_ir_only(temp_directory, artifacts_directory, request):
     neofs_env = get_or_create_neofs_env(request, storage_nodes_count=0, with_s3_gw=False, with_rest_gw=False)
     yield neofs_env
-    neofs_env.finalize(request)
+    finalize_neofs_env(request, neofs_env)
 
 
 @pytest.fixture()
@@ -177,7 +250,7 @@ def neofs_env_4_ir(temp_directory, artifacts_directory, request):
         with_rest_gw=False,
     )
     yield neofs_env
-    neofs_env.finalize(request)
+    finalize_neofs_env(request, neofs_env)
 
 
 @pytest.fixture(scope="module")
@@ -190,7 +263,7 @@ def neofs_env_4_ir_4_sn(temp_directory, artifacts_directory, request):
         with_rest_gw=False,
     )
     yield neofs_env
-    neofs_env.finalize(request)
+    finalize_neofs_env(request, neofs_env)
 
 
 @pytest.fixture()
@@ -203,7 +276,7 @@ def neofs_env_7_ir(temp_directory, artifacts_directory, request):
         with_rest_gw=False,
     )
     yield neofs_env
-    neofs_env.finalize(request)
+    finalize_neofs_env(request, neofs_env)
 
 
 @pytest.fixture()
@@ -217,7 +290,7 @@ def neofs_env_4_ir_with_mainchain(temp_directory, artifacts_directory, request):
         with_rest_gw=False,
     )
     yield neofs_env
-    neofs_env.finalize(request)
+    finalize_neofs_env(request, neofs_env)
 
 
 @pytest.fixture()
@@ -231,7 +304,7 @@ def neofs_env_7_ir_with_mainchain(temp_directory, artifacts_directory, request):
         with_rest_gw=False,
     )
     yield neofs_env
-    neofs_env.finalize(request)
+    finalize_neofs_env(request, neofs_env)
 
 
 @pytest.fixture(scope="module")
@@ -254,7 +327,7 @@ def neofs_env_with_mainchain(temp_directory, artifacts_directory, request):
 
         neofs_epoch.tick_epoch_and_wait(neofs_env=neofs_env)
     yield neofs_env
-    neofs_env.finalize(request)
+    finalize_neofs_env(request, neofs_env)
 
 
 @pytest.fixture(scope="session")
@@ -349,7 +422,7 @@ def not_owner_wallet(temp_directory) -> NodeWallet:
 
 @pytest.fixture(scope="module")
 def file_path(artifacts_directory):
-    yield generate_file(int(SIMPLE_OBJECT_SIZE))
+    yield generate_file(int(SIMPLE_OBJECT_SIZE), seed=0)
 
 
 def create_dir(dir_path: str) -> None:
@@ -380,3 +453,26 @@ def cleanup_temp_files():
     for f in os.listdir(os.path.join(get_assets_dir_path(), TEST_FILES_DIR)):
         if f.startswith("temp_file"):
             os.remove(os.path.join(get_assets_dir_path(), TEST_FILES_DIR, f))
+
+
+@pytest.fixture(autouse=True)
+def record_metrics(request):
+    """Records metrics of envs used by the test in background and attaches their summary to the test."""
+    if METRICS_RECORDER_INTERVAL <= 0:
+        yield
+        return
+
+    envs = [
+        request.getfixturevalue(name)
+        for name in request.fixturenames
+        if name.startswith("neofs_env") and name != "neofs_env_pool"
+    ]
+    recorders = [MetricsRecorder(env, METRICS_RECORDER_INTERVAL) for env in envs if isinstance(env, NeoFSEnv)]
+    start = time.time()
+    for recorder in recorders:
+        recorder.start()
+    yield
+    for recorder in recorders:
+        recorder.stop()
+        recorder.attach_summary(start)
+        recorder.close()
@@ -178,8 +178,7 @@ class TestFailoverNodePart:
         assert all_lock_objects, "No LOCK objects found in fstree"
 
         with allure.step(f"Wait for lock expiration (tick {lock_lifetime + 1} epochs)"):
-            for _ in range(lock_lifetime + 1):
-                neofs_epoch.tick_epoch_and_wait(self.neofs_env)
+            neofs_epoch.tick_epochs_and_wait(self.neofs_env, lock_lifetime + 1)
 
         with allure.step("Delete the locked object after lock expiration"):
             delete_object(
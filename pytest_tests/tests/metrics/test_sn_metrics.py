@@ -9,7 +9,7 @@ import pytest
 from helpers.common import SIMPLE_OBJECT_SIZE
 from helpers.container import create_container, delete_container
 from helpers.file_helper import generate_file
-from helpers.metrics import get_metrics, wait_for_metric_to_arrive
+from helpers.metrics import get_metrics, wait_for_metrics_to_arrive
 from helpers.neofs_verbs import (
     delete_object,
     get_object,
@@ -213,8 +213,9 @@ def test_sn_ir_metrics(neofs_env_single_sn: NeoFSEnv, default_wallet: NodeWallet
     )
 
     fresh_epoch = neofs_epoch.ensure_fresh_epoch(neofs_env_single_sn)
-    wait_for_metric_to_arrive(sn, "neofs_node_state_epoch", float(fresh_epoch))
-    wait_for_metric_to_arrive(ir, "neofs_ir_state_epoch", float(fresh_epoch))
+    wait_for_metrics_to_arrive(
+        [(sn, "neofs_node_state_epoch", float(fresh_epoch)), (ir, "neofs_ir_state_epoch", float(fresh_epoch))]
+    )
 
     delete_object(
         default_wallet.path,
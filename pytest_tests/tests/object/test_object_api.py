@@ -456,7 +456,7 @@ class TestObjectApi(TestNeofsBase):
     @allure.title("Finished objects (with link object found) cannot be deleted")
     @pytest.mark.complex
     def test_object_parts_cannot_be_deleted(self, default_wallet: NodeWallet, container: str, request: FixtureRequest):
-        file_path = generate_file(self.neofs_env.get_object_size("complex_object_size"))
+        file_path = generate_file(self.neofs_env.get_object_size("complex_object_size"), seed=0)
         oid = put_object_to_random_node(
             default_wallet.path,
             file_path,
@@ -495,7 +495,7 @@ class TestObjectApi(TestNeofsBase):
         self, default_wallet: NodeWallet, container: str, request: FixtureRequest
     ):
         with allure.step("Upload big object"):
-            file_path = generate_file(self.neofs_env.get_object_size("complex_object_size"))
+            file_path = generate_file(self.neofs_env.get_object_size("complex_object_size"), seed=0)
             oid = put_object_to_random_node(
                 default_wallet.path,
                 file_path,
@@ -539,7 +539,7 @@ class TestObjectApi(TestNeofsBase):
             epoch = self.ensure_fresh_epoch()
 
         with allure.step("Upload big object"):
-            file_path = generate_file(self.neofs_env.get_object_size("complex_object_size"))
+            file_path = generate_file(self.neofs_env.get_object_size("complex_object_size"), seed=0)
             oid = put_object_to_random_node(
                 default_wallet.path,
                 file_path,
@@ -574,7 +574,7 @@ class TestObjectApi(TestNeofsBase):
     @pytest.mark.complex
     def test_object_can_be_get_without_link_object(self, default_wallet: NodeWallet, container: str):
         with allure.step("Upload big object"):
-            file_path = generate_file(self.neofs_env.get_object_size("complex_object_size"))
+            file_path = generate_file(self.neofs_env.get_object_size("complex_object_size"), seed=0)
             oid = put_object_to_random_node(
                 default_wallet.path,
                 file_path,
@@ -643,7 +643,7 @@ class TestObjectApi(TestNeofsBase):
         wallet = default_wallet
         cid = create_container(wallet.path, self.shell, self.neofs_env.sn_rpc, rule=container_policy)
 
-        file_path = generate_file(self.neofs_env.get_object_size(object_size))
+        file_path = generate_file(self.neofs_env.get_object_size(object_size), seed=0)
         oid = put_object(default_wallet.path, file_path, cid, self.neofs_env.shell, self.neofs_env.sn_rpc)
         head_object(default_wallet.path, cid, oid, self.neofs_env.shell, self.neofs_env.sn_rpc)
         delete_object(default_wallet.path, cid, oid, shell=self.neofs_env.shell, endpoint=self.neofs_env.sn_rpc)
@@ -667,7 +667,7 @@ class TestObjectApi(TestNeofsBase):
         wallet = default_wallet
         cid = create_container(wallet.path, self.shell, self.neofs_env.sn_rpc, rule=container_policy)
 
-        file_path = generate_file(self.neofs_env.get_object_size(object_size))
+        file_path = generate_file(self.neofs_env.get_object_size(object_size), seed=0)
         oid = put_object(default_wallet.path, file_path, cid, self.neofs_env.shell, self.neofs_env.sn_rpc)
 
         head_info = head_object(
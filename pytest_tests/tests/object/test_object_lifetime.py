@@ -48,7 +48,7 @@ class TestObjectApiLifetime(TestNeofsBase):
         endpoint = self.neofs_env.sn_rpc
         cid = create_container(wallet.path, self.shell, endpoint, rule=container_policy)
 
-        file_path = generate_file(self.neofs_env.get_object_size(object_size))
+        file_path = generate_file(self.neofs_env.get_object_size(object_size), seed=0)
         file_hash = get_file_hash(file_path)
         epoch = self.ensure_fresh_epoch()
 
@@ -98,9 +98,7 @@ def locked_storage_object(
         epoch_diff = expiration_epoch - current_epoch + 1
 
         if epoch_diff > 0:
-            with allure.step(f"Tick {epoch_diff} epochs"):
-                for _ in range(epoch_diff):
-                    neofs_epoch.tick_epoch_and_wait(neofs_env, current_epoch)
+            neofs_epoch.tick_epochs_and_wait(neofs_env, epoch_diff, current_epoch)
         try:
             delete_object(
                 storage_object.wallet_file_path,
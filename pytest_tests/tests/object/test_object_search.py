@@ -19,6 +19,7 @@ from helpers.neofs_verbs import (
     head_object,
     put_object,
     put_object_to_random_node,
+    put_objects,
     search_object,
 )
 from helpers.node_management import start_storage_nodes
@@ -115,26 +116,22 @@ def test_search_sanity(default_wallet: NodeWallet, container: str, neofs_env: Ne
 @pytest.mark.simple
 def test_search_single_filter_by_custom_int_attributes(default_wallet: NodeWallet, container: str, neofs_env: NeoFSEnv):
     cid = container
-    created_objects = []
     int_attributes_values = [-(2**255) - 1, -1, 0, 1, 10, 2**255 + 1]
     int_attribute_name = "int_attribute"
 
-    for int_value in int_attributes_values:
-        file_path = generate_file(neofs_env.get_object_size("simple_object_size"))
-
-        created_objects.append(
-            {
-                int_attribute_name: int_value,
-                "id": put_object_to_random_node(
-                    default_wallet.path,
-                    file_path,
-                    container,
-                    shell=neofs_env.shell,
-                    neofs_env=neofs_env,
-                    attributes={int_attribute_name: int_value},
-                ),
-            }
-        )
+    file_paths = [generate_file(neofs_env.get_object_size("simple_object_size")) for _ in int_attributes_values]
+    put_results = put_objects(
+        default_wallet.path,
+        file_paths,
+        container,
+        shell=neofs_env.shell,
+        neofs_env=neofs_env,
+        attributes=[{int_attribute_name: int_value} for int_value in int_attributes_values],
+    )
+    created_objects = [
+        {int_attribute_name: int_value, "id": result.value}
+        for int_value, result in zip(int_attributes_values, put_results)
+    ]
 
     operators = {"GT": operator.gt, "GE": operator.ge, "LT": operator.lt, "LE": operator.le}
 
@@ -175,7 +172,7 @@ def test_search_single_filter_by_custom_int_attributes(default_wallet: NodeWalle
     too_large_int_value = 2**257 + 1
     put_object_to_random_node(
         default_wallet.path,
-        file_path,
+        file_paths[-1],
         container,
         shell=neofs_env.shell,
         neofs_env=neofs_env,
@@ -5,8 +5,11 @@ from helpers.wallet_helpers import (
     wait_for_correct_neofs_balance,
     wait_for_correct_wallet_balance,
 )
+from neofs_testlib.blockchain import BlockWatcher
 from neofs_testlib.env.env import NeoFSEnv
 
+TX_ACCEPT_TIMEOUT = 30
+
 
 class TestDepositWithdrawal:
     def test_deposit_withdrawal(self, neofs_env_with_mainchain: NeoFSEnv):
@@ -50,7 +53,7 @@ class TestDepositWithdrawal:
             wait_for_correct_neofs_balance(neofs_env, wallet, cli_wallet_config, lambda balance: balance == 100)
 
         with allure.step("Withdraw some money back to the wallet"):
-            neo_go.contract.invokefunction(
+            result = neo_go.contract.invokefunction(
                 neofs_env.main_chain.neofs_contract_hash,
                 rpc_endpoint=f"http://{neofs_env.main_chain.rpc_address}",
                 wallet_config=neo_go_wallet_config,
@@ -59,6 +62,10 @@ class TestDepositWithdrawal:
                 multisig_hash=f"{wallet.address}:Global",
                 force=True,
             )
+            tx_hash = result.stdout.split()[-1]
+            with BlockWatcher(f"http://{neofs_env.main_chain.rpc_address}") as watcher:
+                application_log = watcher.await_transaction(tx_hash).result(timeout=TX_ACCEPT_TIMEOUT)
+            assert application_log["executions"][0]["vmstate"] == "HALT", f"Withdraw failed: {application_log}"
             wait_for_correct_neofs_balance(neofs_env, wallet, cli_wallet_config, lambda balance: balance == 50)
             wait_for_correct_wallet_balance(
                 neofs_env, neo_go, wallet, neo_go_wallet_config, lambda balance: balance > 940
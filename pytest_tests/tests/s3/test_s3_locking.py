@@ -8,6 +8,8 @@ from helpers.s3_helper import (
     assert_object_lock_mode,
     check_objects_in_bucket,
     object_key_from_file_path,
+    wait_for_object_lock,
+    wait_until_object_visible,
 )
 from s3 import s3_bucket, s3_object
 from s3.s3_base import TestNeofsS3Base
@@ -38,7 +40,7 @@ class TestS3Locking(TestNeofsS3Base):
                     self.neofs_env.get_object_size("simple_object_size"), file_path=file_path
                 )
                 version_id_2 = s3_object.put_object_s3(self.s3_client, bucket, file_name_1)
-                time.sleep(1)
+                wait_until_object_visible(self.s3_client, bucket, file_name, version_id_2)
                 check_objects_in_bucket(self.s3_client, bucket, [file_name])
                 if version_id:
                     version_id = version_id_2
@@ -50,12 +52,12 @@ class TestS3Locking(TestNeofsS3Base):
                     "RetainUntilDate": date_obj,
                 }
                 s3_object.put_object_retention(self.s3_client, bucket, file_name, retention, version_id)
-                time.sleep(1)
+                wait_for_object_lock(self.s3_client, bucket, file_name, "COMPLIANCE", "OFF", version_id)
                 assert_object_lock_mode(self.s3_client, bucket, file_name, "COMPLIANCE", date_obj, "OFF")
 
             with allure.step(f"Put legal hold to object {file_name}"):
                 s3_object.put_object_legal_hold(self.s3_client, bucket, file_name, "ON", version_id)
-                time.sleep(1)
+                wait_for_object_lock(self.s3_client, bucket, file_name, "COMPLIANCE", "ON", version_id)
                 assert_object_lock_mode(self.s3_client, bucket, file_name, "COMPLIANCE", date_obj, "ON")
 
             with allure.step("Fail with deleting object with legal hold and retention period"):
@@ -69,7 +71,6 @@ class TestS3Locking(TestNeofsS3Base):
                 assert_object_lock_mode(self.s3_client, bucket, file_name, "COMPLIANCE", date_obj, "ON")
 
             with allure.step("Fail with deleting object with legal hold and retention period"):
-                time.sleep(1)
                 if version_id:
                     with pytest.raises(Exception):
                         # An error occurred (AccessDenied) when calling the DeleteObject operation (reached max retries: 0): Access Denied.
@@ -103,7 +104,7 @@ class TestS3Locking(TestNeofsS3Base):
                     "RetainUntilDate": date_obj,
                 }
                 s3_object.put_object_retention(self.s3_client, bucket, file_name, retention, version_id)
-                time.sleep(1)
+                wait_for_object_lock(self.s3_client, bucket, file_name, "COMPLIANCE", "OFF", version_id)
                 assert_object_lock_mode(self.s3_client, bucket, file_name, "COMPLIANCE", date_obj, "OFF")
 
             with allure.step(f"Try to change retention period {retention_period_1}min to object {file_name}"):
@@ -114,7 +115,6 @@ class TestS3Locking(TestNeofsS3Base):
                 }
                 with pytest.raises(Exception):
                     s3_object.put_object_retention(self.s3_client, bucket, file_name, retention, version_id)
-                    time.sleep(1)
 
     @allure.title("Test S3: Checking the ability to change retention mode GOVERNANCE")
     @pytest.mark.simple
@@ -143,7 +143,7 @@ class TestS3Locking(TestNeofsS3Base):
                     "RetainUntilDate": date_obj,
                 }
                 s3_object.put_object_retention(self.s3_client, bucket, file_name, retention, version_id)
-                time.sleep(1)
+                wait_for_object_lock(self.s3_client, bucket, file_name, "GOVERNANCE", "OFF", version_id)
                 assert_object_lock_mode(self.s3_client, bucket, file_name, "GOVERNANCE", date_obj, "OFF")
 
             with allure.step(f"Try to change retention period {retention_period_1}min to object {file_name}"):
@@ -154,7 +154,6 @@ class TestS3Locking(TestNeofsS3Base):
                 }
                 with pytest.raises(Exception):
                     s3_object.put_object_retention(self.s3_client, bucket, file_name, retention, version_id)
-                    time.sleep(1)
 
             with allure.step(f"Try to change retention period {retention_period_1}min to object {file_name}"):
                 date_obj = datetime.now(UTC) + timedelta(minutes=retention_period_1)
@@ -164,7 +163,6 @@ class TestS3Locking(TestNeofsS3Base):
                 }
                 with pytest.raises(Exception):
                     s3_object.put_object_retention(self.s3_client, bucket, file_name, retention, version_id)
-                    time.sleep(1)
 
             with allure.step(f"Put new retention period {retention_period_2}min to object {file_name}"):
                 date_obj = datetime.now(UTC) + timedelta(minutes=retention_period_2)
@@ -56,6 +56,26 @@ class TestS3Multipart(TestNeofsS3Base):
             got_object = s3_object.get_object_s3(self.s3_client, bucket, object_key)
             assert get_file_hash(got_object) == get_file_hash(file_name_large)
 
+    @allure.title("Test S3 Object Multipart parallel upload and ranged download")
+    def test_s3_object_multipart_parallel(self):
+        bucket = s3_bucket.create_bucket_s3(self.s3_client, bucket_configuration="rep-1")
+        parts_count = 10
+        file_name_large = generate_file(PART_SIZE * parts_count + 1)
+
+        with allure.step("Upload parts in parallel"):
+            upload = s3_object.upload_object_multipart_s3(self.s3_client, bucket, file_name_large, part_size=PART_SIZE)
+            assert len(upload.parts) == parts_count + 1, f"Expected {parts_count + 1} parts, got {len(upload.parts)}"
+
+        with allure.step("Check upload list is empty"):
+            uploads = s3_object.list_multipart_uploads_s3(self.s3_client, bucket)
+            assert not uploads, f"Expected there is no uploads in bucket {bucket}"
+
+        with allure.step("Download object by ranges in parallel"):
+            download = s3_object.download_object_multipart_s3(
+                self.s3_client, bucket, upload.object_key, expected=upload
+            )
+            assert get_file_hash(download.file_path) == get_file_hash(file_name_large)
+
     def test_s3_object_multipart_non_sequential(self):
         bucket = s3_bucket.create_bucket_s3(self.s3_client, bucket_configuration="rep-1")
         set_bucket_versioning(self.s3_client, bucket, s3_bucket.VersioningStatus.ENABLED)
@@ -22,6 +22,10 @@ from helpers.s3_helper import (
     parametrize_clients,
     set_bucket_versioning,
     verify_acls,
+    wait_for_objects_in_bucket,
+    wait_for_tags,
+    wait_for_version_count,
+    wait_until_object_visible,
 )
 from helpers.wallet_helpers import create_wallet
 from s3 import s3_bucket, s3_object
@@ -94,32 +98,31 @@ class TestS3Object(TestNeofsS3Base):
 
         with allure.step("Put object into bucket"):
             s3_object.put_object_s3(self.s3_client, bucket_1, file_name_simple)
-            time.sleep(1)
             bucket_1_objects = [obj_key]
+            wait_for_objects_in_bucket(self.s3_client, bucket_1, bucket_1_objects)
             check_objects_in_bucket(self.s3_client, bucket_1, [obj_key])
 
         with allure.step("Copy one object into the same bucket"):
             copy_obj_path = s3_object.copy_object_s3(self.s3_client, bucket_1, obj_key)
-            time.sleep(1)
             bucket_1_objects.append(copy_obj_path)
+            wait_for_objects_in_bucket(self.s3_client, bucket_1, bucket_1_objects)
             check_objects_in_bucket(self.s3_client, bucket_1, bucket_1_objects)
 
         set_bucket_versioning(self.s3_client, bucket_2, s3_bucket.VersioningStatus.ENABLED)
         with allure.step("Copy object from first bucket into second"):
             copy_obj_path_b2 = s3_object.copy_object_s3(self.s3_client, bucket_1, obj_key, bucket_dst=bucket_2)
-            time.sleep(1)
+            wait_for_objects_in_bucket(self.s3_client, bucket_2, [copy_obj_path_b2])
             check_objects_in_bucket(self.s3_client, bucket_1, expected_objects=bucket_1_objects)
             check_objects_in_bucket(self.s3_client, bucket_2, expected_objects=[copy_obj_path_b2])
 
         with allure.step("Delete one object from first bucket and check object in bucket"):
             s3_object.delete_object_s3(self.s3_client, bucket_1, obj_key)
-            time.sleep(1)
             bucket_1_objects.remove(obj_key)
+            wait_for_objects_in_bucket(self.s3_client, bucket_1, bucket_1_objects, [obj_key])
             check_objects_in_bucket(self.s3_client, bucket_1, expected_objects=bucket_1_objects)
 
         with allure.step("Copy one object into the same bucket"):
             with pytest.raises(Exception):
-                time.sleep(1)
                 s3_object.copy_object_s3(self.s3_client, bucket_1, obj_key)
 
     @allure.title("Test S3: Checking copy with acl")
@@ -135,7 +138,7 @@ class TestS3Object(TestNeofsS3Base):
 
         with allure.step("Put several versions of object into bucket"):
             s3_object.put_object_s3(self.s3_client, bucket, file_name_simple)
-            time.sleep(1)
+            wait_for_objects_in_bucket(self.s3_client, bucket, [obj_key])
             check_objects_in_bucket(self.s3_client, bucket, [obj_key])
 
         with allure.step("Copy object and check acl attribute"):
@@ -156,21 +159,21 @@ class TestS3Object(TestNeofsS3Base):
 
         with allure.step("Put object into bucket"):
             s3_object.put_object_s3(self.s3_client, bucket, file_path, Metadata=object_metadata)
-            time.sleep(1)
             bucket_1_objects = [file_name]
+            wait_for_objects_in_bucket(self.s3_client, bucket, bucket_1_objects)
             check_objects_in_bucket(self.s3_client, bucket, bucket_1_objects)
 
         with allure.step("Copy one object"):
             copy_obj_path = s3_object.copy_object_s3(self.s3_client, bucket, file_name)
-            time.sleep(1)
             bucket_1_objects.append(copy_obj_path)
+            wait_for_objects_in_bucket(self.s3_client, bucket, bucket_1_objects)
             check_objects_in_bucket(self.s3_client, bucket, bucket_1_objects)
             obj_head = s3_object.head_object_s3(self.s3_client, bucket, copy_obj_path)
             assert obj_head.get("Metadata") == object_metadata, f"Metadata must be {object_metadata}"
 
         with allure.step("Copy one object with metadata"):
             copy_obj_path = s3_object.copy_object_s3(self.s3_client, bucket, file_name, metadata_directive="COPY")
-            time.sleep(1)
+            wait_until_object_visible(self.s3_client, bucket, copy_obj_path)
             bucket_1_objects.append(copy_obj_path)
             obj_head = s3_object.head_object_s3(self.s3_client, bucket, copy_obj_path)
             assert obj_head.get("Metadata") == object_metadata, f"Metadata must be {object_metadata}"
@@ -184,7 +187,7 @@ class TestS3Object(TestNeofsS3Base):
                 metadata_directive="REPLACE",
                 metadata=object_metadata_1,
             )
-            time.sleep(1)
+            wait_until_object_visible(self.s3_client, bucket, copy_obj_path)
             bucket_1_objects.append(copy_obj_path)
             obj_head = s3_object.head_object_s3(self.s3_client, bucket, copy_obj_path)
             assert obj_head.get("Metadata") == object_metadata_1, f"Metadata must be {object_metadata_1}"
@@ -201,15 +204,15 @@ class TestS3Object(TestNeofsS3Base):
 
         with allure.step("Put several versions of object into bucket"):
             s3_object.put_object_s3(self.s3_client, bucket, file_path)
-            time.sleep(1)
+            wait_until_object_visible(self.s3_client, bucket, file_name_simple)
             s3_object.put_object_tagging(self.s3_client, bucket, file_name_simple, tags=object_tagging)
-            time.sleep(1)
+            wait_for_tags(self.s3_client, bucket, file_name_simple, object_tagging)
             bucket_1_objects = [file_name_simple]
             check_objects_in_bucket(self.s3_client, bucket, bucket_1_objects)
 
         with allure.step("Copy one object without tag"):
             copy_obj_path = s3_object.copy_object_s3(self.s3_client, bucket, file_name_simple)
-            time.sleep(1)
+            wait_until_object_visible(self.s3_client, bucket, copy_obj_path)
             got_tags = s3_object.get_object_tagging(self.s3_client, bucket, copy_obj_path)
             assert got_tags, f"Expected tags, got {got_tags}"
             expected_tags = [{"Key": key, "Value": value} for key, value in object_tagging]
@@ -220,7 +223,7 @@ class TestS3Object(TestNeofsS3Base):
             copy_obj_path_1 = s3_object.copy_object_s3(
                 self.s3_client, bucket, file_name_simple, tagging_directive="COPY"
             )
-            time.sleep(1)
+            wait_until_object_visible(self.s3_client, bucket, copy_obj_path_1)
             got_tags = s3_object.get_object_tagging(self.s3_client, bucket, copy_obj_path_1)
             assert got_tags, f"Expected tags, got {got_tags}"
             expected_tags = [{"Key": key, "Value": value} for key, value in object_tagging]
@@ -238,7 +241,7 @@ class TestS3Object(TestNeofsS3Base):
                 tagging_directive="REPLACE",
                 tagging=new_tag,
             )
-            time.sleep(1)
+            wait_until_object_visible(self.s3_client, bucket, copy_obj_path)
             got_tags = s3_object.get_object_tagging(self.s3_client, bucket, copy_obj_path)
             assert got_tags, f"Expected tags, got {got_tags}"
             expected_tags = [{"Key": tag_key, "Value": str(tag_value)}]
@@ -529,8 +532,8 @@ class TestS3Object(TestNeofsS3Base):
         set_bucket_versioning(self.s3_client, bucket, s3_bucket.VersioningStatus.ENABLED)
         with allure.step("Put several versions of object into bucket"):
             s3_object.put_object_s3(self.s3_client, bucket, file_path_1)
-            time.sleep(1)
             s3_object.put_object_s3(self.s3_client, bucket, file_path_2)
+            wait_for_objects_in_bucket(self.s3_client, bucket, [file_name, file_name_2])
 
         with allure.step("Get list of object"):
             if list_type == "v1":
@@ -643,7 +646,7 @@ class TestS3Object(TestNeofsS3Base):
                 self.neofs_env.get_object_size("simple_object_size"), file_path=file_path_1
             )
             s3_object.put_object_s3(self.s3_client, bucket, file_path_2, Metadata=object_2_metadata, Tagging=tag_2)
-            time.sleep(1)
+            wait_for_tags(self.s3_client, bucket, file_name, [(tag_key_2, tag_value_2)])
             obj_head = s3_object.head_object_s3(self.s3_client, bucket, file_name)
             assert obj_head.get("Metadata") == object_2_metadata, "Matadata must be the same"
             got_tags_1 = s3_object.get_object_tagging(self.s3_client, bucket, file_name)
@@ -676,7 +679,7 @@ class TestS3Object(TestNeofsS3Base):
                 self.neofs_env.get_object_size("simple_object_size"), file_path=file_path_3
             )
             version_id_2 = s3_object.put_object_s3(self.s3_client, bucket, file_path_4)
-            time.sleep(1)
+            wait_for_version_count(self.s3_client, bucket, file_name_3, 2)
             versions = s3_object.list_objects_versions_s3(self.s3_client, bucket)
             obj_versions = {version.get("VersionId") for version in versions if version.get("Key") == file_name_3}
             assert obj_versions == {
@@ -770,7 +773,6 @@ class TestS3Object(TestNeofsS3Base):
             ):
                 # x-amz-object-lock-retain-until-date and x-amz-object-lock-mode must both be supplied
                 s3_object.put_object_s3(self.s3_client, bucket, file_path_1, ObjectLockMode="COMPLIANCE")
-                time.sleep(1)
 
         with allure.step("Put object with lock-mode and past date"):
             date_obj = datetime.now(UTC) - timedelta(days=3)
@@ -857,7 +859,7 @@ class TestS3Object(TestNeofsS3Base):
             file_name = self.object_key_from_file_path(file_path)
 
             s3_object.put_object_s3(self.s3_client, bucket, file_path)
-            time.sleep(1)
+            wait_until_object_visible(self.s3_client, bucket, file_name)
             got_object = s3_object.get_object_s3(self.s3_client, bucket, file_name)
             assert get_file_hash(got_object) == get_file_hash(file_path), "Expected hashes are the same"
         finally:
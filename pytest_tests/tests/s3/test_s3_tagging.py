@@ -11,6 +11,7 @@ from helpers.s3_helper import (
     check_tags_by_bucket,
     check_tags_by_object,
     object_key_from_file_path,
+    wait_for_tags,
 )
 from s3 import s3_bucket, s3_object
 from s3.s3_base import TestNeofsS3Base
@@ -40,7 +41,7 @@ class TestS3Tagging(TestNeofsS3Base):
         with allure.step("Put with 3 tags object into bucket"):
             tag_1 = "Tag1=Value1"
             s3_object.put_object_s3(self.s3_client, bucket, file_path, Tagging=tag_1)
-            time.sleep(1)
+            wait_for_tags(self.s3_client, bucket, file_name, [("Tag1", "Value1")])
             got_tags = s3_object.get_object_tagging(self.s3_client, bucket, file_name)
             assert got_tags, f"Expected tags, got {got_tags}"
             assert got_tags == [{"Key": "Tag1", "Value": "Value1"}], "Tags must be the same"
@@ -48,18 +49,18 @@ class TestS3Tagging(TestNeofsS3Base):
         with allure.step("Put 10 new tags for object"):
             tags_2 = self.create_tags(10)
             s3_object.put_object_tagging(self.s3_client, bucket, file_name, tags=tags_2)
-            time.sleep(1)
+            wait_for_tags(self.s3_client, bucket, file_name, tags_2)
             check_tags_by_object(self.s3_client, bucket, file_name, tags_2, [("Tag1", "Value1")])
 
         with allure.step("Put 10 extra new tags for object"):
             tags_3 = self.create_tags(10)
             s3_object.put_object_tagging(self.s3_client, bucket, file_name, tags=tags_3)
-            time.sleep(1)
+            wait_for_tags(self.s3_client, bucket, file_name, tags_3)
             check_tags_by_object(self.s3_client, bucket, file_name, tags_3, tags_2)
 
         with allure.step("Copy one object with tag"):
             copy_obj_path_1 = s3_object.copy_object_s3(self.s3_client, bucket, file_name, tagging_directive="COPY")
-            time.sleep(1)
+            wait_for_tags(self.s3_client, bucket, copy_obj_path_1, tags_3)
             check_tags_by_object(self.s3_client, bucket, copy_obj_path_1, tags_3, tags_2)
 
         with allure.step("Put 11 new tags to object and expect an error"):
@@ -71,18 +72,18 @@ class TestS3Tagging(TestNeofsS3Base):
         with allure.step("Put empty tag"):
             tags_5 = []
             s3_object.put_object_tagging(self.s3_client, bucket, file_name, tags=tags_5)
-            time.sleep(1)
+            wait_for_tags(self.s3_client, bucket, file_name, tags_5)
             check_tags_by_object(self.s3_client, bucket, file_name, [])
 
         with allure.step("Put 10 object tags"):
             tags_6 = self.create_tags(10)
             s3_object.put_object_tagging(self.s3_client, bucket, file_name, tags=tags_6)
-            time.sleep(1)
+            wait_for_tags(self.s3_client, bucket, file_name, tags_6)
             check_tags_by_object(self.s3_client, bucket, file_name, tags_6)
 
         with allure.step("Delete tags by delete-object-tagging"):
             s3_object.delete_object_tagging(self.s3_client, bucket, file_name)
-            time.sleep(1)
+            wait_for_tags(self.s3_client, bucket, file_name, [])
             check_tags_by_object(self.s3_client, bucket, file_name, [])
 
     @allure.title("Test S3: bucket tagging")
@@ -90,13 +91,13 @@ class TestS3Tagging(TestNeofsS3Base):
         with allure.step("Put 10 bucket tags"):
             tags_1 = self.create_tags(10)
             s3_bucket.put_bucket_tagging(self.s3_client, bucket, tags_1)
-            time.sleep(1)
+            wait_for_tags(self.s3_client, bucket, None, tags_1)
             check_tags_by_bucket(self.s3_client, bucket, tags_1)
 
         with allure.step("Put new 10 bucket tags"):
             tags_2 = self.create_tags(10)
             s3_bucket.put_bucket_tagging(self.s3_client, bucket, tags_2)
-            time.sleep(1)
+            wait_for_tags(self.s3_client, bucket, None, tags_2)
             check_tags_by_bucket(self.s3_client, bucket, tags_2, tags_1)
 
         with allure.step("Put 11 new tags to bucket and expect an error"):
@@ -104,18 +105,17 @@ class TestS3Tagging(TestNeofsS3Base):
             with pytest.raises(Exception, match=r".*Object tags cannot be greater than 10.*"):
                 # An error occurred (BadRequest) when calling the PutBucketTagging operation (reached max retries: 0): Object tags cannot be greater than 10
                 s3_bucket.put_bucket_tagging(self.s3_client, bucket, tags_3)
-                time.sleep(1)
 
         with allure.step("Put empty tag"):
             tags_4 = []
             s3_bucket.put_bucket_tagging(self.s3_client, bucket, tags_4)
-            time.sleep(1)
+            wait_for_tags(self.s3_client, bucket, None, tags_4)
             check_tags_by_bucket(self.s3_client, bucket, tags_4)
 
         with allure.step("Put new 10 bucket tags"):
             tags_5 = self.create_tags(10)
             s3_bucket.put_bucket_tagging(self.s3_client, bucket, tags_5)
-            time.sleep(1)
+            wait_for_tags(self.s3_client, bucket, None, tags_5)
             check_tags_by_bucket(self.s3_client, bucket, tags_5, tags_2)
 
         with allure.step("Delete tags by delete-bucket-tagging"):
@@ -136,5 +136,5 @@ class TestS3Tagging(TestNeofsS3Base):
             s3_object.put_object_tagging(self.s3_client, bucket, file_name, tags=tags)
             check_tags_by_object(self.s3_client, bucket, file_name, tags)
             s3_object.put_object_s3(self.s3_client, bucket, file_path)
-            time.sleep(1)
+            wait_for_tags(self.s3_client, bucket, file_name, [])
             check_tags_by_object(self.s3_client, bucket, file_name, [])
@@ -7,16 +7,18 @@ import allure
 import neofs_env.neofs_epoch as neofs_epoch
 import pytest
 from helpers.container import create_container, delete_container, list_containers, wait_for_container_deletion
-from helpers.file_helper import generate_file, generate_file_with_content
+from helpers.file_helper import generate_file, generate_file_with_content, get_file_hash
 from helpers.neofs_verbs import put_object_to_random_node
 from helpers.rest_gate import (
     attr_into_header,
     get_epoch_duration_via_rest_gate,
     get_object_by_attr_and_verify_hashes,
     get_via_rest_gate,
+    get_via_rest_gate_batch,
     head_object_by_attr_and_verify,
     try_to_get_object_and_expect_error,
     upload_via_rest_gate,
+    upload_via_rest_gate_batch,
 )
 from helpers.utility import wait_for_gc_pass_on_storage_nodes
 from helpers.wellknown_acl import PUBLIC_ACL
@@ -92,7 +94,7 @@ class TestRestGate(TestNeofsRestBase):
         )
         file_path_simple, file_path_large = (
             generate_file(self.neofs_env.get_object_size("simple_object_size")),
-            generate_file(self.neofs_env.get_object_size("complex_object_size")),
+            generate_file(self.neofs_env.get_object_size("complex_object_size"), seed=0),
         )
 
         with allure.step("Put objects using gRPC"):
@@ -334,12 +336,18 @@ class TestRestGate(TestNeofsRestBase):
         )
         file_path_simple, file_path_large = (
             generate_file(self.neofs_env.get_object_size("simple_object_size")),
-            generate_file(self.neofs_env.get_object_size("complex_object_size")),
+            generate_file(self.neofs_env.get_object_size("complex_object_size"), seed=0),
         )
 
         with allure.step("Put objects using REST"):
-            oid_simple = upload_via_rest_gate(cid=cid, path=file_path_simple, endpoint=gw_params["endpoint"])
-            oid_large = upload_via_rest_gate(cid=cid, path=file_path_large, endpoint=gw_params["endpoint"])
+            oid_simple, oid_large = upload_via_rest_gate_batch(
+                cid=cid, paths=[file_path_simple, file_path_large], endpoint=gw_params["endpoint"]
+            )
+
+        with allure.step("Get objects using REST concurrently"):
+            downloads = get_via_rest_gate_batch(cid=cid, oids=[oid_simple, oid_large], endpoint=gw_params["endpoint"])
+            for download, file_path in zip(downloads, (file_path_simple, file_path_large)):
+                assert download.sha256 == get_file_hash(file_path), f"Invalid hash of object {download.oid}"
 
         for oid, file_path in ((oid_simple, file_path_simple), (oid_large, file_path_large)):
             get_object_and_verify_hashes(
@@ -790,7 +798,7 @@ class TestRestGate(TestNeofsRestBase):
                 basic_acl=PUBLIC_ACL,
             )
 
-        file_path = generate_file(self.neofs_env.get_object_size(object_size))
+        file_path = generate_file(self.neofs_env.get_object_size(object_size), seed=0)
 
         obj_key1 = gw_attributes["obj_key1"]
         obj_value1 = gw_attributes["obj_value1"]
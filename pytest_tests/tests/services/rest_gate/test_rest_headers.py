@@ -216,7 +216,7 @@ class Test_rest_object_type(TestNeofsRestBase):
         4. HEAD the object by attribute and verify X-Object-Type == REGULAR.
         """
         attributes = {"FileName": "regular_object"}
-        file_path = generate_file(self.neofs_env.get_object_size(object_size))
+        file_path = generate_file(self.neofs_env.get_object_size(object_size), seed=0)
 
         with allure.step("Upload object via REST gate"):
             oid = upload_via_rest_gate(
@@ -326,7 +326,7 @@ class Test_rest_object_type(TestNeofsRestBase):
         2. Resolve the link object id of the complex object.
         3. HEAD the link object by id and verify X-Object-Type == LINK.
         """
-        file_path = generate_file(self.neofs_env.get_object_size("complex_object_size"))
+        file_path = generate_file(self.neofs_env.get_object_size("complex_object_size"), seed=0)
 
         with allure.step("Upload complex object and resolve its link object"):
             oid = put_object_to_random_node(
@@ -401,7 +401,7 @@ class Test_rest_encoded_attributes(TestNeofsRestBase):
             "Mixed": "a$b-Ünïcödé",
             non_ascii_key: non_ascii_key_value,
         }
-        file_path = generate_file(self.neofs_env.get_object_size(object_size))
+        file_path = generate_file(self.neofs_env.get_object_size(object_size), seed=0)
 
         with allure.step("Upload object with non-ASCII keys and values via X-Attributes-Base64 header"):
             oid = upload_via_rest_gate(
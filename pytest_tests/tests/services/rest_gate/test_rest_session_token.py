@@ -106,7 +106,7 @@ class TestRestSessionTokenV2(TestNeofsRestBase):
             )
 
         with allure.step("Upload objects with session token"):
-            file_path = generate_file(self.neofs_env.get_object_size(object_size))
+            file_path = generate_file(self.neofs_env.get_object_size(object_size), seed=0)
             oid = upload_via_rest_gate(cid, file_path, gw_endpoint, session_token=session_token)
             assert oid, "Object ID should be returned"
 
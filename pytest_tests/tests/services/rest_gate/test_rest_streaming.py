@@ -52,7 +52,7 @@ class Test_rest_streaming(TestNeofsRestBase):
             )
         with allure.step("Allocate big object"):
             # Generate file
-            file_path = generate_file(self.neofs_env.get_object_size(object_size))
+            file_path = generate_file(self.neofs_env.get_object_size(object_size), seed=0)
 
         with allure.step("Put objects and Get object and verify hashes [ get/$CID/$OID ]"):
             # https://docs.python-requests.org/en/latest/user/advanced/#streaming-uploads
@@ -72,7 +72,7 @@ class TestDynamicObjectSession(TestNeofsBase):
             )
 
         with allure.step("Put Objects"):
-            file_path = generate_file(self.neofs_env.get_object_size(object_size))
+            file_path = generate_file(self.neofs_env.get_object_size(object_size), seed=0)
             oid = put_object_to_random_node(
                 wallet=wallet.path,
                 path=file_path,
@@ -136,7 +136,7 @@ class TestSessionTokenV2(TestNeofsBase):
             )
 
         with allure.step("Put initial object"):
-            file_path = generate_file(self.neofs_env.get_object_size(object_size))
+            file_path = generate_file(self.neofs_env.get_object_size(object_size), seed=0)
             oid = put_object_to_random_node(
                 wallet=owner_wallet.path,
                 path=file_path,